@@ -1,10 +1,67 @@
+// Apply JSON Patch (RFC 6902) add/remove/replace operations in place
+function applyPatch(doc, ops) {
+  for (const op of ops) {
+    const keys = op.path.split('/').slice(1).map(k => k.replace(/~1/g, '/').replace(/~0/g, '~'));
+    if (!keys.length) { doc = op.value; continue; }
+    const last = keys.pop();
+    const parent = keys.reduce((node, key) => node[key], doc);
+    if (Array.isArray(parent)) {
+      const index = last === '-' ? parent.length : Number(last);
+      if (op.op === 'add') parent.splice(index, 0, op.value);
+      else if (op.op === 'remove') parent.splice(index, 1);
+      else parent[index] = op.value;
+    } else if (op.op === 'remove') {
+      delete parent[last];
+    } else {
+      parent[last] = op.value;
+    }
+  }
+  return doc;
+}
+
+// Load a data file, keeping a versioned copy in localStorage so a returning
+// visit only downloads the delta from assets/versions/ (see tools/data_versions.py)
+function loadData(path) {
+  const name = path.split('/').pop().replace(/\.json$/, '');
+  const base = `assets/versions/${name}/`;
+  const key = `data:${name}`;
+  const fetchJson = (url, options) => fetch(url, options).then(r => r.ok ? r.json() : Promise.reject('no json'));
+  const keep = (version, data) => {
+    try { localStorage.setItem(key, JSON.stringify({ version, data })); } catch (e) { /* storage full or disabled */ }
+    return data;
+  };
+  // A payload is stored as a version only if it hashes like payload_hash() in data_versions.py,
+  // so a stale copy (from the service worker or a CDN) never becomes the base for later deltas
+  const matches = (current, data) => (self.crypto && crypto.subtle
+    ? crypto.subtle.digest('SHA-256', new TextEncoder().encode(JSON.stringify(data)))
+        .then(hash => Array.from(new Uint8Array(hash), b => b.toString(16).padStart(2, '0')).join('').slice(0, 16) === current.hash)
+    : Promise.resolve(false)).catch(() => false);
+  let cached = null;
+  try { cached = JSON.parse(localStorage.getItem(key)); } catch (e) { /* no usable copy */ }
+
+  return fetch(base + 'version.json', { cache: 'no-cache' })
+    .then(r => r.ok ? r.json() : Promise.reject('no version'))
+    .then(current => {
+      // Version-keyed URL: the service worker sends these to the network instead of its stale-while-revalidate copy
+      const full = () => fetchJson(`${path}?v=${current.version}`, { cache: 'no-cache' })
+        .then(data => matches(current, data).then(ok => ok ? keep(current.version, data) : data));
+      if (cached && cached.version === current.version) return cached.data;
+      if (cached && (current.deltas || []).includes(cached.version)) {
+        return fetchJson(`${base}${cached.version}-${current.version}.json`)
+          .then(ops => applyPatch(cached.data, ops))
+          .then(data => matches(current, data).then(ok => ok ? keep(current.version, data) : Promise.reject('delta mismatch')))
+          .catch(full);
+      }
+      return full();
+    }, () => fetchJson(path));
+}
+
 // Load and render Medium posts
 function renderMediumPosts(targetId='medium-posts') {
   const container = document.getElementById(targetId);
   if (!container) return;
 
-  fetch('assets/medium_posts.json')
-    .then(r => r.ok ? r.json() : Promise.reject('no json'))
+  loadData('assets/medium_posts.json')
     .then(data => {
       const posts = data.posts || [];
       if (!posts.length) {
@@ -12,8 +69,19 @@ function renderMediumPosts(targetId='medium-posts') {
         return;
       }
 
-      container.innerHTML = posts.map(p => `
+      container.innerHTML = mediumPostCards(posts);
+    })
+    .catch(err => {
+      console.warn('medium posts load failed', err);
+      container.innerHTML = '<div class="card" style="text-align:center;padding:40px"><div class="small" style="color:var(--muted)">Unable to load Medium posts.</div></div>';
+    });
+}
+
+// Render a list of Medium posts as cards
+function mediumPostCards(posts) {
+  return posts.map(p => `
         <a href="${p.link}" target="_blank" rel="noopener" class="card" style="display:block;text-decoration:none;transition:all 0.3s">
+          ${p.cover ? `<img src="${p.cover.src}"${p.cover.srcset ? ` srcset="${p.cover.srcset}" sizes="(max-width: 700px) 100vw, 320px"` : ''}${p.cover.width ? ` width="${p.cover.width}" height="${p.cover.height}"` : ''} alt="" loading="lazy" decoding="async" style="width:100%;height:auto;border-radius:8px;margin-bottom:12px;display:block">` : ''}
           <div style="margin-bottom:12px">
             <strong style="color:#e6eef8;font-size:1.05rem;line-height:1.4;display:block">${p.title}</strong>
           </div>
@@ -24,13 +92,56 @@ function renderMediumPosts(targetId='medium-posts') {
           </div>
         </a>
       `).join('');
+}
+
+// Load the Medium archive page by page (newest page first)
+function renderMediumArchive(targetId='medium-archive', buttonId='medium-archive-more') {
+  const container = document.getElementById(targetId);
+  const button = document.getElementById(buttonId);
+  if (!container) return;
+
+  loadData('assets/medium_posts.json')
+    .then(data => {
+      const archive = data.archive || { pages: 0 };
+      let nextPage = archive.pages;
+
+      const loadPage = () => {
+        if (nextPage < 1) return Promise.resolve();
+        const page = String(nextPage).padStart(4, '0');
+        nextPage -= 1;
+        return fetch(`assets/medium/page-${page}.json`)
+          .then(r => r.ok ? r.json() : Promise.reject('no json'))
+          .then(pageData => {
+            const posts = (pageData.posts || []).slice().reverse();
+            container.insertAdjacentHTML('beforeend', mediumPostCards(posts));
+            if (button) button.style.display = nextPage > 0 ? '' : 'none';
+          });
+      };
+
+      if (!archive.pages) {
+        container.innerHTML = '<div class="card" style="text-align:center;padding:40px"><div class="small" style="color:var(--muted)">No archived posts yet.</div></div>';
+        if (button) button.style.display = 'none';
+        return;
+      }
+
+      container.innerHTML = '';
+      if (button) button.addEventListener('click', () => loadPage().catch(err => console.warn('medium archive page load failed', err)));
+      return loadPage();
     })
     .catch(err => {
-      console.warn('medium posts load failed', err);
-      container.innerHTML = '<div class="card" style="text-align:center;padding:40px"><div class="small" style="color:var(--muted)">Unable to load Medium posts.</div></div>';
+      console.warn('medium archive load failed', err);
+      container.innerHTML = '<div class="card" style="text-align:center;padding:40px"><div class="small" style="color:var(--muted)">Unable to load the article archive.</div></div>';
+      if (button) button.style.display = 'none';
     });
 }
 
+// First-page preview from render_thumbnails.py; the PDF is only fetched on click
+function certThumbnail(cert) {
+  if (!cert.thumbnail) return '<div style="font-size:2rem;opacity:0.6;flex-shrink:0">📄</div>';
+  return `<img src="${cert.thumbnail}" alt="" width="${cert.thumbnail_width}" height="${cert.thumbnail_height}"
+                loading="lazy" decoding="async" style="width:96px;height:auto;border-radius:4px;flex-shrink:0;background:#fff">`;
+}
+
 // Load and render certificates
 function renderCertificates() {
   const summaryContainer = document.getElementById('certificates-summary');
@@ -38,8 +149,7 @@ function renderCertificates() {
 
   if (!summaryContainer || !listContainer) return;
 
-  fetch('assets/certificates.json')
-    .then(r => r.ok ? r.json() : Promise.reject('no json'))
+  loadData('assets/certificates.json')
     .then(data => {
       // Render category summary cards
       const categories = data.categories || {};
@@ -65,7 +175,7 @@ function renderCertificates() {
             ${cat.certificates.map(cert => `
               <a href="${cert.path}" target="_blank" class="card" style="display:block;text-decoration:none;padding:20px;transition:all 0.3s">
                 <div style="display:flex;align-items:flex-start;gap:12px">
-                  <div style="font-size:2rem;opacity:0.6;flex-shrink:0">📄</div>
+                  ${certThumbnail(cert)}
                   <div style="flex:1;min-width:0">
                     <div style="font-weight:600;font-size:1.05rem;color:#e6eef8;margin-bottom:8px;line-height:1.4;word-wrap:break-word">${cert.title}</div>
                     <div class="small" style="color:var(--accent);font-weight:600">${cert.provider}</div>
@@ -105,8 +215,7 @@ function renderCertificatesSummary() {
   const container = document.getElementById('certificates-summary-home');
   if (!container) return;
 
-  fetch('assets/certificates.json')
-    .then(r => r.ok ? r.json() : Promise.reject('no json'))
+  loadData('assets/certificates.json')
     .then(data => {
       const categories = data.categories || {};
       const grid = container.querySelector('.grid');
@@ -124,6 +233,18 @@ function renderCertificatesSummary() {
     });
 }
 
+// <source> tags for the responsive variants of a badge image
+function badgeSources(cert) {
+  return (cert.badge_sources || []).map(s => `<source type="${s.type}" srcset="${s.srcset}">`).join('');
+}
+
+// Intrinsic size and placeholder color so badge cards don't shift while loading
+function badgeSizeAttrs(cert) {
+  const size = cert.width ? `width="${cert.width}" height="${cert.height}"` : '';
+  const placeholder = cert.placeholder ? `style="background:${cert.placeholder};border-radius:8px"` : '';
+  return `${size} ${placeholder}`;
+}
+
 // Load and render badge certifications
 function renderBadgeCertifications() {
   const certsGrid = document.getElementById('credentials-certificates-grid');
@@ -132,8 +253,7 @@ function renderBadgeCertifications() {
   // If containers don't exist, exit early
   if (!certsGrid && !badgesGrid) return;
 
-  fetch('assets/badge_certifications.json')
-    .then(r => r.ok ? r.json() : Promise.reject('no json'))
+  loadData('assets/badge_certifications.json')
     .then(data => {
       const categories = data.categories || {};
 
@@ -165,14 +285,17 @@ function renderBadgeCertifications() {
         
         return certs.map(cert => {
           const hasVerification = cert.verification_url && !cert.verification_url.includes('YOUR-');
-          const expiryWarning = cert.expiry_date && new Date(cert.expiry_date) < new Date() ?
-            '<div class="small" style="color:#EF4444;margin-top:4px">⚠️ Expired</div>' : '';
+          // `expired` is set by the generator at 00:00 UTC; the date check covers a stale JSON file
+          const expired = cert.expired || (cert.expiry_date && new Date(cert.expiry_date) <= new Date());
+          const expiryWarning = expired ?
+            '<div class="small badge-expired-label">⚠️ Expired</div>' : '';
 
           const content = `
-            <div class="badge">
-              <img src="${cert.badge_path}"
+            <div class="badge${expired ? ' badge-expired' : ''}">
+              <picture>${badgeSources(cert)}<img src="${cert.badge_path}"
                    alt="${cert.title}"
-                   onerror="this.src='${cert.fallback_svg}'">
+                   ${badgeSizeAttrs(cert)}
+                   onerror="this.parentNode.querySelectorAll('source').forEach(s => s.remove()); this.src='${cert.fallback_svg}'"></picture>
               <div class="issuer" style="margin-top:8px">
                 <strong style="display:block;margin-bottom:4px;color:#e6eef8">${cert.title}</strong>
                 <span style="color:var(--muted)">${cert.provider}</span>
@@ -208,8 +331,7 @@ function renderBadgeCertificationsSummary() {
   const container = document.getElementById('badge-certifications-summary-home');
   if (!container) return;
 
-  fetch('assets/badge_certifications.json')
-    .then(r => r.ok ? r.json() : Promise.reject('no json'))
+  loadData('assets/badge_certifications.json')
     .then(data => {
       const categories = data.categories || {};
 
@@ -235,10 +357,11 @@ function renderBadgeCertificationsSummary() {
             <div style="width:100%; aspect-ratio:1; background:rgba(255,255,255,0.95); border-radius:6px; padding:6px; border:1px solid rgba(96,165,250,0.3); transition:all 0.3s; overflow:hidden;"
                  onmouseover="this.style.borderColor='#60a5fa'; this.style.transform='translateY(-2px)'"
                  onmouseout="this.style.borderColor='rgba(96,165,250,0.3)'; this.style.transform='translateY(0)'">
-              <img src="${cert.badge_path}"
+              <picture>${badgeSources(cert)}<img src="${cert.badge_path}"
                    alt="${cert.title}"
-                   onerror="this.src='${cert.fallback_svg}'"
-                   style="width:100%; height:100%; object-fit:contain;">
+                   ${cert.width ? `width="${cert.width}" height="${cert.height}"` : ''}
+                   onerror="this.parentNode.querySelectorAll('source').forEach(s => s.remove()); this.src='${cert.fallback_svg}'"
+                   style="width:100%; height:100%; object-fit:contain;"></picture>
             </div>
           </div>
         </a>
@@ -257,6 +380,35 @@ function renderBadgeCertificationsSummary() {
 }
 
 // Mobile navigation handler
+// Replace data-fragment placeholders with their prerendered HTML as they near the viewport
+function loadFragments() {
+  const placeholders = document.querySelectorAll('[data-fragment]');
+  if (!placeholders.length) return;
+
+  // A fragment can end with the placeholder for the next one (the experience
+  // card batches), which is then watched like the placeholders in the page
+  const watch = el => observer ? observer.observe(el) : load(el);
+  const load = el => {
+    if (observer) observer.unobserve(el);
+    fetch(el.dataset.fragment)
+      .then(r => r.ok ? r.text() : Promise.reject('no fragment'))
+      .then(html => {
+        const fragment = document.createRange().createContextualFragment(html);
+        const nested = fragment.querySelectorAll('[data-fragment]');
+        el.replaceWith(fragment);
+        nested.forEach(watch);
+      })
+      .catch(() => { el.style.minHeight = ''; });
+  };
+
+  const observer = 'IntersectionObserver' in window && new IntersectionObserver(entries => {
+    entries.forEach(entry => {
+      if (entry.isIntersecting) load(entry.target);
+    });
+  }, {rootMargin: '800px 0px'});
+  placeholders.forEach(watch);
+}
+
 document.addEventListener('DOMContentLoaded', function() {
   const mobileNav = document.getElementById('mobile-nav');
   if (mobileNav) {
@@ -267,9 +419,15 @@ document.addEventListener('DOMContentLoaded', function() {
     });
   }
 
+  // Load deferred page sections (progressive experience page)
+  loadFragments();
+
   // Automatically render Medium posts if container exists
   renderMediumPosts();
 
+  // Render the paginated Medium archive on the Social page
+  renderMediumArchive();
+
   // Automatically render certificates if container exists
   renderCertificates();
 
@@ -282,3 +440,11 @@ document.addEventListener('DOMContentLoaded', function() {
   // Render badge certifications summary on homepage
   renderBadgeCertificationsSummary();
 });
+
+// Serve repeat visits from the cache (sw.js is generated by tools/build_service_worker.py).
+// Registered after load so installing the precache never competes with the first visit.
+if ('serviceWorker' in navigator) {
+  window.addEventListener('load', function() {
+    navigator.serviceWorker.register('sw.js').catch(function() {});
+  });
+}
@@ -5,7 +5,8 @@ Interactive tool to add a new badge certification to badge_certifications.yaml
 
 import yaml
 from pathlib import Path
-from datetime import datetime
+
+from models import BadgeCertification
 
 def get_input(prompt, default='', required=True):
     """Get user input with optional default"""
@@ -23,18 +24,17 @@ def get_input(prompt, default='', required=True):
 
     return value
 
-def get_date_input(prompt, required=False):
-    """Get date input in YYYY-MM-DD format"""
+def get_date_input(prompt, field, required=False):
+    """Get date input in YYYY-MM-DD format, checked by the BadgeCertification model"""
     while True:
         value = get_input(prompt + " (YYYY-MM-DD)", '', required)
         if not value:
             return ''
 
-        try:
-            datetime.strptime(value, '%Y-%m-%d')
+        error = BadgeCertification.check(field, value)
+        if not error:
             return value
-        except ValueError:
-            print("❌ Invalid date format. Please use YYYY-MM-DD")
+        print(f"❌ {error}")
 
 def main():
     script_dir = Path(__file__).parent
@@ -70,11 +70,17 @@ def main():
         cert['badge_image'] += '.png'
 
     cert['verification_url'] = get_input("Verification URL", required=False)
-    cert['issue_date'] = get_date_input("Issue Date", required=False)
-    cert['expiry_date'] = get_date_input("Expiry Date", required=False)
+    cert['issue_date'] = get_date_input("Issue Date", 'issue_date', required=False)
+    cert['expiry_date'] = get_date_input("Expiry Date", 'expiry_date', required=False)
     cert['credential_id'] = get_input("Credential ID", required=False)
     cert['description'] = get_input("Description", required=False)
 
+    _, errors = BadgeCertification.parse(cert)
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        return 1
+
     # Add to config
     if 'certifications' not in config:
         config['certifications'] = []
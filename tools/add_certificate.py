@@ -7,7 +7,8 @@ Makes it easy to add certificates without manually editing YAML
 import os
 import yaml
 from pathlib import Path
-from datetime import datetime
+
+from models import Certificate
 
 CATEGORIES = {
     '1': ('Cloud', 'Cloud Services - AWS, GCP, Azure'),
@@ -47,16 +48,6 @@ def get_input(prompt, required=True, default=''):
             return default
         print("❌ This field is required. Please enter a value.")
 
-def validate_date(date_str):
-    """Validate date format"""
-    if not date_str:
-        return True
-    try:
-        datetime.strptime(date_str, '%Y-%m-%d')
-        return True
-    except ValueError:
-        return False
-
 def main():
     # Get paths
     script_dir = Path(__file__).parent
@@ -97,24 +88,27 @@ def main():
     # Optional fields
     while True:
         completion_date = input("Completion Date (YYYY-MM-DD, or press Enter to skip): ").strip()
-        if validate_date(completion_date):
+        error = Certificate.check('completion_date', completion_date)
+        if not error:
             break
-        print("❌ Invalid date format. Use YYYY-MM-DD (e.g., 2025-12-31)")
+        print(f"❌ {error} (e.g., 2025-12-31)")
 
     verification_url = input("Verification URL (or press Enter to skip): ").strip()
 
-    # Create certificate entry
-    cert_entry = {
+    # Create certificate entry (empty optional fields are left out)
+    certificate, errors = Certificate.parse({
         'title': title,
         'provider': provider,
         'category': category,
         'filename': filename,
-    }
-
-    if completion_date:
-        cert_entry['completion_date'] = completion_date
-    if verification_url:
-        cert_entry['verification_url'] = verification_url
+        'completion_date': completion_date,
+        'verification_url': verification_url,
+    })
+    if errors:
+        for error in errors:
+            print(f"❌ {error}")
+        return 1
+    cert_entry = certificate.to_dict()
 
     # Add to config
     if 'certificates' not in config:
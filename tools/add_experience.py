@@ -8,6 +8,8 @@ import yaml
 from pathlib import Path
 from datetime import datetime
 
+from models import Experience
+
 
 def load_experience_config():
     """Load current experience configuration"""
@@ -25,6 +27,19 @@ def save_experience_config(config, config_path):
         yaml.dump(config, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
 
 
+def regenerate_page():
+    """Rebuild experience.html from the saved YAML
+
+    Goes straight to the page builder, which loads generate_experience as the
+    page's content provider, instead of re-running generate_experience.main().
+    Imported here so the menu starts without the builder and its templates.
+    """
+    import build_pages
+
+    build_pages.build(pages=['experience.html'])
+    print(f"✅ Generated {Path(__file__).parent.parent / 'experience.html'}")
+
+
 def get_input(prompt, default=None, required=True):
     """Get user input with optional default"""
     if default:
@@ -42,6 +57,24 @@ def get_input(prompt, default=None, required=True):
     return value
 
 
+def get_checked_input(prompt, field, default=None):
+    """get_input() repeated until the Experience model accepts the value"""
+    while True:
+        value = get_input(prompt, default)
+        error = Experience.check(field, value)
+        if not error:
+            return value
+        print(f"❌ {error}")
+
+
+def report_errors(experience):
+    """Print the model's validation errors; True if there were any"""
+    _, errors = Experience.parse(experience)
+    for error in errors:
+        print(f"❌ {error}")
+    return bool(errors)
+
+
 def get_yes_no(prompt, default='y'):
     """Get yes/no input"""
     value = input(f"{prompt} (y/n) [{default}]: ").strip().lower()
@@ -72,8 +105,8 @@ def add_new_experience():
         'company': get_input("Company Name (e.g., 'Google LLC')"),
         'location': get_input("Location (e.g., 'Mountain View, USA')"),
         'role': get_input("Job Role/Title"),
-        'start_date': get_input("Start Date (YYYY-MM format)", datetime.now().strftime('%Y-%m')),
-        'end_date': get_input("End Date (YYYY-MM or 'present')", 'present'),
+        'start_date': get_checked_input("Start Date (YYYY-MM format)", 'start_date', datetime.now().strftime('%Y-%m')),
+        'end_date': get_checked_input("End Date (YYYY-MM or 'present')", 'end_date', 'present'),
         'duration': get_input("Duration Display (e.g., '2 years 3 months')"),
         'color': get_input("Color (hex code)", '#60a5fa', required=False) or '#60a5fa',
         'order': max_order + 1,
@@ -116,6 +149,10 @@ def add_new_experience():
     tech_stack = get_input("Tech Stack (comma-separated with bullets, e.g., 'AWS • Python • Terraform')")
     experience['tech_stack'] = tech_stack
 
+    if report_errors(experience):
+        print("❌ Experience not saved")
+        return
+
     # Add to config
     config['experiences'].append(experience)
 
@@ -126,8 +163,7 @@ def add_new_experience():
 
     # Generate HTML
     print("\n🔨 Generating experience.html...")
-    import generate_experience
-    generate_experience.main()
+    regenerate_page()
 
     print("\n" + "="*60)
     print("✨ DONE! Your new experience has been added.")
@@ -164,12 +200,15 @@ def update_existing_experience():
         if new_value:
             experience[field] = new_value
 
+    if report_errors(experience):
+        print("❌ Changes not saved")
+        return
+
     # Save and regenerate
     save_experience_config(config, config_path)
 
     print("\n🔨 Regenerating experience.html...")
-    import generate_experience
-    generate_experience.main()
+    regenerate_page()
 
     print("\n✅ Experience updated successfully!")
 
@@ -192,8 +231,7 @@ def main():
     elif choice == '2':
         update_existing_experience()
     elif choice == '3':
-        import generate_experience
-        generate_experience.main()
+        regenerate_page()
     elif choice == '4':
         print("👋 Goodbye!")
     else:
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Audit the certificate PDFs in assets/certificates/:
+  - byte-identical duplicates (SHA-256 of the file contents)
+  - likely near-duplicates: same cleaned-up title and page count
+  - doubled extensions such as "name.pdf.pdf"
+  - size per category and files over LARGE_PDF_KB
+  - certificates.yaml entries that should point at the kept copy
+Files are hashed with memory-mapped, chunked reads in a thread pool. Hashes
+and page counts are cached by path, mtime and size in .cache/pdf_audit.json,
+so re-audits only read new or changed files.
+
+Usage:
+    python3 tools/audit_pdfs.py
+    python3 tools/audit_pdfs.py --workers 8
+"""
+
+import argparse
+import hashlib
+import json
+import mmap
+import os
+import re
+import sys
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import yaml
+
+from certificate_classifier import clean_filename
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CERTIFICATES_DIR = PROJECT_ROOT / 'assets' / 'certificates'
+CERTIFICATES_YAML = Path(__file__).parent / 'certificates.yaml'
+CACHE_PATH = PROJECT_ROOT / '.cache' / 'pdf_audit.json'
+REPORT_PATH = PROJECT_ROOT / '.cache' / 'pdf_audit_report.json'
+
+CHUNK_SIZE = 1024 * 1024
+LARGE_PDF_KB = 1024
+DEFAULT_WORKERS = min(8, os.cpu_count() or 1)
+
+# Page objects, not the /Pages tree nodes
+PAGE_OBJECT = re.compile(rb'/Type\s*/Page(?![A-Za-z])')
+PAGE_COUNT = re.compile(rb'/Count\s+(\d+)')
+OBJECT_STREAM = re.compile(rb'/Type\s*/ObjStm')
+TITLE_KEY = re.compile(r'[^a-z0-9]+')
+
+
+def hash_pdf(path):
+    """(sha256 hex, page count or None) from one pass over a memory-mapped file"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return digest.hexdigest(), None
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            view = memoryview(mapped)
+            try:
+                for offset in range(0, len(mapped), CHUNK_SIZE):
+                    digest.update(view[offset:offset + CHUNK_SIZE])
+            finally:
+                view.release()
+            pages = count_pages(mapped)
+    return digest.hexdigest(), pages
+
+
+def count_pages(data):
+    """Page count from page objects, or the page tree's /Count, or None"""
+    pages = len(PAGE_OBJECT.findall(data))
+    counts = [int(n) for n in PAGE_COUNT.findall(data)]
+    if not pages and not counts:
+        # PDF 1.5+ files can keep every dictionary in compressed object streams
+        for stream in object_streams(data):
+            pages += len(PAGE_OBJECT.findall(stream))
+            counts += [int(n) for n in PAGE_COUNT.findall(stream)]
+    if pages:
+        return pages
+    return max(counts) if counts else None
+
+
+def object_streams(data):
+    """Decompressed contents of each Flate-encoded /ObjStm"""
+    for match in OBJECT_STREAM.finditer(data):
+        start = data.find(b'stream', match.end())
+        end = data.find(b'endstream', start)
+        if start < 0 or end < 0:
+            continue
+        start += len(b'stream')
+        start += 2 if data[start:start + 2] == b'\r\n' else 1
+        try:
+            yield zlib.decompressobj().decompress(data[start:end])
+        except zlib.error:
+            continue
+
+
+def title_key(filename):
+    """Normalized title used to spot near-duplicates"""
+    name = filename
+    while name.lower().endswith('.pdf'):
+        name = name[:-4]
+    return TITLE_KEY.sub(' ', clean_filename(name + '.pdf').lower()).strip()
+
+
+class PdfAuditCache:
+    """{relative path: {mtime_ns, size, sha256, pages}}"""
+
+    def __init__(self, cache_path=CACHE_PATH):
+        self.cache_path = Path(cache_path)
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+        self.dirty = False
+
+    def get(self, rel, stat):
+        entry = self.entries.get(rel)
+        if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+            return entry
+        return None
+
+    def set(self, rel, stat, sha256, pages):
+        self.entries[rel] = {'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size,
+                             'sha256': sha256, 'pages': pages}
+        self.dirty = True
+        return self.entries[rel]
+
+    def prune(self, keep):
+        for rel in set(self.entries) - set(keep):
+            del self.entries[rel]
+            self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        self.dirty = False
+
+
+def scan_pdfs(certificates_dir=CERTIFICATES_DIR, cache=None, workers=DEFAULT_WORKERS):
+    """Return ({rel path: entry}, number of files hashed this run)"""
+    certificates_dir = Path(certificates_dir)
+    cache = cache if cache is not None else PdfAuditCache()
+    files = {path.relative_to(certificates_dir).as_posix(): path
+             for path in sorted(certificates_dir.rglob('*.pdf')) if path.is_file()}
+
+    results, pending = {}, []
+    for rel, path in files.items():
+        stat = path.stat()
+        entry = cache.get(rel, stat)
+        if entry:
+            results[rel] = entry
+        else:
+            pending.append((rel, path, stat))
+
+    if pending:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            hashed = pool.map(lambda item: hash_pdf(item[1]), pending)
+            for (rel, _, stat), (sha256, pages) in zip(pending, hashed):
+                results[rel] = cache.set(rel, stat, sha256, pages)
+
+    cache.prune(files)
+    cache.save()
+    return results, len(pending)
+
+
+def load_yaml_references(yaml_path=CERTIFICATES_YAML):
+    """{category/filename: [certificate titles]} from certificates.yaml"""
+    try:
+        with open(yaml_path, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return {}
+    references = {}
+    for cert in config.get('certificates') or []:
+        if cert.get('category') and cert.get('filename'):
+            rel = f"{cert['category']}/{cert['filename']}"
+            references.setdefault(rel, []).append(cert.get('title') or cert['filename'])
+    return references
+
+
+def keep_choice(paths, references):
+    """The copy to keep: referenced by YAML first, then a clean single extension, then shortest"""
+    return min(paths, key=lambda rel: (rel not in references, rel.lower().endswith('.pdf.pdf'),
+                                        len(rel), rel))
+
+
+def duplicate_groups(files, references):
+    """Exact duplicates by hash, then near-duplicates by title and page count"""
+    by_hash = {}
+    for rel, entry in files.items():
+        by_hash.setdefault(entry['sha256'], []).append(rel)
+    exact = [sorted(paths) for paths in by_hash.values() if len(paths) > 1]
+
+    by_title = {}
+    for sha256, paths in by_hash.items():
+        # One representative per distinct content
+        rel = keep_choice(paths, references)
+        key = (title_key(Path(rel).name), files[rel]['pages'])
+        if key[0]:
+            by_title.setdefault(key, []).append(rel)
+    near = [sorted(paths) for paths in by_title.values() if len(paths) > 1]
+    return exact, near
+
+
+def repoint_suggestions(groups, references, kind):
+    """YAML entries pointing at a copy other than the one to keep"""
+    suggestions = []
+    for paths in groups:
+        keep = keep_choice(paths, references)
+        for rel in paths:
+            if rel == keep:
+                continue
+            suggestions.append({
+                'kind': kind,
+                'file': rel,
+                'keep': keep,
+                'entries': references.get(rel, []),
+            })
+    return suggestions
+
+
+def category_sizes(files):
+    """{category: {count, bytes, largest}} sorted by total size"""
+    sizes = {}
+    for rel, entry in files.items():
+        category = rel.split('/')[0] if '/' in rel else '.'
+        stats = sizes.setdefault(category, {'count': 0, 'bytes': 0, 'largest': None})
+        stats['count'] += 1
+        stats['bytes'] += entry['size']
+        if stats['largest'] is None or entry['size'] > files[stats['largest']]['size']:
+            stats['largest'] = rel
+    return dict(sorted(sizes.items(), key=lambda item: -item[1]['bytes']))
+
+
+def audit(certificates_dir=CERTIFICATES_DIR, yaml_path=CERTIFICATES_YAML, cache=None,
+          workers=DEFAULT_WORKERS):
+    files, hashed = scan_pdfs(certificates_dir, cache, workers)
+    references = load_yaml_references(yaml_path)
+    exact, near = duplicate_groups(files, references)
+    return {
+        'files': len(files),
+        'hashed': hashed,
+        'total_bytes': sum(entry['size'] for entry in files.values()),
+        'categories': category_sizes(files),
+        'exact_duplicates': exact,
+        'near_duplicates': near,
+        'doubled_extension': sorted(rel for rel in files if rel.lower().endswith('.pdf.pdf')),
+        'large': sorted((rel for rel, entry in files.items() if entry['size'] > LARGE_PDF_KB * 1024),
+                        key=lambda rel: -files[rel]['size']),
+        'suggestions': repoint_suggestions(exact, references, 'exact')
+                       + repoint_suggestions(near, references, 'near'),
+        'sizes': {rel: entry['size'] for rel, entry in files.items()},
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Find duplicate and oversized certificate PDFs')
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help='Hashing threads')
+    args = parser.parse_args()
+
+    if not CERTIFICATES_DIR.exists():
+        print(f"❌ Certificates directory not found: {CERTIFICATES_DIR}")
+        return 1
+
+    report = audit(workers=args.workers)
+    sizes = report['sizes']
+
+    print(f"🔍 Audited {report['files']} PDFs ({report['total_bytes'] / 1024:.0f} KB), "
+          f"hashed {report['hashed']}, {report['files'] - report['hashed']} from cache")
+
+    print("\n📁 Size by category:")
+    for category, stats in report['categories'].items():
+        print(f"  {category:<12} {stats['count']:>3} files  {stats['bytes'] / 1024:>8.0f} KB"
+              f"  (largest: {Path(stats['largest']).name}, {sizes[stats['largest']] / 1024:.0f} KB)")
+
+    if report['large']:
+        print(f"\n🐘 Over {LARGE_PDF_KB} KB:")
+        for rel in report['large']:
+            print(f"  • {rel} ({sizes[rel] / 1024:.0f} KB)")
+
+    for label, groups in (('Identical files', report['exact_duplicates']),
+                          ('Likely duplicates (same title and page count)', report['near_duplicates'])):
+        if groups:
+            print(f"\n♊ {label}:")
+            for paths in groups:
+                print("  • " + "\n    ".join(f"{rel} ({sizes[rel] / 1024:.0f} KB)" for rel in paths))
+
+    if report['doubled_extension']:
+        print("\n⚠️  Doubled extension:")
+        for rel in report['doubled_extension']:
+            print(f"  • {rel}")
+
+    if report['suggestions']:
+        print("\n✏️  certificates.yaml suggestions:")
+        for suggestion in report['suggestions']:
+            action = f"repoint {len(suggestion['entries'])} entr{'y' if len(suggestion['entries']) == 1 else 'ies'}" \
+                if suggestion['entries'] else "unreferenced, can be removed"
+            print(f"  • {suggestion['file']} → {suggestion['keep']} ({suggestion['kind']}: {action})")
+            for title in suggestion['entries']:
+                print(f"      - {title}")
+
+    REPORT_PATH.parent.mkdir(parents=True, exist_ok=True)
+    with open(REPORT_PATH, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2, ensure_ascii=False)
+
+    wasted = sum(sizes[s['file']] for s in report['suggestions'] if s['kind'] == 'exact')
+    print("\n" + "="*60)
+    print(f"📄 Report: {REPORT_PATH}")
+    print(f"✅ {len(report['exact_duplicates'])} identical group(s) ({wasted / 1024:.0f} KB reclaimable), "
+          f"{len(report['near_duplicates'])} likely duplicate group(s)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
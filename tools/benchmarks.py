@@ -0,0 +1,583 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the portfolio automation tools.
+Each run is appended to .cache/benchmark_history.json so results can be
+compared between builds.
+
+Usage:
+    python3 tools/benchmarks.py                 # run every benchmark
+    python3 tools/benchmarks.py classifier      # run selected benchmarks
+"""
+
+import argparse
+import json
+import platform
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+HISTORY_PATH = PROJECT_ROOT / '.cache' / 'benchmark_history.json'
+
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark function under a name"""
+    def register(func):
+        BENCHMARKS[name] = func
+        return func
+    return register
+
+
+def timed(func, *args, repeat=3, **kwargs):
+    """Return the best wall-clock time in seconds over several runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args, **kwargs)
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+
+def record_results(name, metrics, history_path=HISTORY_PATH):
+    """Append one benchmark result to the JSON history file"""
+    history_path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        with open(history_path, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        history = {'runs': []}
+
+    entry = {
+        'benchmark': name,
+        'timestamp': datetime.now().isoformat(),
+        'python': platform.python_version(),
+        'metrics': metrics,
+    }
+    history['runs'].append(entry)
+
+    with open(history_path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2, ensure_ascii=False)
+
+    return entry
+
+
+# ============================================
+# Filename classifier
+# ============================================
+
+def _legacy_clean_filename(filename):
+    """Reference copy of the original str.replace based title cleanup"""
+    name = filename.replace('.pdf', '')
+    prefixes = ['AWSSkillBuilder-', 'KodeKloud-', 'KodeKloud-Course-Certificate_',
+                'ACloudGuru ', 'Udacity-']
+    for prefix in prefixes:
+        name = name.replace(prefix, '')
+    suffixes = ['_AWS Course Completion Certificate', '_AWS Course Completion',
+                ' - AWS Course Completion Certificate', ' - AWS Course Completion',
+                ' - Course Completion Certificate', '_VIJAY-MOURYA.pdf',
+                'Course Completion Certificate']
+    for suffix in suffixes:
+        name = name.replace(suffix, '')
+    name = name.replace('_', ' ').replace('-', ' ')
+    return ' '.join(name.split())
+
+
+def _legacy_extract_provider(filename):
+    """Reference copy of the original if/elif provider detection"""
+    if 'AWSSkillBuilder' in filename:
+        return 'AWS Skill Builder'
+    elif 'KodeKloud' in filename:
+        return 'KodeKloud'
+    elif 'ACloudGuru' in filename or 'A Cloud Guru' in filename:
+        return 'A Cloud Guru'
+    elif 'Udacity' in filename:
+        return 'Udacity'
+    elif 'Udemy' in filename:
+        return 'Udemy'
+    elif 'Coursera' in filename:
+        return 'Coursera'
+    elif 'Introduction to' in filename:
+        return 'Coursera'
+    else:
+        return 'Professional Certification'
+
+
+def _synthetic_filenames(count, seed=42):
+    """Build a realistic archive of certificate filenames"""
+    rng = random.Random(seed)
+    prefixes = ['AWSSkillBuilder-', 'AWSSkillBuilder_', 'KodeKloud-', 'KodeKloud_',
+                'ACloudGuru ', 'Udacity-', 'IBMCoursera_', 'Udemy - ', '']
+    topics = ['Introduction to', 'Advanced', 'Deploying', 'Architecting on', 'Basics of']
+    subjects = ['AWS Lambda', 'Amazon EKS', 'Terraform', 'Kubernetes', 'Linux',
+                'Machine Learning', 'Cloud Computing', 'DevOps', 'Ansible', 'Jenkins']
+    suffixes = [' - AWS Course Completion', '_VIJAY-MOURYA.pdf', '', '',
+                ' - Course Completion Certificate']
+    return [
+        f"{rng.choice(prefixes)}{rng.choice(topics)} {rng.choice(subjects)} {i}{rng.choice(suffixes)}.pdf"
+        for i in range(count)
+    ]
+
+
+@benchmark('classifier')
+def bench_classifier(count=100_000):
+    """Compare the compiled classifier against the legacy string loops"""
+    from certificate_classifier import FilenameClassifier, load_rules
+
+    filenames = _synthetic_filenames(count)
+    rules = load_rules()
+
+    def legacy():
+        for name in filenames:
+            _legacy_clean_filename(name)
+            _legacy_extract_provider(name)
+
+    def compiled_cold():
+        classifier = FilenameClassifier(rules)
+        for name in filenames:
+            classifier.classify(name)
+
+    warm_classifier = FilenameClassifier(rules)
+    for name in filenames:
+        warm_classifier.classify(name)
+
+    def compiled_warm():
+        for name in filenames:
+            warm_classifier.classify(name)
+
+    return {
+        'filenames': count,
+        'legacy_seconds': round(timed(legacy), 4),
+        'compiled_cold_seconds': round(timed(compiled_cold), 4),
+        'compiled_memoized_seconds': round(timed(compiled_warm), 4),
+    }
+
+
+# ============================================
+# Internal link checker
+# ============================================
+
+@benchmark('internal_links')
+def bench_internal_links(certificates=5000):
+    """Index and check a copy of the site scaled to thousands of certificates"""
+    from check_internal_links import SiteIndex, check_site
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for page in PROJECT_ROOT.glob('*.html'):
+            shutil.copy(page, root / page.name)
+        cert_dir = root / 'assets' / 'certificates' / 'Bench'
+        cert_dir.mkdir(parents=True)
+        entries = []
+        for i in range(certificates):
+            filename = f'Certificate {i}.pdf'
+            (cert_dir / filename).touch()
+            entries.append({'title': f'Certificate {i}', 'path': f'assets/certificates/Bench/{filename}'})
+        with open(root / 'assets' / 'certificates.json', 'w', encoding='utf-8') as f:
+            json.dump({'categories': {'Bench': {'certificates': entries}}}, f)
+
+        def run():
+            check_site(SiteIndex(root))
+
+        problems = check_site(SiteIndex(root))
+        return {
+            'certificates': certificates,
+            'broken_references': sum(len(items) for items in problems.values()),
+            'check_seconds': round(timed(run), 4),
+        }
+
+
+# ============================================
+# Page builds
+# ============================================
+
+@benchmark('page_build')
+def bench_page_build():
+    """Full page build vs incremental rebuilds after a content or partial edit"""
+    from build_pages import PAGES_DIR, TEMPLATES_DIR, build
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for pattern in ('*.html', '*.css', '*.js', 'assets/*.json', 'assets/optimized/manifest.json',
+                        'tools/*.yaml', f'{PAGES_DIR}/*.html', f'{TEMPLATES_DIR}/**/*.html'):
+            for path in PROJECT_ROOT.glob(pattern):
+                target = root / path.relative_to(PROJECT_ROOT)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy(path, target)
+
+        def touch(rel, marker):
+            path = root / rel
+            path.write_text(path.read_text(encoding='utf-8') + f'<!-- {marker} -->\n', encoding='utf-8')
+
+        def cold_build():
+            shutil.rmtree(root / '.cache', ignore_errors=True)
+            return build(root, force=True)
+
+        full = timed(cold_build)
+        noop = timed(build, root)
+
+        edits = {'content': f'{PAGES_DIR}/contact.html', 'partial': f'{TEMPLATES_DIR}/partials/nav.html'}
+        metrics = {'pages': len(cold_build()), 'full_build_seconds': round(full, 4),
+                   'noop_build_seconds': round(noop, 4)}
+        for label, rel in edits.items():
+            best, rebuilt = None, []
+            for run in range(3):
+                touch(rel, f'{label} {run}')
+                start = time.perf_counter()
+                rebuilt = build(root)
+                elapsed = time.perf_counter() - start
+                best = elapsed if best is None else min(best, elapsed)
+            metrics[f'{label}_edit_rebuilt'] = len(rebuilt)
+            metrics[f'{label}_edit_seconds'] = round(best, 4)
+        return metrics
+
+
+# ============================================
+# Progressive experience page
+# ============================================
+
+@benchmark('experience_shell')
+def bench_experience_shell(sizes=(5, 50, 500)):
+    """Shell vs full experience content size as the career history grows"""
+    import copy
+    from generate_experience import (DEFAULT_CARD_BATCH, DEFAULT_INLINE_CARDS, generate_experience_content,
+                                     generate_progressive_content, load_experience_config)
+
+    base = load_experience_config()
+    inline_cards = base['metadata'].get('inline_cards', DEFAULT_INLINE_CARDS)
+    card_batch = base['metadata'].get('card_batch', DEFAULT_CARD_BATCH)
+    metrics, shells = {}, []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            config = copy.deepcopy(base)
+            template = config['experiences'][-1]
+            config['experiences'] = [{**template, 'id': f'role{i}', 'order': i} for i in range(size)]
+            full = generate_experience_content(config)
+            shell = generate_progressive_content(config, tmp)
+            metrics[f'{size}_roles_full_kb'] = round(len(full.encode('utf-8')) / 1024, 1)
+            metrics[f'{size}_roles_shell_kb'] = round(len(shell.encode('utf-8')) / 1024, 1)
+            # A history shorter than the inline cards plus one batch has a smaller first batch
+            if size >= inline_cards + card_batch:
+                shells.append(len(shell.encode('utf-8')))
+    # First paint must not grow with the history: only the first card batch's placeholder is inline
+    metrics['shell_constant'] = len(set(shells)) <= 1
+    assert metrics['shell_constant'], f"experience shell grows with the history: {shells} bytes"
+    return metrics
+
+
+# ============================================
+# PDF audit
+# ============================================
+
+@benchmark('pdf_audit')
+def bench_pdf_audit(copies=20):
+    """Cold vs cached audit of the certificate PDFs, copied several times over"""
+    from audit_pdfs import CERTIFICATES_DIR, PdfAuditCache, audit
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for i in range(copies):
+            shutil.copytree(CERTIFICATES_DIR, root / 'certificates' / f'Copy{i}')
+        cache_path = root / 'pdf_audit.json'
+
+        def cold():
+            cache_path.unlink(missing_ok=True)
+            return audit(root / 'certificates', cache=PdfAuditCache(cache_path))
+
+        def warm():
+            return audit(root / 'certificates', cache=PdfAuditCache(cache_path))
+
+        report = cold()
+        return {
+            'files': report['files'],
+            'megabytes': round(report['total_bytes'] / 1024 / 1024, 1),
+            'identical_groups': len(report['exact_duplicates']),
+            'cold_seconds': round(timed(cold), 4),
+            'cached_seconds': round(timed(warm), 4),
+        }
+
+
+
+# ============================================
+# Certificate reconcile
+# ============================================
+
+@benchmark('reconcile')
+def bench_reconcile(sizes=(1000, 5000)):
+    """Reconcile synthetic trees where 10% of the files are unlisted, moved or missing"""
+    from reconcile_certificates import index_disk, reconcile
+
+    metrics = {}
+    for size in sizes:
+        with tempfile.TemporaryDirectory() as tmp:
+            root = Path(tmp)
+            certificates = []
+            for i in range(size):
+                category = f'Category{i % 10}'
+                filename = f'Course {i} Completion Certificate.pdf'
+                if i % 30 == 1:  # moved to the next category
+                    (root / f'Category{(i + 1) % 10}').mkdir(exist_ok=True)
+                    (root / f'Category{(i + 1) % 10}' / filename).touch()
+                elif i % 30 != 2:  # i % 30 == 2: missing from disk
+                    (root / category).mkdir(exist_ok=True)
+                    (root / category / filename).touch()
+                if i % 30 != 0:  # i % 30 == 0: missing from the YAML
+                    certificates.append({'category': category, 'filename': filename})
+            config = {'certificates': certificates}
+
+            result = reconcile(config, index_disk(root))
+            metrics[f'{size}_files_seconds'] = round(timed(lambda: reconcile(config, index_disk(root))), 4)
+            metrics[f'{size}_files_drift'] = sum(len(result[key]) for key in ('unlisted', 'missing', 'moved'))
+    return metrics
+
+
+# ============================================
+# Data models
+# ============================================
+
+@benchmark('models')
+def bench_models(count=20000):
+    """Certificate model parsing vs the previous per-dict checks, time and retained memory"""
+    import tracemalloc
+    from models import Certificate
+
+    records = [{
+        'title': f'Course {i}',
+        'number': str(i),
+        'provider': 'AWS Skill Builder',
+        'category': 'AWS',
+        'filename': f'Course {i}.pdf',
+        'completion_date': f'20{20 + i % 6}-{1 + i % 12:02d}-{1 + i % 28:02d}',
+        'verification_url': '',
+    } for i in range(count)]
+
+    def dict_checks():
+        # What validate_certificate did for every entry before the models
+        valid = []
+        for cert in records:
+            errors = [f"Missing required field: {field}"
+                      for field in ('title', 'provider', 'category', 'filename') if not cert.get(field)]
+            if cert.get('completion_date'):
+                try:
+                    datetime.strptime(cert['completion_date'], '%Y-%m-%d')
+                except ValueError:
+                    errors.append("Invalid date format for completion_date. Use YYYY-MM-DD")
+            if not errors:
+                valid.append(dict(cert))
+        return valid
+
+    def model_checks():
+        return [Certificate.parse(cert)[0] for cert in records]
+
+    def retained_kb(build):
+        tracemalloc.start()
+        kept = build()
+        size = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+        del kept
+        return round(size / 1024)
+
+    return {
+        'entries': count,
+        'dict_seconds': round(timed(dict_checks), 4),
+        'model_seconds': round(timed(model_checks), 4),
+        'dict_kb': retained_kb(dict_checks),
+        'model_kb': retained_kb(model_checks),
+    }
+
+
+# ============================================
+# Data versions
+# ============================================
+
+@benchmark('data_versions')
+def bench_data_versions(versions=5):
+    """Delta vs full download after each of a few certificate additions, and the diff time"""
+    import copy
+    from data_versions import compact, diff
+
+    with open(PROJECT_ROOT / 'assets' / 'certificates.json', 'r', encoding='utf-8') as f:
+        base = json.load(f)
+
+    def size(data):
+        return len(json.dumps(data, separators=(',', ':'), ensure_ascii=False).encode('utf-8'))
+
+    history = [base]
+    for i in range(versions):
+        payload = copy.deepcopy(history[-1])
+        category = next(iter(payload['categories'].values()))
+        category['certificates'].insert(0, dict(category['certificates'][0], title=f'New course {i}'))
+        category['count'] += 1
+        payload['total_count'] += 1
+        payload['last_updated'] = f'2030-01-0{i + 1}T00:00:00'
+        history.append(payload)
+
+    chained = []
+    for old, new in zip(history, history[1:]):
+        chained = compact(chained + diff(old, new))
+
+    return {
+        'full_bytes': len(json.dumps(history[-1], indent=2, ensure_ascii=False).encode('utf-8')),
+        'one_version_delta_bytes': size(diff(history[-2], history[-1])),
+        f'{versions}_version_delta_bytes': size(chained),
+        'diff_seconds': round(timed(diff, history[-2], history[-1]), 5),
+    }
+
+
+# ============================================
+# Streaming certificates.json
+# ============================================
+
+@benchmark('certificate_stream')
+def bench_certificate_stream(count=20000, spill_threshold=2000):
+    """Peak memory and time writing certificates.json: whole dict + json.dump vs the streaming sink"""
+    import tracemalloc
+    from certificate_stream import CertificateSink
+
+    def entries():
+        rng = random.Random(7)
+        for i in range(count):
+            category = f'Category{i % 8}'
+            yield category, {
+                'title': f'Course {i}',
+                'provider': 'AWS Skill Builder',
+                'filename': f'Course {i}.pdf',
+                'category': category,
+                'completion_date': f'20{20 + rng.randrange(6)}-{1 + rng.randrange(12):02d}-{1 + rng.randrange(28):02d}',
+            }
+
+    def header(category):
+        return {'display_name': category, 'icon': '📄', 'color': '#60A5FA', 'description': ''}
+
+    def sort_key(entry):
+        return entry.get('completion_date', '1970-01-01')
+
+    def whole(path):
+        output = {'last_updated': '2030-01-01T00:00:00', 'total_count': 0, 'categories': {}}
+        for category, entry in entries():
+            data = output['categories'].setdefault(category, {**header(category), 'count': 0, 'certificates': []})
+            data['certificates'].append(entry)
+            data['count'] += 1
+            output['total_count'] += 1
+        for data in output['categories'].values():
+            data['certificates'].sort(key=sort_key, reverse=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(output, f, indent=2, ensure_ascii=False)
+
+    def streamed(path):
+        with CertificateSink(sort_key, reverse=True, spill_threshold=spill_threshold) as sink:
+            for seq, (category, entry) in enumerate(entries()):
+                sink.add(category, entry, seq)
+            sink.write(path, '2030-01-01T00:00:00', header)
+
+    def peak_kb(write, path):
+        tracemalloc.start()
+        write(path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        return round(peak / 1024)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        whole_path, streamed_path = Path(tmp) / 'whole.json', Path(tmp) / 'streamed.json'
+        metrics = {
+            'entries': count,
+            'dict_seconds': round(timed(whole, whole_path), 3),
+            'stream_seconds': round(timed(streamed, streamed_path), 3),
+            'dict_peak_kb': peak_kb(whole, whole_path),
+            'stream_peak_kb': peak_kb(streamed, streamed_path),
+        }
+        metrics['identical'] = whole_path.read_bytes() == streamed_path.read_bytes()
+    return metrics
+
+
+# ============================================
+# CLI startup
+# ============================================
+
+@benchmark('cli_startup')
+def bench_cli_startup():
+    """Import time of each portfolio.py command (python -X importtime), against its budget"""
+    from portfolio import STARTUP_BUDGET_MS, startup_times
+
+    metrics = {}
+    for command, measured in startup_times().items():
+        if isinstance(measured, ImportError):
+            continue
+        metrics[f'{command}_ms'] = measured[0]
+        metrics[f'{command}_budget_ms'] = STARTUP_BUDGET_MS[command]
+    return metrics
+
+
+# ============================================
+# Build cache
+# ============================================
+
+@benchmark('build_cache')
+def bench_build_cache():
+    """Image variants in a fresh checkout: rendered from scratch vs restored from the build cache"""
+    from build_cache import BuildCache, DirectoryBackend
+    from optimize_images import IMAGE_TARGETS, OUTPUT_DIR, build, supported_formats
+
+    if not supported_formats():
+        return {'error': 'Pillow is not installed'}
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp) / 'site'
+        for pattern, _ in IMAGE_TARGETS:
+            for path in PROJECT_ROOT.glob(pattern):
+                target = root / path.relative_to(PROJECT_ROOT)
+                target.parent.mkdir(parents=True, exist_ok=True)
+                shutil.copy(path, target)
+
+        def fresh_checkout(cache_dir):
+            shutil.rmtree(root / OUTPUT_DIR, ignore_errors=True)
+            cache = BuildCache(DirectoryBackend(cache_dir))
+            build(root, cache=cache)
+            return cache
+
+        # Each cold run starts from an empty cache; warm runs restore from the last one
+        cold_runs = iter(range(3))
+        cold = timed(lambda: fresh_checkout(Path(tmp) / f'cold-{next(cold_runs)}'))
+        warm = timed(fresh_checkout, Path(tmp) / 'cold-2')
+        restored = fresh_checkout(Path(tmp) / 'cold-2')
+        return {
+            'images': restored.hits,
+            'cold_seconds': round(cold, 3),
+            'warm_seconds': round(warm, 3),
+            'speedup': round(cold / warm, 1),
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Run portfolio tooling benchmarks')
+    parser.add_argument('names', nargs='*', help=f"Benchmarks to run ({', '.join(BENCHMARKS)})")
+    parser.add_argument('--no-record', action='store_true', help='Do not append results to history')
+    args = parser.parse_args()
+
+    names = args.names or list(BENCHMARKS)
+    unknown = [name for name in names if name not in BENCHMARKS]
+    if unknown:
+        print(f"❌ Unknown benchmark(s): {', '.join(unknown)}")
+        return 1
+
+    for name in names:
+        print(f"\n⏱️  Running benchmark: {name}")
+        metrics = BENCHMARKS[name]()
+        for key, value in metrics.items():
+            print(f"   {key}: {value}")
+        if not args.no_record:
+            record_results(name, metrics)
+
+    if not args.no_record:
+        print(f"\n✅ Results appended to: {HISTORY_PATH}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+Content-addressed cache for expensive build outputs (image variants,
+optimized PDFs, thumbnails), so a fresh checkout can restore them instead of
+recomputing. A stage asks for its key before doing the work:
+
+    key = cache.key('thumbnails', {'hash': digest, 'width': 320}, version)
+
+The key hashes the stage name, its inputs and the tool version (the stage's
+version constant plus the library versions that shape the output). On a hit,
+fetch() writes the outputs back into the tree and returns the manifest entry
+stored with them. On a miss the stage does the work and publish()es the
+files and entry. File contents are stored once by their own hash, however
+many entries share them.
+
+Storage is a backend with read/write/exists by name. DirectoryBackend keeps
+everything under one directory, .cache/build by default. CI restores it with
+actions/cache, and it can also be a shared mount. PORTFOLIO_BUILD_CACHE sets
+the directory. PORTFOLIO_BUILD_CACHE_BACKEND=module:factory loads another
+backend, called with that location.
+
+Usage:
+    python3 tools/build_cache.py               # entries and size per stage
+    python3 tools/build_cache.py --prune 30    # drop entries unused for 30 days
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_DIR = PROJECT_ROOT / '.cache' / 'build'
+
+
+class DirectoryBackend:
+    """Blobs as files under a directory: objects/<ab>/<content hash>, entries/<ab>/<key>"""
+
+    def __init__(self, root=CACHE_DIR):
+        self.root = Path(root)
+
+    def path(self, name):
+        kind, digest = name.split('/', 1)
+        return self.root / kind / digest[:2] / digest
+
+    def exists(self, name):
+        return self.path(name).is_file()
+
+    def read(self, name):
+        path = self.path(name)
+        try:
+            data = path.read_bytes()
+        except FileNotFoundError:
+            return None
+        # Entries record their last use for --prune
+        if name.startswith('entries/'):
+            os.utime(path)
+        return data
+
+    def write(self, name, data):
+        path = self.path(name)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Written under a temporary name first: other runs may share the directory
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix='.tmp-')
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+
+def open_backend(location=None):
+    """The backend from PORTFOLIO_BUILD_CACHE_BACKEND, else a DirectoryBackend"""
+    location = location or os.getenv('PORTFOLIO_BUILD_CACHE') or CACHE_DIR
+    spec = os.getenv('PORTFOLIO_BUILD_CACHE_BACKEND')
+    if spec:
+        module_name, _, factory = spec.partition(':')
+        return getattr(importlib.import_module(module_name), factory)(location)
+    return DirectoryBackend(location)
+
+
+def content_hash(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class BuildCache:
+    """Stage outputs by key; counts hits, misses and stored entries for the stage summary"""
+
+    def __init__(self, backend=None):
+        self.backend = backend or open_backend()
+        self.hits = self.misses = self.stored = 0
+
+    @staticmethod
+    def key(stage, inputs, version):
+        """Hash of the stage, its inputs and the tool version (all JSON-serializable)"""
+        payload = json.dumps({'stage': stage, 'inputs': inputs, 'version': version}, sort_keys=True)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def fetch(self, key, project_root=PROJECT_ROOT):
+        """Restore a cached entry's files into the tree; returns its manifest entry, or None"""
+        data = self.backend.read(f'entries/{key}')
+        entry = json.loads(data) if data else None
+        if entry is None or not all(self.backend.exists(f'objects/{blob}') for blob in entry['files'].values()):
+            self.misses += 1
+            return None
+        for rel, blob in entry['files'].items():
+            output = Path(project_root) / rel
+            if output.exists() and content_hash(output.read_bytes()) == blob:
+                continue
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(self.backend.read(f'objects/{blob}'))
+        self.hits += 1
+        return entry['meta']
+
+    def publish(self, key, stage, files, meta, project_root=PROJECT_ROOT):
+        """Store the output files (paths relative to the project root) and the manifest entry under key"""
+        blobs = {}
+        for rel in files:
+            data = (Path(project_root) / rel).read_bytes()
+            blob = content_hash(data)
+            if not self.backend.exists(f'objects/{blob}'):
+                self.backend.write(f'objects/{blob}', data)
+            blobs[rel] = blob
+        entry = {'stage': stage, 'files': blobs, 'meta': meta}
+        self.backend.write(f'entries/{key}', json.dumps(entry, ensure_ascii=False).encode('utf-8'))
+        self.stored += 1
+
+    def summary(self):
+        return f"build cache: {self.hits} restored, {self.misses} missed, {self.stored} stored"
+
+
+def library_version(distribution):
+    """An installed package's version for cache keys; None when it isn't installed"""
+    from importlib import metadata
+
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:
+        return None
+
+
+def scan(root):
+    """({key: (entry, mtime)}, {blob: size}) in a cache directory"""
+    entries, objects = {}, {}
+    for path in (Path(root) / 'entries').rglob('*') if (Path(root) / 'entries').exists() else []:
+        if path.is_file() and not path.name.startswith('.tmp-'):
+            with open(path, 'r', encoding='utf-8') as f:
+                entries[path.name] = (json.load(f), path.stat().st_mtime)
+    for path in (Path(root) / 'objects').rglob('*') if (Path(root) / 'objects').exists() else []:
+        if path.is_file() and not path.name.startswith('.tmp-'):
+            objects[path.name] = path.stat().st_size
+    return entries, objects
+
+
+def prune(root, days):
+    """Remove entries unused for `days` and the objects no entry refers to; returns (entries, objects) removed"""
+    backend = DirectoryBackend(root)
+    entries, objects = scan(root)
+    cutoff = time.time() - days * 86400
+    removed = {key for key, (_, mtime) in entries.items() if mtime < cutoff}
+    for key in removed:
+        backend.path(f'entries/{key}').unlink()
+    referenced = {blob for key, (entry, _) in entries.items() if key not in removed
+                  for blob in entry['files'].values()}
+    orphans = [blob for blob in objects if blob not in referenced]
+    for blob in orphans:
+        backend.path(f'objects/{blob}').unlink()
+    return len(removed), len(orphans)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Show or prune the build cache')
+    parser.add_argument('--dir', type=Path, default=Path(os.getenv('PORTFOLIO_BUILD_CACHE') or CACHE_DIR),
+                        help='Cache directory (default: $PORTFOLIO_BUILD_CACHE or .cache/build)')
+    parser.add_argument('--prune', type=float, metavar='DAYS', help='Remove entries not used for DAYS days')
+    args = parser.parse_args()
+
+    if args.prune is not None:
+        entries, objects = prune(args.dir, args.prune)
+        print(f"🧹 Removed {entries} entr{'y' if entries == 1 else 'ies'} and {objects} object(s)")
+
+    entries, objects = scan(args.dir)
+    stages = {}
+    for entry, _ in entries.values():
+        stages.setdefault(entry['stage'], set()).update(entry['files'].values())
+    print(f"🗃️  Build cache: {args.dir}")
+    for stage, blobs in sorted(stages.items()):
+        count = sum(1 for entry, _ in entries.values() if entry['stage'] == stage)
+        size = sum(objects.get(blob, 0) for blob in blobs)
+        print(f"  • {stage}: {count} entries, {size / 1024:.0f} KB")
+
+    print("\n" + "="*60)
+    print(f"✅ {len(entries)} entries, {len(objects)} objects, {sum(objects.values()) / 1024:.0f} KB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
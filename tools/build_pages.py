@@ -0,0 +1,382 @@
+#!/usr/bin/env python3
+"""
+Render every page from shared layouts/partials and per-page content files.
+Templates live in tools/templates, page content (YAML front matter + HTML)
+in tools/pages, and the nav/site settings in tools/site.yaml. Templates are
+compiled to Python code once and cached by source hash in .cache/templates.
+The build records which files each page was rendered from, so only pages
+whose layout, partials, content or data changed are rebuilt.
+
+Template syntax (values are inserted as-is, they are trusted HTML):
+    {{ page.title }}                      value lookup (dicts or attributes)
+    {% include "partials/nav.html" %}     render another template
+    {% for item in nav %}...{% endfor %}
+    {% if item.active %}...{% else %}...{% endif %}
+
+Usage:
+    python3 tools/build_pages.py                  # rebuild changed pages
+    python3 tools/build_pages.py --force          # rebuild everything
+    python3 tools/build_pages.py --deps           # show which pages use which templates
+"""
+
+import argparse
+import hashlib
+import importlib
+import json
+import marshal
+import re
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+from critical_css import CriticalCssCache, inline_critical_css
+from optimize_images import load_manifest, picture_html
+from page_graph import PageGraph
+from resource_hints import inject_resource_hints, link_popularity
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TEMPLATES_DIR = 'tools/templates'
+PAGES_DIR = 'tools/pages'
+SITE_CONFIG = 'tools/site.yaml'
+STATE_PATH = '.cache/page_build.json'
+TEMPLATE_CACHE_DIR = '.cache/templates'
+
+# Bump when the generated template code changes shape
+ENGINE_VERSION = 2
+
+# Pages whose content is produced by a generator: page -> (module, input files).
+# The module provides page_content() -> (front matter dict, content HTML).
+GENERATED_PAGES = {
+    'experience.html': ('generate_experience', [
+        'tools/experience.yaml', 'tools/generate_experience.py', 'tools/models.py',
+    ]),
+}
+
+# Context values and the files they are built from; a page depends on these
+# files only if one of its templates uses the value
+CONTEXT_INPUTS = {
+    'site': [SITE_CONFIG],
+    'nav': [SITE_CONFIG],
+    'profile_picture': ['assets/optimized/manifest.json'],
+}
+
+PROFILE_PICTURE = 'assets/DP/ProfilePicture.png'
+PROFILE_PICTURE_ATTRS = 'alt="VM" class="logo" style="width:56px;height:56px;border-radius:12px;"'
+
+TAG = re.compile(r'({{.*?}}|{%.*?%})', re.S)
+# Block tags and includes alone on a line don't leave blank lines behind
+BLOCK_LINE = re.compile(r'^[ \t]*({%\s*(?:for|endfor|if|else|endif|include)\b.*?%})[ \t]*\n', re.M)
+# A value alone on an indented line has every one of its lines indented to match
+STANDALONE_VALUE = re.compile(r'^([ \t]+){{\s*([\w.]+)\s*}}[ \t]*$', re.M)
+FRONT_MATTER = re.compile(r'\A---\n(.*?)\n---\n', re.S)
+
+
+# ============================================
+# Template engine
+# ============================================
+
+class TemplateError(Exception):
+    pass
+
+
+def lookup(context, dotted):
+    """Resolve a dotted name against the context (dict keys, then attributes)"""
+    names = dotted.split('.')
+    value = context.get(names[0])
+    for name in names[1:]:
+        if value is None:
+            return None
+        value = value.get(name) if isinstance(value, dict) else getattr(value, name, None)
+    return value
+
+
+def indent_lines(text, prefix):
+    return '\n'.join(prefix + line if line else line for line in text.split('\n'))
+
+
+def compile_template(source, name):
+    """Compile template source to a code object
+
+    Returns (code, included template names, top-level context names used).
+    """
+    lines = ['def render(ctx, include):', '    out = []']
+    indent = 1
+    blocks = []
+    includes = []
+    names = set()
+    loop_depth = 0
+
+    def emit(line):
+        lines.append('    ' * indent + line)
+
+    source = STANDALONE_VALUE.sub(lambda m: '{{ %s @%s}}' % (m.group(2), m.group(1)), source)
+    source = BLOCK_LINE.sub(r'\1', source)
+    for token in TAG.split(source):
+        if not token:
+            continue
+        if token.startswith('{{'):
+            expression, _, prefix = token[2:-2].partition(' @')
+            expression = expression.strip()
+            names.add(expression.split('.')[0])
+            value = f"str(lookup(ctx, {expression!r}) or '')"
+            emit(f"out.append(indent_lines({value}, {prefix!r}))" if prefix else f"out.append({value})")
+        elif token.startswith('{%'):
+            words = token[2:-2].split()
+            keyword = words[0] if words else ''
+            if keyword == 'include' and len(words) == 2:
+                target = words[1].strip('"\'')
+                includes.append(target)
+                emit(f"out.append(include({target!r}, ctx))")
+            elif keyword == 'for' and len(words) == 4 and words[2] == 'in':
+                loop_depth += 1
+                names.add(words[3].split('.')[0])
+                emit(f"for _item{loop_depth} in lookup(ctx, {words[3]!r}) or ():")
+                indent += 1
+                emit(f"ctx = {{**ctx, {words[1]!r}: _item{loop_depth}}}")
+                blocks.append('for')
+            elif keyword == 'endfor' and blocks and blocks[-1] == 'for':
+                blocks.pop()
+                indent -= 1
+                loop_depth -= 1
+            elif keyword == 'if' and len(words) == 2:
+                names.add(words[1].split('.')[0])
+                emit(f"if lookup(ctx, {words[1]!r}):")
+                indent += 1
+                emit('pass')
+                blocks.append('if')
+            elif keyword == 'else' and blocks and blocks[-1] == 'if':
+                indent -= 1
+                emit('else:')
+                indent += 1
+                emit('pass')
+            elif keyword == 'endif' and blocks and blocks[-1] == 'if':
+                blocks.pop()
+                indent -= 1
+            else:
+                raise TemplateError(f"{name}: unsupported tag {token}")
+        else:
+            emit(f"out.append({token!r})")
+
+    if blocks:
+        raise TemplateError(f"{name}: unclosed {{% {blocks[-1]} %}}")
+    lines.append("    return ''.join(out)")
+    return compile('\n'.join(lines), f'<template {name}>', 'exec'), includes, sorted(names)
+
+
+class TemplateLoader:
+    """Loads templates, compiling each once (cached on disk by source hash)"""
+
+    def __init__(self, project_root=PROJECT_ROOT):
+        self.root = Path(project_root)
+        self.templates_dir = self.root / TEMPLATES_DIR
+        self.cache_dir = self.root / TEMPLATE_CACHE_DIR
+        self.compiled = {}
+
+    def load(self, name):
+        """(render function, included names, context names) for a template"""
+        if name not in self.compiled:
+            path = self.templates_dir / name
+            try:
+                source = path.read_text(encoding='utf-8')
+            except FileNotFoundError:
+                raise TemplateError(f"template not found: {name}")
+            # Bytecode is specific to the interpreter version
+            key = f'{ENGINE_VERSION}\0{sys.version_info[:2]}\0{source}'
+            cached = self.cache_dir / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.bin"
+            try:
+                code, includes, names = marshal.loads(cached.read_bytes())
+            except (FileNotFoundError, EOFError, ValueError, TypeError):
+                code, includes, names = compile_template(source, name)
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                cached.write_bytes(marshal.dumps((code, includes, names)))
+            namespace = {'lookup': lookup, 'indent_lines': indent_lines}
+            exec(code, namespace)
+            self.compiled[name] = (namespace['render'], includes, names)
+        return self.compiled[name]
+
+    def render(self, name, context):
+        return self.load(name)[0](context, self.render)
+
+    def dependencies(self, name):
+        """The template and everything it includes, transitively"""
+        seen = []
+        pending = [name]
+        while pending:
+            current = pending.pop()
+            if current in seen:
+                continue
+            seen.append(current)
+            pending.extend(self.load(current)[1])
+        return seen
+
+
+# ============================================
+# Pages
+# ============================================
+
+def load_content(path):
+    """Split a content file into (front matter dict, HTML)"""
+    text = Path(path).read_text(encoding='utf-8')
+    match = FRONT_MATTER.match(text)
+    if not match:
+        return {}, text
+    return yaml.safe_load(match.group(1)) or {}, text[match.end():]
+
+
+def load_site(project_root=PROJECT_ROOT):
+    with open(Path(project_root) / SITE_CONFIG, 'r', encoding='utf-8') as f:
+        return yaml.safe_load(f)
+
+
+def page_sources(project_root=PROJECT_ROOT):
+    """{output page: content file or None for generated pages}"""
+    sources = {path.name: f'{PAGES_DIR}/{path.name}'
+               for path in sorted((Path(project_root) / PAGES_DIR).glob('*.html'))}
+    for page in GENERATED_PAGES:
+        sources.setdefault(page, None)
+    return sources
+
+
+def page_content(page, source, project_root=PROJECT_ROOT):
+    """(front matter, content HTML, input files) for one page"""
+    if source is not None:
+        meta, content = load_content(Path(project_root) / source)
+        return meta, content, [source]
+    module_name, inputs = GENERATED_PAGES[page]
+    meta, content = importlib.import_module(module_name).page_content(project_root)
+    return meta, content, list(inputs)
+
+
+def render_page(page, meta, content, site, loader, project_root=PROJECT_ROOT):
+    """Render a page through its layout; returns (HTML, files it was rendered from)"""
+    page_meta = {'footer': site['site'].get('footer'), 'subtitle': site['site'].get('tagline')}
+    page_meta.update(meta)
+    layout = f"{page_meta.get('layout', 'layout')}.html"
+    context = {
+        'site': site['site'],
+        'page': page_meta,
+        'nav': [{**item, 'active': item['href'] == page} for item in site['nav']],
+        'content': content.strip('\n'),
+        'profile_picture': picture_html(PROFILE_PICTURE, load_manifest(Path(project_root) / 'assets/optimized/manifest.json'),
+                                        PROFILE_PICTURE_ATTRS),
+    }
+    templates = loader.dependencies(layout)
+    inputs = [f'{TEMPLATES_DIR}/{name}' for name in templates]
+    for name in sorted({used for template in templates for used in loader.load(template)[2]}):
+        inputs += [dep for dep in CONTEXT_INPUTS.get(name, []) if dep not in inputs]
+    return loader.render(layout, context), inputs
+
+
+def file_hash(path):
+    try:
+        return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+    except FileNotFoundError:
+        return None
+
+
+def load_state(project_root=PROJECT_ROOT):
+    try:
+        with open(Path(project_root) / STATE_PATH, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'pages': {}}
+
+
+def is_stale(page, entry, project_root=PROJECT_ROOT):
+    """True if any recorded input, or the output itself, changed since the last build"""
+    if not entry or file_hash(Path(project_root) / page) != entry['output']:
+        return True
+    return any(file_hash(Path(project_root) / dep) != digest for dep, digest in entry['inputs'].items())
+
+
+def build(project_root=PROJECT_ROOT, pages=None, force=False):
+    """Rebuild stale pages (or the given pages); returns the list of rebuilt pages"""
+    root = Path(project_root)
+    state = load_state(root)
+    sources = page_sources(root)
+    selected = pages or list(sources)
+    unknown = [page for page in selected if page not in sources]
+    if unknown:
+        raise TemplateError(f"no content for: {', '.join(unknown)}")
+
+    stale = [page for page in selected if force or pages or is_stale(page, state['pages'].get(page), root)]
+    if not stale:
+        return []
+
+    site = load_site(root)
+    loader = TemplateLoader(root)
+    rendered = {}
+    for page in stale:
+        meta, content, inputs = page_content(page, sources[page], root)
+        html, template_inputs = render_page(page, meta, content, site, loader, root)
+        rendered[page] = (html, inputs + template_inputs)
+
+    # Post-process against the new markup of every rebuilt page
+    graph = PageGraph(root)
+    for page, (html, _) in rendered.items():
+        graph.parse(page, html)
+    popularity = link_popularity(graph)
+    css_cache = CriticalCssCache(root / '.cache' / 'critical_css.json')
+
+    for page, (html, inputs) in rendered.items():
+        html, _ = inject_resource_hints(html, page, graph, popularity)
+        html, css, _ = inline_critical_css(html, page, root, css_cache)
+        if css is not None:
+            inputs = inputs + ['styles.css']
+        output = root / page
+        if not output.exists() or output.read_text(encoding='utf-8') != html:
+            output.write_text(html, encoding='utf-8')
+        state['pages'][page] = {
+            'inputs': {dep: file_hash(root / dep) for dep in inputs},
+            'output': file_hash(output),
+        }
+
+    css_cache.save()
+    state_path = root / STATE_PATH
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(state_path, 'w', encoding='utf-8') as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    return list(rendered)
+
+
+def dependency_map(project_root=PROJECT_ROOT):
+    """{template or input file: [pages]} from the last build"""
+    usage = {}
+    for page, entry in sorted(load_state(project_root)['pages'].items()):
+        for dep in entry['inputs']:
+            usage.setdefault(dep, []).append(page)
+    return dict(sorted(usage.items()))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render pages from layouts, partials and content files')
+    parser.add_argument('pages', nargs='*', help='Pages to rebuild (default: every stale page)')
+    parser.add_argument('--force', action='store_true', help='Rebuild every page')
+    parser.add_argument('--deps', action='store_true', help='Print the template -> pages map and exit')
+    args = parser.parse_args()
+
+    if args.deps:
+        for dep, pages in dependency_map(PROJECT_ROOT).items():
+            print(f"  {dep}: {', '.join(pages)}")
+        return 0
+
+    start = time.perf_counter()
+    try:
+        rebuilt = build(PROJECT_ROOT, args.pages or None, args.force)
+    except (TemplateError, yaml.YAMLError) as e:
+        print(f"❌ {e}")
+        return 1
+    elapsed = time.perf_counter() - start
+
+    print("🧱 Page build")
+    for page in rebuilt:
+        print(f"  • {page}")
+    print("\n" + "="*60)
+    print(f"✅ {len(rebuilt)} of {len(page_sources(PROJECT_ROOT))} page(s) rebuilt in {elapsed * 1000:.0f} ms")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Generate sw.js, a service worker that serves repeat visits from the cache:
+  - every page and the styles, scripts, icons and images it loads are
+    precached, each under its content hash, so a new build only downloads
+    the entries that changed
+  - the data JSON (certificates, badges, Medium posts and archive pages) is
+    served stale-while-revalidate, except the version-keyed (?v=N) requests
+    scripts.js makes when it stores a new version
+  - content-hashed assets (assets/optimized, assets/medium/images,
+    assets/fragments) are served cache-first
+The worker is rendered from tools/templates/sw.js; run this after the pages
+and assets are built.
+
+Usage:
+    python3 tools/build_service_worker.py
+    python3 tools/build_service_worker.py --dry-run    # report changes only
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from pathlib import Path
+
+from build_pages import TemplateLoader
+from page_graph import PageGraph
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+SERVICE_WORKER = 'sw.js'
+TEMPLATE = 'sw.js'
+
+# Runtime-cached paths (regex sources, matched against the URL path)
+DATA_PATTERN = r'/assets/(?:medium/)?[^/]+\.json$'
+HASHED_PATTERN = r'/assets/(?:optimized|medium/images|fragments)/'
+HASHED_MAX_ENTRIES = 200
+
+PRECACHE_KINDS = {'html', 'css', 'js', 'icon', 'image', 'font'}
+# Larger files are left to the browser cache instead of being downloaded on install
+PRECACHE_MAX_KB = 256
+
+PRECACHE_LINE = re.compile(r'^const PRECACHE = (.*);$', re.M)
+
+
+def content_hash(path):
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()[:16]
+
+
+def precache_entries(project_root=PROJECT_ROOT):
+    """Sorted [url, content hash] for every page and the assets it loads directly"""
+    root = Path(project_root)
+    graph = PageGraph(root)
+    runtime = re.compile(f'{DATA_PATTERN}|{HASHED_PATTERN}')
+    entries = {}
+    for page in graph.pages():
+        for dep in graph.dependencies(page):
+            # Images rendered from the data JSON are only known at runtime
+            if dep.kind not in PRECACHE_KINDS or (dep.parent or '').endswith('.json'):
+                continue
+            if dep.path in entries or runtime.search('/' + dep.path):
+                continue
+            path = root / dep.path
+            if not path.is_file() or path.stat().st_size > PRECACHE_MAX_KB * 1024:
+                continue
+            entries[dep.path] = content_hash(path)
+    return [[url, revision] for url, revision in sorted(entries.items())]
+
+
+def previous_entries(path):
+    """{url: revision} from an existing sw.js"""
+    try:
+        match = PRECACHE_LINE.search(Path(path).read_text(encoding='utf-8'))
+    except FileNotFoundError:
+        return {}
+    return dict(json.loads(match.group(1))) if match else {}
+
+
+def render_service_worker(entries, project_root=PROJECT_ROOT):
+    manifest = json.dumps(entries, separators=(',', ':'))
+    context = {
+        'version': hashlib.sha256(manifest.encode('utf-8')).hexdigest()[:12],
+        'precache': manifest,
+        'data_pattern': json.dumps(DATA_PATTERN),
+        'hashed_pattern': json.dumps(HASHED_PATTERN),
+        'hashed_max_entries': HASHED_MAX_ENTRIES,
+    }
+    return TemplateLoader(project_root).render(TEMPLATE, context)
+
+
+def build_service_worker(project_root=PROJECT_ROOT, dry_run=False):
+    """Write sw.js if it changed; returns (entries, changed urls, removed urls)"""
+    root = Path(project_root)
+    output = root / SERVICE_WORKER
+    entries = precache_entries(root)
+    previous = previous_entries(output)
+    changed = [url for url, revision in entries if previous.get(url) != revision]
+    removed = sorted(set(previous) - {url for url, _ in entries})
+
+    script = render_service_worker(entries, root)
+    if not dry_run and (not output.exists() or output.read_text(encoding='utf-8') != script):
+        output.write_text(script, encoding='utf-8')
+    return entries, changed, removed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Generate the precaching service worker')
+    parser.add_argument('--dry-run', action='store_true', help='Report changes without writing sw.js')
+    args = parser.parse_args()
+
+    entries, changed, removed = build_service_worker(PROJECT_ROOT, args.dry_run)
+    total_kb = sum((PROJECT_ROOT / url).stat().st_size for url, _ in entries) / 1024
+
+    print("🛰️  Service worker")
+    for url in changed:
+        print(f"  • {url}")
+    for url in removed:
+        print(f"  ✗ {url}")
+
+    print("\n" + "="*60)
+    print(f"✅ {len(entries)} precached entries ({total_kb:.0f} KB), "
+          f"{len(changed)} changed, {len(removed)} removed")
+    if args.dry_run:
+        print("   (dry run, sw.js not written)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+"""
+Optimize the logo/icon SVGs used by the site and pack them into one sprite.
+Each SVG has editor metadata stripped, coordinates rounded and redundant
+groups collapsed, then becomes a <symbol> in assets/sprite.svg that pages
+reference with <use href="assets/sprite.svg#logo-NAME">. Optimized symbols
+are cached by source hash in .cache/svg_sprite.json, so only changed files
+are re-optimized. Symbols over MAX_SYMBOL_BYTES (raster-like traces such as
+the Linux penguin) stay separate files: inlined in the sprite, they would
+make every page that shows one small icon download them too.
+
+Usage:
+    python3 tools/build_svg_sprite.py
+    python3 tools/build_svg_sprite.py --precision 1
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SPRITE_PATH = 'assets/sprite.svg'
+CACHE_PATH = PROJECT_ROOT / '.cache' / 'svg_sprite.json'
+
+# Source directory -> symbol id prefix
+SYMBOL_SOURCES = {
+    'assets/logos': 'logo',
+    'assets/icons': 'icon',
+}
+
+SVG_NS = 'http://www.w3.org/2000/svg'
+XLINK_NS = 'http://www.w3.org/1999/xlink'
+
+# Optimized symbols larger than this are left out of the sprite; pages show them
+# with <img src="assets/logos/NAME.svg" loading="lazy"> instead
+MAX_SYMBOL_BYTES = 16 * 1024
+
+# Bump when optimize_symbol's output changes so cached symbols are rebuilt
+OPTIMIZER_VERSION = 2
+
+# Elements that never render
+DROP_ELEMENTS = {'metadata', 'title', 'desc'}
+
+# Root <svg> attributes that are not carried over to the <symbol>
+ROOT_ONLY_ATTRS = {'version', 'width', 'height', 'viewBox', 'x', 'y', 'id', 'class',
+                   'preserveAspectRatio', 'enable-background'}
+
+# Attributes whose numbers are rounded
+NUMERIC_ATTRS = {'d', 'points', 'transform', 'x', 'y', 'x1', 'y1', 'x2', 'y2', 'cx', 'cy',
+                 'r', 'rx', 'ry', 'fx', 'fy', 'width', 'height', 'stroke-width',
+                 'gradientTransform', 'patternTransform', 'stdDeviation'}
+
+# Group attributes that change meaning when moved onto a transformed child
+SPACE_DEPENDENT_ATTRS = {'clip-path', 'mask', 'filter'}
+
+NUMBER = re.compile(r'-?(?:\d+\.\d+|\.\d+)(?:[eE][-+]?\d+)?')
+URL_REF = re.compile(r'url\(#([^)]+)\)')
+CLASS_SELECTOR = re.compile(r'\.([A-Za-z_][\w-]*)')
+
+
+def local_name(tag):
+    return tag.rsplit('}', 1)[-1]
+
+
+def namespace(tag):
+    return tag[1:].split('}', 1)[0] if tag.startswith('{') else SVG_NS
+
+
+def round_numbers(value, precision):
+    """Round every decimal number in an attribute value"""
+    def shorten(match):
+        number = round(float(match.group()), precision)
+        text = f'{number:.{precision}f}'.rstrip('0').rstrip('.') if precision else str(int(number))
+        if text in ('-0', ''):
+            text = '0'
+        # 0.5 -> .5, -0.5 -> -.5
+        elif text.lstrip('-').startswith('0.'):
+            text = text.replace('0.', '.', 1)
+        # Compact paths run decimals together ("10.004.5" is 10.004 then .5); an
+        # integer result needs a separator or it swallows the next number's point
+        if '.' not in text and value[match.end():match.end() + 1] == '.':
+            text += ' '
+        return text
+    return NUMBER.sub(shorten, value)
+
+
+def clean_element(elem, precision):
+    """Strip foreign-namespace nodes/attributes and round coordinates, in place"""
+    for child in list(elem):
+        if not isinstance(child.tag, str) or namespace(child.tag) != SVG_NS or local_name(child.tag) in DROP_ELEMENTS:
+            elem.remove(child)
+        else:
+            clean_element(child, precision)
+
+    if local_name(elem.tag) == 'style':
+        elem.attrib.pop('type', None)
+        if elem.text:
+            elem.text = re.sub(r'\s+', ' ', elem.text).strip()
+
+    for key in list(elem.attrib):
+        value = elem.attrib.pop(key)
+        if key.startswith('{'):
+            # Keep xlink:href as plain href; drop sodipodi/inkscape/xml attributes
+            if key == f'{{{XLINK_NS}}}href':
+                elem.attrib['href'] = value
+            continue
+        if key in NUMERIC_ATTRS:
+            value = round_numbers(value, precision)
+        elif key == 'style':
+            # Illustrator's enable-background is ignored by browsers
+            value = ';'.join(d for d in value.split(';') if d.strip() and 'enable-background' not in d)
+            if not value:
+                continue
+        elem.attrib[key] = value
+
+
+def collapse_groups(elem):
+    """Unwrap attribute-less groups and merge single-child groups into the child"""
+    for child in list(elem):
+        collapse_groups(child)
+
+    index = 0
+    while index < len(elem):
+        child = elem[index]
+        name = local_name(child.tag)
+        if name in ('g', 'defs') and len(child) == 0:
+            elem.remove(child)
+            continue
+        if name == 'g' and not child.attrib:
+            elem.remove(child)
+            for offset, grandchild in enumerate(list(child)):
+                elem.insert(index + offset, grandchild)
+            continue
+        if name == 'g' and len(child) == 1 and 'id' not in child.attrib:
+            only = child[0]
+            conflict = set(child.attrib) & set(only.attrib)
+            moves_space = 'transform' in only.attrib and set(child.attrib) & SPACE_DEPENDENT_ATTRS
+            if not conflict and not moves_space:
+                only.attrib.update(child.attrib)
+                elem.remove(child)
+                elem.insert(index, only)
+                continue
+        index += 1
+
+
+def prefix_ids(root, prefix):
+    """Rename ids and CSS classes to short names unique within the sprite"""
+    ids = [e.attrib['id'] for e in root.iter() if 'id' in e.attrib]
+    mapping = {old: f'{prefix}-{index:x}' for index, old in enumerate(dict.fromkeys(ids))}
+    class_names = {}
+    for elem in root.iter():
+        names = elem.attrib.get('class', '').split()
+        if local_name(elem.tag) == 'style' and elem.text:
+            names += CLASS_SELECTOR.findall(elem.text)
+        for name in names:
+            class_names.setdefault(name, f'{prefix}-c{len(class_names):x}')
+
+    for elem in root.iter():
+        for key, value in list(elem.attrib.items()):
+            if key == 'id':
+                elem.attrib[key] = mapping[value]
+            elif key == 'href' and value.startswith('#') and value[1:] in mapping:
+                elem.attrib[key] = '#' + mapping[value[1:]]
+            elif key == 'class':
+                elem.attrib[key] = ' '.join(class_names[c] for c in value.split())
+            elif 'url(#' in value:
+                elem.attrib[key] = URL_REF.sub(lambda m: f'url(#{mapping.get(m.group(1), m.group(1))})', value)
+
+    for elem in root.iter(f'{{{SVG_NS}}}style'):
+        if elem.text:
+            text = URL_REF.sub(lambda m: f'url(#{mapping.get(m.group(1), m.group(1))})', elem.text)
+            elem.text = CLASS_SELECTOR.sub(
+                lambda m: f'.{class_names[m.group(1)]}' if m.group(1) in class_names else m.group(), text)
+
+
+def escape(text, quote=False):
+    text = text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+    return text.replace('"', '&quot;') if quote else text
+
+
+def serialize(elem, tag=None):
+    """Compact serialization using local (unprefixed) SVG names"""
+    name = tag or local_name(elem.tag)
+    attrs = ''.join(f' {key}="{escape(value, True)}"' for key, value in elem.attrib.items())
+    inner = escape(elem.text.strip()) if elem.text and elem.text.strip() else ''
+    inner += ''.join(serialize(child) for child in elem)
+    return f'<{name}{attrs}>{inner}</{name}>' if inner else f'<{name}{attrs}/>'
+
+
+def optimize_symbol(source, symbol_id, precision=2):
+    """Return the optimized <symbol> markup for one SVG document"""
+    root = ET.fromstring(source)
+    if local_name(root.tag) != 'svg':
+        raise ValueError('root element is not <svg>')
+
+    view_box = root.attrib.get('viewBox')
+    if not view_box:
+        width = re.sub(r'[a-z%]+$', '', root.attrib.get('width', ''))
+        height = re.sub(r'[a-z%]+$', '', root.attrib.get('height', ''))
+        if not width or not height:
+            raise ValueError('missing viewBox and width/height')
+        view_box = f'0 0 {width} {height}'
+
+    clean_element(root, precision)
+    collapse_groups(root)
+    prefix_ids(root, symbol_id)
+
+    # Presentation attributes on the root (fill, stroke, ...) move onto the symbol
+    symbol = ET.Element('symbol', {'id': symbol_id, 'viewBox': view_box})
+    for key, value in root.attrib.items():
+        if key not in ROOT_ONLY_ATTRS:
+            symbol.attrib[key] = value
+    symbol.extend(list(root))
+    return serialize(symbol)
+
+
+def used_symbols(project_root=PROJECT_ROOT):
+    """(symbol ids pages reference via the sprite, symbol ids they reference by raw SVG path)"""
+    in_sprite, as_file = set(), set()
+    for page in Path(project_root).rglob('*.html'):
+        html = page.read_text(encoding='utf-8')
+        in_sprite.update(re.findall(re.escape(SPRITE_PATH) + r'#([\w-]+)', html))
+        for directory, prefix in SYMBOL_SOURCES.items():
+            for name in re.findall(re.escape(directory) + r'/([\w-]+)\.svg', html):
+                as_file.add(f'{prefix}-{name}')
+    return in_sprite, as_file
+
+
+def build(project_root=PROJECT_ROOT, precision=2, cache_path=CACHE_PATH, max_bytes=MAX_SYMBOL_BYTES):
+    """Rebuild the sprite; returns (report rows, errors, sprite bytes)
+
+    Each row is (source, original bytes, optimized bytes, reused from cache, in sprite).
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        cache = {}
+
+    in_sprite, as_file = used_symbols(project_root)
+    used = in_sprite | as_file
+    rows, errors, symbols = [], [], []
+
+    for directory, prefix in SYMBOL_SOURCES.items():
+        for path in sorted((Path(project_root) / directory).glob('*.svg')):
+            symbol_id = f'{prefix}-{path.stem}'
+            if symbol_id not in used:
+                continue
+            data = path.read_bytes()
+            key = f'{directory}/{path.name}'
+            digest = hashlib.sha256(data + f'|{precision}|{OPTIMIZER_VERSION}'.encode()).hexdigest()
+            entry = cache.get(key)
+            reused = bool(entry and entry['hash'] == digest)
+            if not reused:
+                try:
+                    markup = optimize_symbol(data, symbol_id, precision)
+                except (ET.ParseError, ValueError) as e:
+                    errors.append((key, str(e)))
+                    continue
+                entry = {'hash': digest, 'symbol': markup, 'original_bytes': len(data),
+                         'optimized_bytes': len(markup.encode('utf-8'))}
+                cache[key] = entry
+            oversized = entry['optimized_bytes'] > max_bytes
+            if oversized and symbol_id in in_sprite:
+                errors.append((key, f"{entry['optimized_bytes'] / 1024:.1f} KB is over the "
+                                    f"{max_bytes / 1024:.0f} KB symbol cap; use <img src=\"{key}\" loading=\"lazy\">"))
+            if not oversized:
+                symbols.append(entry['symbol'])
+            rows.append((key, entry['original_bytes'], entry['optimized_bytes'], reused, not oversized))
+
+    sprite = f'<svg xmlns="{SVG_NS}">' + ''.join(symbols) + '</svg>\n'
+    sprite_path = Path(project_root) / SPRITE_PATH
+    if not sprite_path.exists() or sprite_path.read_text(encoding='utf-8') != sprite:
+        sprite_path.write_text(sprite, encoding='utf-8')
+
+    Path(cache_path).parent.mkdir(parents=True, exist_ok=True)
+    with open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(cache, f, indent=2)
+
+    return rows, errors, len(sprite.encode('utf-8'))
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build the optimized SVG symbol sprite')
+    parser.add_argument('--precision', type=int, default=2, help='Decimal places kept in coordinates')
+    args = parser.parse_args()
+
+    rows, errors, sprite_bytes = build(PROJECT_ROOT, args.precision)
+
+    print("🎨 SVG sprite")
+    for key, original, optimized, reused, packed in rows:
+        saved = 100 * (1 - optimized / original) if original else 0
+        note = ' (cached)' if reused else ''
+        note += '' if packed else ' (too large, kept as a file)'
+        print(f"  • {key}: {original / 1024:.1f} KB → {optimized / 1024:.1f} KB (-{saved:.0f}%){note}")
+
+    packed = [row for row in rows if row[4]]
+    total_original = sum(row[1] for row in packed)
+    print("\n" + "="*60)
+    print(f"✅ {len(packed)} symbols: {total_original / 1024:.1f} KB in {len(packed)} files → "
+          f"{sprite_bytes / 1024:.1f} KB in 1 sprite")
+    print(f"📄 Sprite: {PROJECT_ROOT / SPRITE_PATH}")
+
+    if errors:
+        print(f"❌ {len(errors)} SVG(s) could not be used from the sprite:")
+        for key, error in errors:
+            print(f"   - {key}: {error}")
+        return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Streaming pieces for writing certificates.json at constant memory.
+
+Entries flow from the source (iter_yaml_entries() for certificates.yaml, a
+directory scan for generate_certificates.py) through validation into a
+CertificateSink, which keeps each category's entries in a sorter. When more
+than SPILL_THRESHOLD entries are buffered, the largest buffer is sorted and
+spilled to a temporary run file; each category is then produced by a merge
+of its runs. The sink writes the JSON incrementally, in exactly the layout
+json.dump(indent=2, ensure_ascii=False) gives the same nested dict, so small
+inputs produce byte-identical files. The PDF and thumbnail manifests the
+generators read are still loaded whole.
+"""
+
+import heapq
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import yaml
+
+# Entries held in memory across all categories before a sorted run is spilled
+SPILL_THRESHOLD = 50000
+INDENT = 2
+
+
+def iter_yaml_entries(yaml_path, list_key, other=None):
+    """Yield the items of a top-level list in a YAML file one at a time
+
+    Each item is composed and constructed on its own, so the whole list is
+    never in memory. The other top-level values are stored in `other` as they
+    are read; keys after the list are only there once the generator is done.
+    """
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        loader = yaml.SafeLoader(f)
+        try:
+            loader.get_event()  # StreamStart
+            if loader.check_event(yaml.StreamEndEvent):
+                return
+            loader.get_event()  # DocumentStart
+            if not loader.check_event(yaml.MappingStartEvent):
+                return
+            loader.get_event()
+            while not loader.check_event(yaml.MappingEndEvent):
+                key = loader.construct_document(loader.compose_node(None, None))
+                if key == list_key and loader.check_event(yaml.SequenceStartEvent):
+                    loader.get_event()
+                    while not loader.check_event(yaml.SequenceEndEvent):
+                        yield loader.construct_document(loader.compose_node(None, None))
+                    loader.get_event()
+                else:
+                    value = loader.construct_document(loader.compose_node(None, None))
+                    if other is not None:
+                        other[key] = value
+        finally:
+            loader.dispose()
+
+
+class Sorter:
+    """Entries of one category in order of (key, arrival), spilling sorted runs to disk
+
+    With reverse=True keys sort descending while entries with equal keys keep
+    their arrival order, matching list.sort(key=..., reverse=True).
+    """
+
+    def __init__(self, reverse, tmp_dir):
+        self.reverse = reverse
+        self.tmp_dir = tmp_dir
+        self.buffer = []
+        self.runs = []
+        self.count = 0
+
+    def order(self, record):
+        return (record[0], -record[1]) if self.reverse else (record[0], record[1])
+
+    def add(self, key, seq, entry):
+        self.buffer.append((key, seq, entry))
+        self.count += 1
+
+    def spill(self):
+        self.buffer.sort(key=self.order, reverse=self.reverse)
+        fd, path = tempfile.mkstemp(suffix='.jsonl', dir=self.tmp_dir)
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            for record in self.buffer:
+                f.write(json.dumps(record, ensure_ascii=False) + '\n')
+        self.runs.append(path)
+        self.buffer = []
+
+    @staticmethod
+    def read_run(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                yield tuple(json.loads(line))
+
+    def __iter__(self):
+        """(seq, entry) in sorted order"""
+        self.buffer.sort(key=self.order, reverse=self.reverse)
+        if not self.runs:
+            records = iter(self.buffer)
+        else:
+            records = heapq.merge(self.buffer, *(self.read_run(path) for path in self.runs),
+                                  key=self.order, reverse=self.reverse)
+        for _, seq, entry in records:
+            yield seq, entry
+
+
+class CertificateSink:
+    """Collects entries per category and writes the certificates.json layout
+
+    sort_key(entry) orders each category's certificates (descending with
+    reverse=True); categories keep the order their first entry arrived in.
+    """
+
+    def __init__(self, sort_key, reverse=False, spill_threshold=SPILL_THRESHOLD):
+        self.sort_key = sort_key
+        self.reverse = reverse
+        self.spill_threshold = spill_threshold
+        self.tmp = tempfile.TemporaryDirectory(prefix='certificates-')
+        self.sorters = {}
+        self.buffered = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.tmp.cleanup()
+
+    @property
+    def categories(self):
+        return list(self.sorters)
+
+    @property
+    def spilled_runs(self):
+        return sum(len(sorter.runs) for sorter in self.sorters.values())
+
+    def add(self, category, entry, seq):
+        sorter = self.sorters.get(category)
+        if sorter is None:
+            sorter = self.sorters[category] = Sorter(self.reverse, self.tmp.name)
+        sorter.add(self.sort_key(entry), seq, entry)
+        self.buffered += 1
+        if self.buffered > self.spill_threshold:
+            largest = max(self.sorters.values(), key=lambda s: len(s.buffer))
+            self.buffered -= len(largest.buffer)
+            largest.spill()
+
+    def drop(self, category):
+        """Remove a category; returns the seq of each of its entries"""
+        sorter = self.sorters.pop(category)
+        self.buffered -= len(sorter.buffer)
+        return [seq for seq, _ in sorter]
+
+    def summary(self, header):
+        """{'total_count', 'categories': {category: {**header(category), 'count'}}}"""
+        return {
+            'total_count': sum(sorter.count for sorter in self.sorters.values()),
+            'categories': {category: {**header(category), 'count': sorter.count}
+                           for category, sorter in self.sorters.items()},
+        }
+
+    def write(self, path, last_updated, header):
+        """Write the JSON to path; header(category) gives the fields before 'count'"""
+        summary = self.summary(header)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write('{\n')
+            f.write(f'  "last_updated": {encode(last_updated, 1)},\n')
+            f.write(f'  "total_count": {summary["total_count"]},\n')
+            if not self.sorters:
+                f.write('  "categories": {}\n}')
+                return
+            f.write('  "categories": {\n')
+            for position, (category, sorter) in enumerate(self.sorters.items()):
+                fields = summary['categories'][category]
+                f.write(f'    {encode(category, 2)}: {{\n')
+                for name, value in fields.items():
+                    f.write(f'      {encode(name, 3)}: {encode(value, 3)},\n')
+                f.write('      "certificates": [\n')
+                for index, (_, entry) in enumerate(sorter):
+                    f.write(('        ' if index == 0 else ',\n        ') + encode(entry, 4))
+                f.write('\n      ]\n    }')
+                f.write(',\n' if position < len(self.sorters) - 1 else '\n')
+            f.write('  }\n}')
+
+
+def encode(value, level):
+    """JSON for a value nested `level` deep, as json.dump(indent=2) lays it out"""
+    return json.dumps(value, indent=INDENT, ensure_ascii=False).replace('\n', '\n' + ' ' * (INDENT * level))
+
+
+def temporary_output(path):
+    """A temp file next to path, for writing before an atomic replace"""
+    fd, tmp_path = tempfile.mkstemp(prefix=Path(path).name + '.', suffix='.tmp', dir=Path(path).parent)
+    os.close(fd)
+    return tmp_path
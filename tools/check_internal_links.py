@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Check internal links, anchors and asset paths across the whole site.
+Every HTML page is parsed once to build an in-memory index of pages, element
+ids and asset files; all hrefs, srcs, nav targets, anchors and JSON asset
+paths are then resolved against that index.
+
+Usage:
+    python3 tools/check_internal_links.py
+"""
+
+import json
+import os
+import posixpath
+import sys
+import time
+from collections import defaultdict
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Directories that are never part of the published site
+SKIP_DIRS = {'.git', '.github', '.cache', 'tools', 'node_modules', '__pycache__'}
+
+# Elements rendered by scripts.js from JSON data: if a page contains the
+# container id, the listed ids or links exist at runtime for every category key.
+DYNAMIC_IDS = {
+    'certificates-list': ('assets/certificates.json', 'cert-category-{key}'),
+}
+DYNAMIC_LINKS = {
+    'certificates-summary-home': ('assets/certificates.json', 'certifications.html#cert-category-{key}'),
+}
+
+# JSON data files and the fields in them that point at site files
+JSON_ASSET_FIELDS = {
+    'assets/certificates.json': ('certificates', ['path']),
+    'assets/badge_certifications.json': ('certifications', ['badge_path']),
+}
+
+
+class PageParser(HTMLParser):
+    """Collect element ids and internal references from one page"""
+
+    def __init__(self):
+        super().__init__()
+        self.ids = set()
+        self.refs = []
+        self.in_nav_select = False
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if attrs.get('id'):
+            self.ids.add(attrs['id'])
+        if attrs.get('name') and tag == 'a':
+            self.ids.add(attrs['name'])
+        for attr in ('href', 'src'):
+            if attrs.get(attr):
+                self.refs.append((attrs[attr], self.getpos()[0]))
+        if tag == 'select' and attrs.get('id') == 'mobile-nav':
+            self.in_nav_select = True
+        elif tag == 'option' and self.in_nav_select and attrs.get('value'):
+            self.refs.append((attrs['value'], self.getpos()[0]))
+
+    def handle_endtag(self, tag):
+        if tag == 'select':
+            self.in_nav_select = False
+
+
+class SiteIndex:
+    """In-memory index of site files, pages and the ids each page defines"""
+
+    def __init__(self, project_root=PROJECT_ROOT):
+        self.root = Path(project_root)
+        self.files = set()
+        self.pages = {}
+        self.ids = {}
+        self.json_cache = {}
+
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, self.root).replace(os.sep, '/')
+            for filename in filenames:
+                rel = filename if rel_dir == '.' else f'{rel_dir}/{filename}'
+                self.files.add(rel)
+
+        for rel in sorted(f for f in self.files if f.endswith('.html')):
+            parser = PageParser()
+            parser.feed((self.root / rel).read_text(encoding='utf-8'))
+            self.pages[rel] = parser
+            self.ids[rel] = set(parser.ids)
+
+        # Ids and links that scripts.js creates from JSON data
+        for page, parser in self.pages.items():
+            for container, (data_file, template) in DYNAMIC_IDS.items():
+                if container in parser.ids:
+                    self.ids[page].update(template.format(key=key) for key in self.category_keys(data_file))
+            for container, (data_file, template) in DYNAMIC_LINKS.items():
+                if container in parser.ids:
+                    parser.refs.extend((template.format(key=key), 0) for key in self.category_keys(data_file))
+
+    def load_json(self, rel):
+        if rel not in self.json_cache:
+            try:
+                with open(self.root / rel, 'r', encoding='utf-8') as f:
+                    self.json_cache[rel] = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.json_cache[rel] = {}
+        return self.json_cache[rel]
+
+    def category_keys(self, data_file):
+        return list(self.load_json(data_file).get('categories', {}))
+
+    def resolve(self, ref, base_page):
+        """Return (target file, fragment) for an internal ref, or None if external"""
+        parts = urlsplit(ref)
+        if parts.scheme or parts.netloc or ref.startswith(('//', 'data:', 'javascript:')):
+            return None
+        path = unquote(parts.path)
+        if not path:
+            return base_page, parts.fragment
+        if path.startswith('/'):
+            target = path.lstrip('/')
+        else:
+            target = posixpath.normpath(posixpath.join(posixpath.dirname(base_page), path))
+        if target.endswith('/') or target == '.' or (target not in self.files and f'{target}/index.html' in self.files):
+            target = posixpath.join(target.rstrip('/').lstrip('.'), 'index.html').lstrip('/')
+        return target, parts.fragment
+
+    def check_ref(self, ref, base_page):
+        """Return an error message for a broken internal ref, or None"""
+        resolved = self.resolve(ref, base_page)
+        if resolved is None:
+            return None
+        target, fragment = resolved
+        if target not in self.files:
+            return 'missing file' if target == ref else f'missing file: {target}'
+        if fragment and target in self.ids and unquote(fragment) not in self.ids[target]:
+            return f'missing anchor: #{fragment} in {target}'
+        return None
+
+
+def json_asset_refs(index):
+    """Yield (source, asset path) pairs from the generated JSON data files"""
+    for data_file, (list_key, fields) in JSON_ASSET_FIELDS.items():
+        for category in index.load_json(data_file).get('categories', {}).values():
+            for entry in category.get(list_key, []):
+                for field in fields:
+                    if entry.get(field):
+                        yield data_file, entry[field]
+
+    for data_file in ['assets/medium_posts.json'] + sorted(
+            f for f in index.files if f.startswith('assets/medium/page-')):
+        for post in index.load_json(data_file).get('posts', []):
+            cover = post.get('cover') or {}
+            if cover.get('src'):
+                yield data_file, cover['src']
+
+
+def check_site(index):
+    """Return a dict of source -> list of (line, ref, error)"""
+    problems = defaultdict(list)
+    for page, parser in index.pages.items():
+        for ref, line in parser.refs:
+            error = index.check_ref(ref, page)
+            if error:
+                problems[page].append((line, ref, error))
+    for source, path in json_asset_refs(index):
+        error = index.check_ref(path, '')
+        if error:
+            problems[source].append((0, path, error))
+    return problems
+
+
+def main():
+    start = time.perf_counter()
+    index = SiteIndex(PROJECT_ROOT)
+    problems = check_site(index)
+    elapsed = time.perf_counter() - start
+
+    ref_count = sum(len(parser.refs) for parser in index.pages.values())
+    print("\n" + "="*60)
+    print("🧭 Internal Link Check Summary")
+    print("="*60)
+    print(f"📄 Pages: {len(index.pages)}")
+    print(f"📁 Files indexed: {len(index.files)}")
+    print(f"🔗 Page references: {ref_count}")
+    print(f"⏱️  Checked in {elapsed * 1000:.0f} ms")
+
+    if not problems:
+        print("✅ No broken internal references")
+        return 0
+
+    total = sum(len(items) for items in problems.values())
+    print(f"❌ Broken references: {total}")
+    for source, items in sorted(problems.items()):
+        print(f"\n   {source}")
+        for line, ref, error in items:
+            location = f"line {line}: " if line else ''
+            print(f"     - {location}{ref} ({error})")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,200 @@
+#!/usr/bin/env python3
+"""
+Verify that outbound links used by the portfolio still resolve.
+Collects URLs from the YAML configs, the generated JSON data files and the
+HTML pages, then checks them concurrently with asyncio. Results are cached
+in .cache/link_check.json so re-runs only check URLs whose result is stale.
+
+Usage:
+    python3 tools/check_links.py                   # check stale URLs
+    python3 tools/check_links.py --ttl-hours 0     # re-check everything
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import time
+import urllib.error
+import urllib.request
+import yaml
+from collections import defaultdict
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import urljoin, urlparse
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_PATH = PROJECT_ROOT / '.cache' / 'link_check.json'
+SITE_URL = 'https://vijayrmourya.github.io/'
+USER_AGENT = 'Mozilla/5.0 (compatible; portfolio-link-check)'
+
+# Statuses where a HEAD request is worth retrying as GET
+HEAD_FALLBACK_STATUSES = {400, 403, 404, 405, 429, 500, 501, 503}
+
+
+class ExternalLinkParser(HTMLParser):
+    """Collect absolute http(s) URLs from href and src attributes"""
+
+    def __init__(self):
+        super().__init__()
+        self.urls = []
+
+    def handle_starttag(self, tag, attrs):
+        for name, value in attrs:
+            if name in ('href', 'src') and value and value.startswith(('http://', 'https://')):
+                self.urls.append(value)
+
+
+def load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+
+
+def collect_urls(project_root=PROJECT_ROOT, site_url=SITE_URL):
+    """Return a dict of URL -> sorted list of files that reference it"""
+    sources = defaultdict(set)
+
+    def add(url, source):
+        if url and url.startswith(('http://', 'https://')) and 'YOUR-' not in url:
+            sources[url].add(source)
+
+    tools_dir = project_root / 'tools'
+    for yaml_name, key in [('certificates.yaml', 'certificates'),
+                           ('badge_certifications.yaml', 'certifications')]:
+        try:
+            with open(tools_dir / yaml_name, 'r', encoding='utf-8') as f:
+                config = yaml.safe_load(f) or {}
+        except FileNotFoundError:
+            continue
+        for entry in config.get(key, []):
+            add(entry.get('verification_url'), f'tools/{yaml_name}')
+
+    # Site-relative asset paths are checked against the deployed site
+    assets = project_root / 'assets'
+    certificates = load_json(assets / 'certificates.json', {})
+    for category in certificates.get('categories', {}).values():
+        for cert in category.get('certificates', []):
+            add(cert.get('verification_url'), 'assets/certificates.json')
+            if cert.get('path'):
+                add(urljoin(site_url, cert['path']), 'assets/certificates.json')
+
+    badges = load_json(assets / 'badge_certifications.json', {})
+    for category in badges.get('categories', {}).values():
+        for cert in category.get('certifications', []):
+            add(cert.get('verification_url'), 'assets/badge_certifications.json')
+
+    posts = load_json(assets / 'medium_posts.json', {})
+    for post in posts.get('posts', []):
+        add(post.get('link'), 'assets/medium_posts.json')
+    for page_path in sorted((assets / 'medium').glob('page-*.json')):
+        for post in load_json(page_path, {}).get('posts', []):
+            add(post.get('link'), f'assets/medium/{page_path.name}')
+
+    for html_path in sorted(project_root.glob('*.html')):
+        parser = ExternalLinkParser()
+        parser.feed(html_path.read_text(encoding='utf-8'))
+        for url in parser.urls:
+            add(url, html_path.name)
+
+    return {url: sorted(files) for url, files in sources.items()}
+
+
+def request_status(url, method, timeout):
+    """Perform one blocking request and return (status, error message)"""
+    request = urllib.request.Request(url, method=method, headers={'User-Agent': USER_AGENT})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            if method == 'GET':
+                response.read(1024)
+            return response.status, None
+    except urllib.error.HTTPError as e:
+        return e.code, None
+    except (OSError, ValueError) as e:
+        return None, str(getattr(e, 'reason', e))
+
+
+async def check_url(url, host_limits, global_limit, timeout):
+    """Check one URL with HEAD, falling back to GET when HEAD is refused"""
+    # Host slot first: URLs queued behind a busy host must not hold global slots other hosts could use
+    async with host_limits[urlparse(url).netloc], global_limit:
+        status, error = await asyncio.to_thread(request_status, url, 'HEAD', timeout)
+        method = 'HEAD'
+        if status is None or status in HEAD_FALLBACK_STATUSES:
+            status, error = await asyncio.to_thread(request_status, url, 'GET', timeout)
+            method = 'GET'
+    return url, {
+        'ok': status is not None and status < 400,
+        'status': status,
+        'error': error,
+        'method': method,
+        'checked_at': time.time()
+    }
+
+
+async def check_urls(urls, per_host=2, total=16, timeout=15):
+    """Check URLs concurrently, bounded globally and per host"""
+    host_limits = defaultdict(lambda: asyncio.Semaphore(per_host))
+    global_limit = asyncio.Semaphore(total)
+    results = await asyncio.gather(*[check_url(url, host_limits, global_limit, timeout) for url in urls])
+    return dict(results)
+
+
+def stale_urls(urls, cache, ttl_seconds, now=None):
+    """URLs with no cached result, an expired result, or a failed result"""
+    now = now or time.time()
+    stale = []
+    for url in urls:
+        entry = cache.get(url)
+        if not entry or not entry.get('ok') or now - entry.get('checked_at', 0) > ttl_seconds:
+            stale.append(url)
+    return stale
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check outbound portfolio links')
+    parser.add_argument('--ttl-hours', type=float, default=24 * 7,
+                        help='Re-check passing URLs older than this (default: 168)')
+    parser.add_argument('--per-host', type=int, default=2, help='Concurrent requests per host')
+    parser.add_argument('--concurrency', type=int, default=16, help='Concurrent requests overall')
+    parser.add_argument('--timeout', type=float, default=15, help='Per-request timeout in seconds')
+    parser.add_argument('--site-url', default=SITE_URL, help='Base URL for site-relative asset paths')
+    parser.add_argument('--cache', type=Path, default=CACHE_PATH, help='Result cache file')
+    args = parser.parse_args()
+
+    print("🔗 Collecting outbound links...")
+    sources = collect_urls(site_url=args.site_url)
+    cache = load_json(args.cache, {})
+    stale = stale_urls(sources, cache, args.ttl_hours * 3600)
+    print(f"📄 {len(sources)} unique URLs, {len(stale)} need checking")
+
+    if stale:
+        start = time.perf_counter()
+        cache.update(asyncio.run(check_urls(stale, args.per_host, args.concurrency, args.timeout)))
+        print(f"⏱️  Checked {len(stale)} URLs in {time.perf_counter() - start:.2f}s")
+        args.cache.parent.mkdir(parents=True, exist_ok=True)
+        with open(args.cache, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, indent=2, ensure_ascii=False)
+
+    broken = {url: cache[url] for url in sources if not cache[url]['ok']}
+
+    print("\n" + "="*60)
+    print("🔗 Link Check Summary")
+    print("="*60)
+    print(f"✅ OK: {len(sources) - len(broken)}")
+    if broken:
+        print(f"❌ Broken: {len(broken)}")
+        for url, result in sorted(broken.items()):
+            reason = result['status'] or result['error']
+            print(f"\n   - {url} ({reason})")
+            for source in sources[url]:
+                print(f"       referenced in {source}")
+        return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
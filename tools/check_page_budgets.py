@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Measure what every page costs to load and check it against budgets.
+Each page's dependency graph comes from page_graph.py (CSS, JS, images and
+the JSON scripts.js fetches). Total and critical-path sizes are computed raw
+and compressed, checked against tools/page_budgets.yaml, and written to a JSON
+report with deltas from the previous run and the biggest offenders.
+
+Usage:
+    python3 tools/check_page_budgets.py
+    python3 tools/check_page_budgets.py --report build/page_budgets.json
+"""
+
+import argparse
+import gzip
+import json
+import sys
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+import yaml
+
+from page_graph import PageGraph
+
+try:
+    import brotli
+except ImportError:  # gzip sizes are used when brotli isn't installed
+    brotli = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+BUDGETS_PATH = PROJECT_ROOT / 'tools' / 'page_budgets.yaml'
+REPORT_PATH = PROJECT_ROOT / '.cache' / 'page_budget_report.json'
+
+# Served compressed by the host; everything else is sent as-is
+TEXT_EXTENSIONS = {'.html', '.css', '.js', '.json', '.svg', '.txt', '.xml'}
+
+# Budget key -> report metric
+BUDGET_METRICS = {
+    'total_kb': 'total_transfer',
+    'total_raw_kb': 'total_bytes',
+    'critical_kb': 'critical_transfer',
+    'critical_raw_kb': 'critical_bytes',
+    'requests': 'requests',
+}
+
+TOP_OFFENDERS = 5
+
+
+class SizeCache:
+    """Raw and transfer size of each site file, measured once per run"""
+
+    def __init__(self, project_root):
+        self.root = Path(project_root)
+        self.sizes = {}
+
+    def get(self, path):
+        """(raw bytes, transfer bytes), or None if the file is missing"""
+        if path not in self.sizes:
+            try:
+                data = (self.root / path).read_bytes()
+            except (FileNotFoundError, IsADirectoryError):
+                self.sizes[path] = None
+                return None
+            transfer = len(data)
+            if Path(path).suffix.lower() in TEXT_EXTENSIONS:
+                transfer = min(transfer, len(gzip.compress(data, 9, mtime=0)))
+                if brotli is not None:
+                    transfer = min(transfer, len(brotli.compress(data, quality=11)))
+            self.sizes[path] = (len(data), transfer)
+        return self.sizes[path]
+
+
+def load_budgets(budgets_path=BUDGETS_PATH):
+    with open(budgets_path, 'r', encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+    return config.get('default') or {}, config.get('pages') or {}
+
+
+def load_report(report_path):
+    try:
+        with open(report_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'pages': {}}
+
+
+def measure_page(graph, sizes, page):
+    """Size metrics and per-asset breakdown for one page"""
+    metrics = {'requests': 0, 'total_bytes': 0, 'total_transfer': 0,
+               'critical_bytes': 0, 'critical_transfer': 0, 'critical_depth': 0}
+    assets, missing = [], []
+
+    for dep in graph.dependencies(page):
+        size = sizes.get(dep.path)
+        if size is None:
+            missing.append(dep.path)
+            continue
+        raw, transfer = size
+        metrics['requests'] += 1
+        metrics['total_bytes'] += raw
+        metrics['total_transfer'] += transfer
+        if dep.critical:
+            metrics['critical_bytes'] += raw
+            metrics['critical_transfer'] += transfer
+            metrics['critical_depth'] = max(metrics['critical_depth'], dep.depth + 1)
+        assets.append({'path': dep.path, 'kind': dep.kind, 'critical': dep.critical,
+                       'bytes': raw, 'transfer': transfer})
+
+    return metrics, assets, missing
+
+
+def check_budget(metrics, budget):
+    """List of {'budget', 'limit', 'actual'} for every exceeded budget"""
+    violations = []
+    for key, limit in budget.items():
+        metric = BUDGET_METRICS.get(key)
+        if metric is None:
+            continue
+        actual = metrics[metric]
+        allowed = limit if key == 'requests' else limit * 1024
+        if actual > allowed:
+            violations.append({'budget': key, 'limit': limit, 'actual': actual})
+    return violations
+
+
+def analyze(project_root=PROJECT_ROOT, budgets_path=BUDGETS_PATH, previous=None):
+    """Build the budget report for every page"""
+    graph = PageGraph(project_root)
+    sizes = SizeCache(project_root)
+    default_budget, page_budgets = load_budgets(budgets_path)
+    previous_pages = (previous or {}).get('pages', {})
+
+    report = {'generated': datetime.now().isoformat(), 'compression': 'brotli' if brotli else 'gzip',
+              'pages': {}, 'offenders': []}
+    loaded_by = defaultdict(list)
+
+    for page in graph.pages():
+        metrics, assets, missing = measure_page(graph, sizes, page)
+        budget = {**default_budget, **page_budgets.get(page, {})}
+        old = previous_pages.get(page, {}).get('metrics')
+        report['pages'][page] = {
+            'metrics': metrics,
+            'delta': {key: value - old.get(key, 0) for key, value in metrics.items()} if old else None,
+            'budget': budget,
+            'violations': check_budget(metrics, budget),
+            'missing': missing,
+            'offenders': sorted(assets, key=lambda a: a['transfer'], reverse=True)[:TOP_OFFENDERS],
+        }
+        for asset in assets:
+            loaded_by[asset['path']].append(page)
+
+    # Site-wide: an asset costs its transfer size on every page that loads it
+    for path, pages in loaded_by.items():
+        raw, transfer = sizes.get(path)
+        report['offenders'].append({'path': path, 'bytes': raw, 'transfer': transfer,
+                                    'pages': pages, 'site_transfer': transfer * len(pages)})
+    report['offenders'].sort(key=lambda o: o['site_transfer'], reverse=True)
+    report['offenders'] = report['offenders'][:TOP_OFFENDERS * 2]
+    return report
+
+
+def kb(value):
+    return f"{value / 1024:.1f} KB"
+
+
+def signed_kb(value):
+    return f"{'+' if value >= 0 else '-'}{abs(value) / 1024:.1f} KB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Check per-page performance budgets')
+    parser.add_argument('--budgets', type=Path, default=BUDGETS_PATH, help='Budgets YAML')
+    parser.add_argument('--report', type=Path, default=REPORT_PATH, help='JSON report path')
+    args = parser.parse_args()
+
+    previous = load_report(args.report)
+    report = analyze(PROJECT_ROOT, args.budgets, previous)
+
+    print(f"📦 Page weight ({report['compression']} transfer sizes)")
+    for page, result in report['pages'].items():
+        m = result['metrics']
+        status = '❌' if result['violations'] else '✅'
+        delta = f" ({signed_kb(result['delta']['total_transfer'])})" if result['delta'] else ''
+        print(f"  {status} {page}: {m['requests']} requests, {kb(m['total_transfer'])} total{delta}, "
+              f"{kb(m['critical_transfer'])} critical ({kb(m['critical_bytes'])} raw, "
+              f"{m['critical_depth']} round trips)")
+        for v in result['violations']:
+            actual = v['actual'] if v['budget'] == 'requests' else kb(v['actual'])
+            limit = v['limit'] if v['budget'] == 'requests' else f"{v['limit']} KB"
+            print(f"       - {v['budget']}: {actual} > {limit}")
+        for path in result['missing']:
+            print(f"       - missing: {path}")
+
+    print("\n🐘 Biggest offenders (transfer size × pages loading it):")
+    for offender in report['offenders']:
+        print(f"  • {offender['path']}: {kb(offender['transfer'])} on {len(offender['pages'])} page(s) "
+              f"= {kb(offender['site_transfer'])}")
+
+    args.report.parent.mkdir(parents=True, exist_ok=True)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+
+    over = [page for page, result in report['pages'].items() if result['violations']]
+    print("\n" + "="*60)
+    print(f"📄 Report: {args.report}")
+    if over:
+        print(f"❌ {len(over)} of {len(report['pages'])} pages over budget")
+        return 1
+    print(f"✅ All {len(report['pages'])} pages within budget")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
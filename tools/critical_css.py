@@ -0,0 +1,456 @@
+#!/usr/bin/env python3
+"""
+Inline the critical part of styles.css into each page and load the rest
+asynchronously. A rule is critical when one of its selectors matches an
+element above the fold: the first FOLD_ELEMENTS elements of <body>, or
+everything before a <!-- fold --> comment if the page has one. Matching
+results are cached per page and template hash in .cache/critical_css.json.
+
+Usage:
+    python3 tools/critical_css.py                 # every page
+    python3 tools/critical_css.py index.html
+"""
+
+import argparse
+import hashlib
+import json
+import re
+import sys
+from html.parser import HTMLParser
+from pathlib import Path
+
+from page_graph import PageGraph
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_PATH = PROJECT_ROOT / '.cache' / 'critical_css.json'
+
+FOLD_ELEMENTS = 150
+FOLD_MARKER = 'fold'
+
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+                 'meta', 'source', 'track', 'wbr'}
+
+# Styles that only apply after user interaction are not needed for first paint
+DYNAMIC_PSEUDOS = {'hover', 'focus', 'active', 'visited', 'focus-visible', 'focus-within',
+                   'target', 'checked'}
+
+# At-rules whose body is a list of rules
+GROUPING_AT_RULES = ('@media', '@supports', '@layer', '@container')
+
+STYLESHEET_LINK = re.compile(r'<link rel="stylesheet" href="([^"]+\.css)"\s*/?>')
+ASYNC_STYLESHEET = re.compile(
+    r'<style id="critical-css">.*?</style>'
+    r'<link rel="stylesheet" href="([^"]+\.css)" media="print" onload="this\.media=\'all\'">'
+    r'<noscript><link rel="stylesheet" href="\1"></noscript>', re.S)
+SIMPLE_PART = re.compile(r'\*|[A-Za-z][\w-]*|\.[\w-]+|#[\w-]+|\[[^\]]*\]|::?[\w-]+(?:\((?:[^()]|\([^()]*\))*\))?')
+ATTRIBUTE = re.compile(r'''\[\s*([\w:-]+)\s*(?:([~^$*|]?=)\s*['"]?([^'"\]]*?)['"]?\s*)?\]''')
+
+
+# ============================================
+# DOM
+# ============================================
+
+class Node:
+    __slots__ = ('tag', 'attrs', 'classes', 'parent', 'children', 'above_fold')
+
+    def __init__(self, tag, attrs, parent):
+        self.tag = tag
+        self.attrs = attrs
+        self.classes = set((attrs.get('class') or '').split())
+        self.parent = parent
+        self.children = []
+        self.above_fold = False
+
+
+class DomBuilder(HTMLParser):
+    """Build a lightweight element tree and mark what is above the fold"""
+
+    def __init__(self, fold_elements=FOLD_ELEMENTS):
+        super().__init__()
+        self.root = Node('#document', {}, None)
+        self.stack = [self.root]
+        self.nodes = []
+        self.in_body = False
+        self.body_count = 0
+        self.fold_elements = fold_elements
+        self.folded = False
+
+    def handle_starttag(self, tag, attrs):
+        parent = self.stack[-1]
+        node = Node(tag, {k: v or '' for k, v in attrs}, parent)
+        parent.children.append(node)
+        self.nodes.append(node)
+
+        if tag == 'body':
+            self.in_body = True
+        if not self.in_body or tag == 'body':
+            node.above_fold = True
+        elif not self.folded:
+            self.body_count += 1
+            node.above_fold = self.body_count <= self.fold_elements
+
+        if tag not in VOID_ELEMENTS:
+            self.stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self.stack.pop()
+
+    def handle_endtag(self, tag):
+        for index in range(len(self.stack) - 1, 0, -1):
+            if self.stack[index].tag == tag:
+                del self.stack[index:]
+                break
+
+    def handle_comment(self, data):
+        if data.strip() == FOLD_MARKER:
+            self.folded = True
+            self.fold_elements = self.body_count
+
+
+def build_dom(html, fold_elements=FOLD_ELEMENTS):
+    """Parse a page; returns every element in document order"""
+    builder = DomBuilder(fold_elements)
+    builder.feed(html)
+    return builder.nodes
+
+
+# ============================================
+# CSS
+# ============================================
+
+def find_block_end(text, start):
+    """Index of the '}' closing the block that opens at text[start] == '{'"""
+    depth = 0
+    quote = None
+    for index in range(start, len(text)):
+        char = text[index]
+        if quote:
+            if char == quote:
+                quote = None
+        elif char in '"\'':
+            quote = char
+        elif char == '{':
+            depth += 1
+        elif char == '}':
+            depth -= 1
+            if depth == 0:
+                return index
+    return len(text)
+
+
+def split_top_level(text, separator=','):
+    """Split on separator outside parentheses/brackets"""
+    parts, depth, current = [], 0, ''
+    for char in text:
+        if char in '([':
+            depth += 1
+        elif char in ')]':
+            depth -= 1
+        if char == separator and depth == 0:
+            parts.append(current)
+            current = ''
+        else:
+            current += char
+    parts.append(current)
+    return [part.strip() for part in parts if part.strip()]
+
+
+def parse_css(text):
+    """Parse a stylesheet into [('rule', selectors, body) | ('group', prelude, rules) | ('at', prelude, body)]"""
+    text = re.sub(r'/\*.*?\*/', '', text, flags=re.S)
+    rules = []
+    position = 0
+    while position < len(text):
+        brace = text.find('{', position)
+        semicolon = text.find(';', position)
+        if brace == -1:
+            break
+        prelude = text[position:brace].strip()
+        if prelude.startswith('@') and semicolon != -1 and semicolon < brace:
+            # @import / @charset statements
+            rules.append(('at', text[position:semicolon].strip(), None))
+            position = semicolon + 1
+            continue
+        end = find_block_end(text, brace)
+        body = text[brace + 1:end]
+        if prelude.startswith(GROUPING_AT_RULES):
+            rules.append(('group', prelude, parse_css(body)))
+        elif prelude.startswith('@'):
+            rules.append(('at', prelude, body))
+        elif prelude:
+            rules.append(('rule', split_top_level(prelude), body))
+        position = end + 1
+    return rules
+
+
+def collapse_whitespace(text):
+    return re.sub(r'\s+', ' ', text).strip()
+
+
+def minify_body(body):
+    return re.sub(r'\s*([;:{},])\s*', r'\1', collapse_whitespace(body)).rstrip(';')
+
+
+def serialize_css(rules):
+    """Compact CSS text for parsed rules"""
+    out = []
+    for kind, prelude, body in rules:
+        if kind == 'rule':
+            out.append(f"{','.join(collapse_whitespace(s) for s in prelude)}{{{minify_body(body)}}}")
+        elif kind == 'group':
+            out.append(f"{collapse_whitespace(prelude)}{{{serialize_css(body)}}}")
+        elif body is None:
+            out.append(f'{prelude};')
+        else:
+            out.append(f"{collapse_whitespace(prelude)}{{{minify_body(body)}}}")
+    return ''.join(out)
+
+
+# ============================================
+# Selector matching
+# ============================================
+
+def parse_selector(selector):
+    """Split a complex selector into [(combinator, [simple parts])], leftmost first"""
+    compounds, combinator, position = [], ' ', 0
+    selector = selector.strip()
+    while position < len(selector):
+        if selector[position].isspace() or selector[position] in '>+~':
+            gap = re.match(r'\s*([>+~])?\s*', selector[position:])
+            combinator = gap.group(1) or ' '
+            position += gap.end()
+            continue
+        parts = []
+        while position < len(selector):
+            match = SIMPLE_PART.match(selector, position)
+            if not match:
+                break
+            parts.append(match.group())
+            position = match.end()
+        if not parts:
+            return None
+        compounds.append((combinator, parts))
+        combinator = ' '
+    return compounds
+
+
+def element_siblings(node):
+    return node.parent.children if node.parent else [node]
+
+
+def match_part(node, part):
+    """True/False for one simple selector; None for an interaction-only pseudo-class"""
+    if part == '*':
+        return True
+    if part.startswith('.'):
+        return part[1:] in node.classes
+    if part.startswith('#'):
+        return node.attrs.get('id') == part[1:]
+    if part.startswith('['):
+        match = ATTRIBUTE.match(part)
+        if not match:
+            return True
+        name, operator, value = match.groups()
+        if name not in node.attrs:
+            return False
+        actual = node.attrs[name]
+        if operator is None:
+            return True
+        return {
+            '=': actual == value,
+            '~=': value in actual.split(),
+            '^=': actual.startswith(value),
+            '$=': actual.endswith(value),
+            '*=': value in actual,
+            '|=': actual == value or actual.startswith(value + '-'),
+        }[operator]
+    if part.startswith('::'):
+        return True
+    if part.startswith(':'):
+        name, _, argument = part[1:].partition('(')
+        if name in DYNAMIC_PSEUDOS:
+            return None
+        if name == 'root':
+            return node.tag == 'html'
+        if name == 'first-child':
+            return element_siblings(node)[0] is node
+        if name == 'last-child':
+            return element_siblings(node)[-1] is node
+        if name == 'not':
+            inner = [match_part(node, p) for p in SIMPLE_PART.findall(argument[:-1])]
+            return not all(inner) if inner else True
+        # Unknown structural pseudo-classes: assume they can match
+        return True
+    return node.tag == part.lower()
+
+
+def match_compound(node, parts):
+    for part in parts:
+        result = match_part(node, part)
+        if not result:
+            return result
+    return True
+
+
+def matches(node, compounds):
+    """Right-to-left match of a parsed complex selector against a node"""
+    combinator, parts = compounds[-1]
+    result = match_compound(node, parts)
+    if not result:
+        return result
+    if len(compounds) == 1:
+        return True
+    rest = compounds[:-1]
+    if combinator == '>':
+        return bool(node.parent) and matches(node.parent, rest)
+    if combinator in '+~':
+        siblings = element_siblings(node)
+        before = siblings[:siblings.index(node)]
+        candidates = before[-1:] if combinator == '+' else before
+        return any(matches(sibling, rest) for sibling in candidates)
+    ancestor = node.parent
+    while ancestor is not None and ancestor.tag != '#document':
+        if matches(ancestor, rest):
+            return True
+        ancestor = ancestor.parent
+    return False
+
+
+def critical_rules(rules, nodes):
+    """Rules with at least one selector matching an above-the-fold node"""
+    fold = [node for node in nodes if node.above_fold]
+    kept = []
+    for kind, prelude, body in rules:
+        if kind == 'rule':
+            selectors = []
+            for selector in prelude:
+                compounds = parse_selector(selector)
+                if compounds is None or any(matches(node, compounds) for node in fold):
+                    selectors.append(selector)
+            if selectors:
+                kept.append((kind, selectors, body))
+        elif kind == 'group':
+            inner = critical_rules(body, nodes)
+            if inner:
+                kept.append((kind, prelude, inner))
+        else:
+            kept.append((kind, prelude, body))
+
+    # Keyframes and font faces only when a kept declaration refers to them
+    used = ' '.join(body for kind, _, body in kept if kind == 'rule')
+    result = []
+    for kind, prelude, body in kept:
+        if kind == 'at' and prelude.startswith(('@keyframes', '@-webkit-keyframes')):
+            if not re.search(r'\b' + re.escape(prelude.split()[-1]) + r'\b', used):
+                continue
+        if kind == 'at' and prelude.startswith('@font-face'):
+            family = re.search(r'font-family\s*:\s*([^;]+)', body or '')
+            if family and family.group(1).strip(' \'"') not in used:
+                continue
+        result.append((kind, prelude, body))
+    return result
+
+
+# ============================================
+# Page rewriting
+# ============================================
+
+def strip_critical_css(html):
+    """Undo a previous inlining, restoring the plain stylesheet link"""
+    return ASYNC_STYLESHEET.sub(lambda m: f'<link rel="stylesheet" href="{m.group(1)}">', html)
+
+
+class CriticalCssCache:
+    """Critical CSS per page, keyed by a hash of the page template and stylesheet"""
+
+    def __init__(self, cache_path=CACHE_PATH):
+        self.cache_path = Path(cache_path)
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+        self.dirty = False
+
+    def get(self, page, key):
+        entry = self.entries.get(page)
+        return entry['css'] if entry and entry['key'] == key else None
+
+    def put(self, page, key, css):
+        self.entries[page] = {'key': key, 'css': css}
+        self.dirty = True
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2)
+        self.dirty = False
+
+
+def inline_critical_css(html, page, project_root=PROJECT_ROOT, cache=None):
+    """Return (html with critical CSS inlined, critical CSS, cache hit)
+
+    Pages without a local stylesheet link are returned unchanged.
+    """
+    html = strip_critical_css(html)
+    link = STYLESHEET_LINK.search(html)
+    if not link or '://' in link.group(1):
+        return html, None, False
+    try:
+        css_text = (Path(project_root) / link.group(1)).read_text(encoding='utf-8')
+    except FileNotFoundError:
+        return html, None, False
+
+    key = hashlib.sha256(f'{FOLD_ELEMENTS}\0{css_text}\0{html}'.encode('utf-8')).hexdigest()
+    css = cache.get(page, key) if cache else None
+    hit = css is not None
+    if not hit:
+        css = serialize_css(critical_rules(parse_css(css_text), build_dom(html)))
+        if cache:
+            cache.put(page, key, css)
+
+    href = link.group(1)
+    replacement = (f'<style id="critical-css">{css}</style>'
+                   f'<link rel="stylesheet" href="{href}" media="print" onload="this.media=\'all\'">'
+                   f'<noscript><link rel="stylesheet" href="{href}"></noscript>')
+    return html[:link.start()] + replacement + html[link.end():], css, hit
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inline critical CSS into pages')
+    parser.add_argument('pages', nargs='*', help='Pages to process (default: all)')
+    args = parser.parse_args()
+
+    cache = CriticalCssCache()
+    pages = args.pages or PageGraph(PROJECT_ROOT).pages()
+    updated = 0
+
+    print("🎨 Critical CSS")
+    for page in pages:
+        path = PROJECT_ROOT / page
+        if not path.exists():
+            print(f"  ❌ {page}: not found")
+            continue
+        original = path.read_text(encoding='utf-8')
+        html, css, hit = inline_critical_css(original, page, PROJECT_ROOT, cache)
+        if css is None:
+            print(f"  ⏭️  {page}: no local stylesheet")
+            continue
+        if html != original:
+            path.write_text(html, encoding='utf-8')
+            updated += 1
+        note = ' (cached)' if hit else ''
+        print(f"  • {page}: {len(css.encode('utf-8')) / 1024:.1f} KB inlined{note}")
+
+    cache.save()
+    print("\n" + "="*60)
+    print(f"✅ {updated} page(s) updated")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Version history and JSON Patch (RFC 6902) deltas for the data files the pages
+load (certificates.json, badge_certifications.json, medium_posts.json), so a
+returning visitor with a cached copy downloads only what changed.
+
+For each data file, assets/versions/<name>/ holds:
+  - version.json: {"version": n, "hash": ..., "deltas": [k, ...]}, the tiny
+    pointer a client checks first
+  - <k>-<n>.json: the patch from version k to the current version n, for the
+    last MAX_DELTAS versions
+
+The generators call publish_version() just before overwriting a data file.
+The file on disk is the previous build's payload, so each build diffs only
+that against the new payload. Older deltas are extended by appending the new
+patch rather than re-diffed from stored copies. A delta that grows past
+MAX_DELTA_RATIO of the full file is dropped, and clients then fetch the file.
+
+Usage:
+    python3 tools/data_versions.py    # show each file's version and deltas (starting missing histories)
+"""
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+VERSIONS_DIR = 'assets/versions'
+DATA_FILES = ['assets/certificates.json', 'assets/badge_certifications.json', 'assets/medium_posts.json']
+
+MAX_DELTAS = 5
+MAX_DELTA_RATIO = 0.5
+# Larger files get a new version without deltas instead of being loaded to diff
+MAX_DIFF_BYTES = 16 * 1024 * 1024
+
+
+def pointer(name):
+    return '/' + name.replace('~', '~0').replace('/', '~1')
+
+
+def payload_hash(payload):
+    # Key order is kept: the pages render objects in order
+    canonical = json.dumps(payload, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()[:16]
+
+
+def same(a, b):
+    """Equality that also tells True from 1 and 1 from 1.0, as JSON does"""
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, dict):
+        return list(a) == list(b) and all(same(a[key], b[key]) for key in a)
+    if isinstance(a, list):
+        return len(a) == len(b) and all(same(x, y) for x, y in zip(a, b))
+    return a == b
+
+
+def diff(old, new, path=''):
+    """JSON Patch operations turning old into new
+
+    Objects are diffed key by key only when the new key order is the old order
+    with added keys at the end, which is what applying the patch produces; the
+    pages render objects in key order, so any other reordering replaces the
+    whole object. Lists drop their common prefix and suffix, then remove and
+    add the rest, so inserting one certificate is a single add.
+    """
+    if type(old) is not type(new):
+        return [{'op': 'replace', 'path': path, 'value': new}]
+
+    if isinstance(old, dict):
+        kept = [key for key in old if key in new]
+        added = [key for key in new if key not in old]
+        if list(new) != kept + added:
+            return [{'op': 'replace', 'path': path, 'value': new}]
+        ops = [{'op': 'remove', 'path': path + pointer(key)} for key in old if key not in new]
+        for key in kept:
+            ops += diff(old[key], new[key], path + pointer(key))
+        ops += [{'op': 'add', 'path': path + pointer(key), 'value': new[key]} for key in added]
+        return ops
+
+    if isinstance(old, list):
+        start = 0
+        while start < min(len(old), len(new)) and same(old[start], new[start]):
+            start += 1
+        end_old, end_new = len(old), len(new)
+        while end_old > start and end_new > start and same(old[end_old - 1], new[end_new - 1]):
+            end_old -= 1
+            end_new -= 1
+        if end_old - start == end_new - start:
+            ops = []
+            for index in range(start, end_old):
+                ops += diff(old[index], new[index], f'{path}/{index}')
+            return ops
+        ops = [{'op': 'remove', 'path': f'{path}/{start}'} for _ in range(start, end_old)]
+        ops += [{'op': 'add', 'path': f'{path}/{start + offset}', 'value': value}
+                for offset, value in enumerate(new[start:end_new])]
+        return ops
+
+    return [] if old == new else [{'op': 'replace', 'path': path, 'value': new}]
+
+
+def related(a, b):
+    return a == b or a.startswith(b + '/') or b.startswith(a + '/')
+
+
+def compact(ops):
+    """Drop replace operations that a later replace/remove of the same path overrides
+
+    Only when no operation in between touches that path, an ancestor or a
+    descendant, or adds/removes a sibling (which would shift list indexes).
+    Keeps appended deltas from repeating fields that change every build, such
+    as last_updated.
+    """
+    kept = []
+    for position, op in enumerate(ops):
+        if op['op'] == 'replace':
+            for later in ops[position + 1:]:
+                if later['path'] == op['path'] and later['op'] in ('replace', 'remove'):
+                    break
+                parent = later['path'].rsplit('/', 1)[0]
+                if related(later['path'], op['path']) or (
+                        later['op'] != 'replace' and op['path'].startswith(parent + '/')):
+                    kept.append(op)
+                    break
+            else:
+                kept.append(op)
+            continue
+        kept.append(op)
+    return kept
+
+
+def load_json(path, default=None):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+
+
+def write_json(path, data):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+
+
+def versions_dir(data_path, project_root=PROJECT_ROOT):
+    return Path(project_root) / VERSIONS_DIR / Path(data_path).stem
+
+
+def publish_version(data_path, payload, project_root=PROJECT_ROOT):
+    """Record payload as the next version of data_path; call before overwriting the file
+
+    Returns the version pointer. Unchanged payloads keep their version.
+    """
+    directory = versions_dir(data_path, project_root)
+    current = load_json(directory / 'version.json')
+    digest = payload_hash(payload)
+    if current and current['hash'] == digest:
+        return current
+
+    path = Path(data_path)
+    previous = load_json(path) if path.exists() and path.stat().st_size <= MAX_DIFF_BYTES else None
+    version = (current['version'] + 1) if current else 1
+    deltas = {}
+    # Deltas only chain from a file that is the version the pointer describes
+    if current and previous is not None and payload_hash(previous) == current['hash']:
+        step = diff(previous, payload)
+        full_size = len(json.dumps(payload, indent=2, ensure_ascii=False).encode('utf-8'))
+        limit = full_size * MAX_DELTA_RATIO
+        candidates = {current['version']: step}
+        for base in current.get('deltas', [])[-(MAX_DELTAS - 1):]:
+            ops = load_json(directory / f"{base}-{current['version']}.json")
+            if ops is not None:
+                candidates[base] = compact(ops + step)
+        for base, ops in sorted(candidates.items()):
+            if len(json.dumps(ops, separators=(',', ':'), ensure_ascii=False).encode('utf-8')) <= limit:
+                deltas[base] = ops
+
+    return write_version(directory, version, digest, deltas)
+
+
+def publish_file(data_path, new_path, project_root=PROJECT_ROOT):
+    """publish_version() for a payload already written to new_path, e.g. by a streaming writer
+
+    Files over MAX_DIFF_BYTES are hashed as bytes and versioned without deltas.
+    """
+    if Path(new_path).stat().st_size <= MAX_DIFF_BYTES:
+        return publish_version(data_path, load_json(new_path), project_root)
+
+    digest = hashlib.sha256()
+    with open(new_path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    digest = 'file-' + digest.hexdigest()[:16]
+    directory = versions_dir(data_path, project_root)
+    current = load_json(directory / 'version.json')
+    if current and current['hash'] == digest:
+        return current
+    return write_version(directory, (current['version'] + 1) if current else 1, digest, {})
+
+
+def write_version(directory, version, digest, deltas):
+    """Write the deltas into a new version and its pointer, removing older deltas"""
+    for base, ops in deltas.items():
+        write_json(directory / f'{base}-{version}.json', ops)
+    # Deltas into older versions can no longer be applied usefully
+    for path in directory.glob('*-*.json') if directory.exists() else []:
+        if not path.stem.endswith(f'-{version}'):
+            path.unlink()
+
+    pointer_data = {'version': version, 'hash': digest, 'deltas': sorted(deltas)}
+    write_json(directory / 'version.json', pointer_data)
+    return pointer_data
+
+
+def main():
+    print("🗂️  Data file versions")
+    for data_path in DATA_FILES:
+        path = PROJECT_ROOT / data_path
+        directory = versions_dir(data_path)
+        current = load_json(directory / 'version.json')
+        if not current:
+            payload = load_json(path)
+            if payload is None:
+                print(f"  • {data_path}: not generated yet")
+                continue
+            # Start the history from the file as it is
+            current = publish_version(path, payload)
+        sizes = [(base, (directory / f"{base}-{current['version']}.json").stat().st_size) for base in current['deltas']]
+        deltas = ', '.join(f"{base}→{current['version']} {size} B" for base, size in sizes) or 'none'
+        print(f"  • {data_path}: v{current['version']} ({path.stat().st_size} B), deltas: {deltas}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
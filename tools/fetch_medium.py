@@ -1,8 +1,26 @@
 #!/usr/bin/env python3
 # tools/fetch_medium.py
-import sys, json, os, feedparser, re
+import sys, json, os, feedparser, re, hashlib, io
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
 from html import unescape
-from datetime import datetime
+from datetime import datetime, timedelta
+
+from data_versions import publish_version
+from models import Post
+from plan import STAGES, PlanState, feed_fingerprint, fetch_feed, inputs_hash, parse_time, utc_now
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional; without it covers are mirrored unresized
+    Image = None
+
+# Widths of the resized cover variants written under assets/medium/images/
+COVER_WIDTHS = (320, 640)
+IMG_SRC = re.compile(r'<img[^>]+src=["\']([^"\']+)["\']', re.IGNORECASE)
+IMAGE_EXTENSIONS = {'image/jpeg': '.jpg', 'image/png': '.png', 'image/gif': '.gif', 'image/webp': '.webp'}
+# posts.jsonl is compacted once its superseded records outnumber the live ones and this
+LOG_COMPACT_MIN = 50
 
 def clean_html(raw_html):
     """Remove HTML tags and clean up whitespace"""
@@ -25,34 +43,374 @@ def excerpt_from_content(entry, length=160):
         txt = clean_html(entry['content'][0].value)
     else:
         txt = ''
-    
+
     if len(txt) > length:
         return txt[:length].rsplit(' ', 1)[0] + '...'
     return txt
 
-def main(output_path):
+def post_from_entry(entry):
+    """Build a post dict from a feed entry"""
+    date = None
+    if 'published_parsed' in entry and entry.published_parsed:
+        date = datetime(*entry.published_parsed[:6])
+    return Post(
+        title=entry.get('title', 'Untitled'),
+        link=entry.get('link'),
+        date=date,
+        excerpt=excerpt_from_content(entry, length=160)
+    ).to_dict()
+
+def lead_image_url(entry):
+    """URL of the first image in a feed entry, if any"""
+    for key in ('media_thumbnail', 'media_content'):
+        media = entry.get(key)
+        if media and media[0].get('url'):
+            return media[0]['url']
+    bodies = [c.value for c in entry.get('content', [])] + [entry.get('summary', '')]
+    for body in bodies:
+        match = IMG_SRC.search(body or '')
+        if match:
+            return unescape(match.group(1))
+    return None
+
+def download(url, timeout=20):
+    """Fetch a URL, returning (bytes, content type) or None on failure"""
+    request = urllib.request.Request(url, headers={'User-Agent': 'portfolio-fetch-medium'})
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return response.read(), response.headers.get_content_type()
+    except (OSError, ValueError) as e:
+        print(f"Image download failed for {url}: {e}")
+        return None
+
+def site_path(path, site_root):
+    return os.path.relpath(path, site_root).replace(os.sep, '/')
+
+def store_cover(data, content_type, digest, images_dir, site_root):
+    """Write resized WebP variants of an image and return its cover entry"""
+    if Image is None:
+        path = os.path.join(images_dir, digest + IMAGE_EXTENSIONS.get(content_type, '.img'))
+        if not os.path.exists(path):
+            with open(path, 'wb') as f:
+                f.write(data)
+        return {'src': site_path(path, site_root)}
+
+    with Image.open(io.BytesIO(data)) as img:
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA' if 'transparency' in img.info else 'RGB')
+        variants = []
+        for width in COVER_WIDTHS:
+            # Never upscale; the smallest variant is kept even for tiny images
+            if width > img.width and variants:
+                break
+            w = min(width, img.width)
+            h = max(1, round(img.height * w / img.width))
+            path = os.path.join(images_dir, f'{digest}-{w}.webp')
+            if not os.path.exists(path):
+                img.resize((w, h), Image.LANCZOS).save(path, 'WEBP', quality=80)
+            variants.append((w, h, site_path(path, site_root)))
+
+    w, h, src = variants[-1]
+    return {
+        'src': src,
+        'srcset': ', '.join(f'{path} {width}w' for width, _, path in variants),
+        'width': w,
+        'height': h
+    }
+
+def mirror_covers(urls, images_dir, site_root, workers=4):
+    """
+    Mirror cover images locally, downloading with a bounded worker pool.
+    index.json maps source URLs to content hashes and content hashes to
+    covers, so each URL is fetched once and each distinct image processed once.
+    Returns a dict of source URL -> cover entry.
+    """
+    os.makedirs(images_dir, exist_ok=True)
+    index_path = os.path.join(images_dir, 'index.json')
+    cache = load_json(index_path, None) or {'urls': {}, 'images': {}}
+
+    pending = sorted({url for url in urls if url and url not in cache['urls']})
+    if pending:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for url, result in zip(pending, pool.map(download, pending)):
+                if result is None:
+                    continue
+                data, content_type = result
+                digest = hashlib.sha256(data).hexdigest()[:16]
+                if digest not in cache['images']:
+                    try:
+                        cache['images'][digest] = store_cover(data, content_type, digest, images_dir, site_root)
+                    except OSError as e:
+                        print(f"Image processing failed for {url}: {e}")
+                        continue
+                cache['urls'][url] = digest
+        write_json(index_path, cache)
+
+    return {url: cache['images'][cache['urls'][url]] for url in urls if url in cache['urls']}
+
+def post_key(post):
+    """Archive key: the post link without Medium's tracking query string"""
+    return (post.get('link') or '').split('?', 1)[0]
+
+def content_hash(post):
+    """Hash of the displayed fields, used to detect edited posts"""
+    payload = json.dumps(post, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()[:16]
+
+def load_json(path, default):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return default
+
+def write_json(path, data):
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+def page_path(archive_dir, number):
+    return os.path.join(archive_dir, f'page-{number:04d}.json')
+
+def load_index(archive_dir, page_size):
+    """
+    The archive's index.json: page size, post total, page count, the date of
+    the newest archived post and the number of records in posts.jsonl.
+    Older archives are upgraded once: a 'posts' map is moved into the log, and
+    an index without 'newest'/'records' has them filled in from the pages and
+    the log.
+    """
+    index_path = os.path.join(archive_dir, 'index.json')
+    log_path = os.path.join(archive_dir, 'posts.jsonl')
+    index = load_json(index_path, None) or {'page_size': page_size, 'total': 0, 'pages': 0,
+                                            'newest': None, 'records': 0}
+    legacy = index.pop('posts', None)
+    if legacy is not None and not os.path.exists(log_path):
+        append_to_log(log_path, sorted(legacy.items(), key=lambda item: item[1]['page']))
+    if 'records' not in index:
+        dates = [post.get('date') or '' for number in range(1, index['pages'] + 1)
+                 for post in load_json(page_path(archive_dir, number), {'posts': []})['posts']]
+        index['newest'] = max(dates, default='') or None
+        index['records'] = sum(1 for _ in read_log(log_path))
+        write_json(index_path, index)
+    return index
+
+def read_log(log_path):
+    """Every (key, {'hash', 'page'}) record in posts.jsonl, oldest first"""
+    try:
+        with open(log_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    yield entry['key'], {'hash': entry['hash'], 'page': entry['page']}
+    except FileNotFoundError:
+        return
+
+def lookup_log(log_path, keys, block_size=64 * 1024):
+    """
+    {key: {'hash', 'page'}} for those of keys that are in posts.jsonl.
+    The log is read backwards in blocks, so the first record met for a key is
+    its latest one, and reading stops once every key is found. Feed posts are
+    the newest in the archive, so that is usually within the last few blocks.
+    """
+    wanted, found = set(keys), {}
+
+    def take(line):
+        if line.strip():
+            entry = json.loads(line)
+            if entry['key'] in wanted:
+                wanted.discard(entry['key'])
+                found[entry['key']] = {'hash': entry['hash'], 'page': entry['page']}
+
+    try:
+        f = open(log_path, 'rb')
+    except FileNotFoundError:
+        return found
+    with f:
+        position = f.seek(0, os.SEEK_END)
+        partial = b''
+        while wanted and position > 0:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            lines = (f.read(step) + partial).split(b'\n')
+            # The first line may continue in the previous block
+            partial = lines.pop(0)
+            for line in reversed(lines):
+                take(line)
+        if wanted:
+            take(partial)
+    return found
+
+def append_to_log(log_path, entries):
+    os.makedirs(os.path.dirname(log_path) or '.', exist_ok=True)
+    with open(log_path, 'a', encoding='utf-8') as f:
+        for key, entry in entries:
+            f.write(json.dumps({'key': key, 'hash': entry['hash'], 'page': entry['page']}, ensure_ascii=False) + '\n')
+
+def compact_log(log_path):
+    """Rewrite posts.jsonl with only the latest record per key; returns the record count"""
+    latest = dict(read_log(log_path))
+    tmp_path = log_path + '.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+    append_to_log(tmp_path, sorted(latest.items(), key=lambda item: item[1]['page']))
+    os.replace(tmp_path, log_path)
+    return len(latest)
+
+def merge_into_archive(posts, archive_dir, page_size, compact_min=LOG_COMPACT_MIN):
+    """
+    Merge feed posts into the paginated archive.
+    Pages are numbered oldest first, so new posts only ever touch the last
+    page(s) and edited posts only touch the page that holds them. New and
+    edited posts are appended to posts.jsonl, and index.json only carries a
+    few counts, so neither is rewritten as a whole.
+    Reads are bounded too: a post dated after the newest archived one is new
+    without a lookup, and the rest are looked up from the end of the log.
+    When superseded records outnumber both the live ones and compact_min, the
+    log is compacted, which keeps it under twice the archive's size.
+    An existing archive keeps the page size it was created with.
+    Returns (index, number of new posts, number of updated posts).
+    """
+    index = load_index(archive_dir, page_size)
+    page_size = index['page_size']
+    log_path = os.path.join(archive_dir, 'posts.jsonl')
+
+    keyed = [(post_key(post), post) for post in posts]
+    newest = index['newest']
+    known = lookup_log(log_path, [key for key, post in keyed
+                                  if key and not (newest and (post.get('date') or '') > newest)])
+
+    new_posts, changed = [], {}
+    for key, post in keyed:
+        if not key:
+            continue
+        digest = content_hash(post)
+        if key not in known:
+            new_posts.append((key, digest, post))
+        elif known[key]['hash'] != digest:
+            changed.setdefault(known[key]['page'], []).append((key, digest, post))
+
+    if not new_posts and not changed:
+        return index, 0, 0
+
+    # Rewrite only the pages holding edited posts
+    dirty, logged = {}, []
+    for number, updates in changed.items():
+        page = dirty.get(number) or load_json(page_path(archive_dir, number), {'posts': []})
+        by_key = {key: (digest, post) for key, digest, post in updates}
+        page['posts'] = [by_key[post_key(p)][1] if post_key(p) in by_key else p for p in page['posts']]
+        for key, digest, _ in updates:
+            logged.append((key, {'hash': digest, 'page': number}))
+        dirty[number] = page
+
+    # Append new posts (oldest first) to the tail, opening pages as they fill
+    new_posts.sort(key=lambda item: item[2].get('date') or '')
+    for key, digest, post in new_posts:
+        number = index['pages']
+        if number and index['total'] - (number - 1) * page_size < page_size:
+            page = dirty.get(number) or load_json(page_path(archive_dir, number), {'posts': []})
+        else:
+            number += 1
+            index['pages'] = number
+            page = {'posts': []}
+        page['posts'].append(post)
+        dirty[number] = page
+        known[key] = {'hash': digest, 'page': number}
+        logged.append((key, known[key]))
+        index['total'] += 1
+        index['newest'] = max(index['newest'] or '', post.get('date') or '') or None
+
+    for number, page in dirty.items():
+        write_json(page_path(archive_dir, number), {
+            'page': number,
+            'page_size': page_size,
+            'posts': page['posts']
+        })
+    append_to_log(log_path, logged)
+    index['records'] += len(logged)
+    if index['records'] - index['total'] > max(index['total'], compact_min):
+        index['records'] = compact_log(log_path)
+    write_json(os.path.join(archive_dir, 'index.json'), index)
+
+    return index, len(new_posts), sum(len(updates) for updates in changed.values())
+
+def latest_posts(index, archive_dir, count):
+    """Newest posts from the archive, reading only as many tail pages as needed"""
+    posts = []
+    number = index['pages']
+    while number > 0 and len(posts) < count:
+        page = load_json(page_path(archive_dir, number), {'posts': []})
+        posts.extend(reversed(page['posts']))
+        number -= 1
+    posts.sort(key=lambda p: p.get('date') or '', reverse=True)
+    return posts[:count]
+
+def conditional_entry(previous, output_path, force=False):
+    """
+    The last run's plan entry when its ETag/Last-Modified may be sent, else None.
+    A 304 only proves nothing needs doing when the output exists, the stage's
+    inputs (this script, models.py) are unchanged and the last run is within
+    the feed TTL; forced, changed or expired runs fetch and regenerate in full.
+    """
+    if force or not previous or not os.path.exists(output_path):
+        return None
+    if previous.get('inputs') != inputs_hash(STAGES['medium']['inputs']):
+        return None
+    ran_at = previous.get('ran_at')
+    if not ran_at or utc_now() - parse_time(ran_at) > timedelta(hours=STAGES['medium']['ttl_hours']):
+        return None
+    return previous
+
+def main(output_path, force=False):
     username = os.getenv('MEDIUM_USERNAME', 'vjmourya').strip()
     max_posts = int(os.getenv('MAX_POSTS', '6'))
+    page_size = int(os.getenv('ARCHIVE_PAGE_SIZE', '10'))
+    archive_dir = os.path.join(os.path.dirname(output_path) or '.', 'medium')
+    workers = int(os.getenv('IMAGE_WORKERS', '4'))
+    site_root = os.path.dirname(os.path.dirname(os.path.abspath(output_path)))
     feed_url = f'https://medium.com/feed/@{username}'
-    d = feedparser.parse(feed_url)
+    force = force or os.getenv('FORCE_FETCH', '').strip().lower() in ('1', 'true', 'yes')
 
-    posts = []
-    for entry in d.entries[:max_posts]:
-        date = None
-        if 'published_parsed' in entry and entry.published_parsed:
-            date = datetime(*entry.published_parsed[:6]).isoformat()
-        posts.append({
-            'title': entry.get('title', 'Untitled'),
-            'link': entry.get('link'),
-            'date': date,
-            'excerpt': excerpt_from_content(entry, length=160)
-        })
+    # Conditional GET with the validators from the last run; a 304 means no new posts
+    state = PlanState()
+    previous = conditional_entry(state.get('medium'), output_path, force)
+    feed = fetch_feed(feed_url, previous)
+    if feed and feed['status'] == 304:
+        # Nothing was written, so nothing is recorded: the last run's inputs and time still hold
+        print("Feed not modified since the last fetch")
+        return
+    d = feedparser.parse(feed['body'] if feed else feed_url)
+
+    posts = [post_from_entry(entry) for entry in d.entries]
+    image_urls = [lead_image_url(entry) for entry in d.entries]
+    covers = mirror_covers(image_urls, os.path.join(archive_dir, 'images'), site_root, workers)
+    for post, url in zip(posts, image_urls):
+        if url in covers:
+            post['cover'] = covers[url]
+
+    index, added, updated = merge_into_archive(posts, archive_dir, page_size)
+    print(f"Archive: {added} new, {updated} updated, {index['total']} total in {index['pages']} pages")
+
+    output = {
+        'source': f'https://medium.com/@{username}',
+        'posts': latest_posts(index, archive_dir, max_posts),
+        'archive': {
+            'pages': index['pages'],
+            'page_size': index['page_size'],
+            'total': index['total']
+        }
+    }
+    publish_version(output_path, output, site_root)
+    write_json(output_path, output)
 
-    # ensure output dir exists
-    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
-    with open(output_path, 'w', encoding='utf-8') as f:
-        json.dump({'source': f'https://medium.com/@{username}', 'posts': posts}, f, ensure_ascii=False, indent=2)
+    # Recorded only now that the output is written; a failed feed request records nothing
+    if feed:
+        state.record('medium', etag=feed['etag'], modified=feed['modified'],
+                     fingerprint=feed_fingerprint(feed['body']))
+        state.save()
 
 if __name__ == '__main__':
-    out = sys.argv[1] if len(sys.argv) > 1 else 'assets/medium_posts.json'
-    main(out)
+    args = [arg for arg in sys.argv[1:] if arg != '--force']
+    out = args[0] if args else 'assets/medium_posts.json'
+    main(out, force='--force' in sys.argv[1:])
@@ -8,7 +8,12 @@ import os
 import json
 import yaml
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+
+from data_versions import publish_version
+from image_metadata import ImageMetadataCache
+from models import BadgeCertification
+from optimize_images import load_manifest, picture_sources
 
 def load_yaml_config(yaml_path):
     """Load the YAML configuration file"""
@@ -23,44 +28,29 @@ def load_yaml_config(yaml_path):
         print(f"❌ Error parsing YAML file: {e}")
         return None
 
-def validate_certification(cert, badges_dir, category_metadata):
-    """Validate a certification entry"""
-    errors = []
+def validate_certification(data, badges_dir, category_metadata):
+    """Parse and validate a certification entry; returns (BadgeCertification or None, errors, warnings)"""
     warnings = []
 
-    # Required fields
-    required_fields = ['title', 'provider', 'category', 'badge_image']
-    for field in required_fields:
-        if not cert.get(field):
-            errors.append(f"Missing required field: {field}")
-
+    # Required fields and the date formats come from the model
+    cert, errors = BadgeCertification.parse(data)
     if errors:
-        return errors, warnings
+        return None, errors, warnings
 
     # Validate category exists
-    category = cert['category']
-    if category not in category_metadata:
-        errors.append(f"Invalid category: {category}")
+    if cert.category not in category_metadata:
+        errors.append(f"Invalid category: {cert.category}")
 
     # Check if badge image exists
-    badge_image = cert['badge_image']
-    badge_path = badges_dir / badge_image
+    badge_path = badges_dir / cert.badge_image
     if not badge_path.exists():
         warnings.append(f"Badge image not found: {badge_path}")
 
-    # Validate date formats if provided
-    for date_field in ['issue_date', 'expiry_date']:
-        if cert.get(date_field):
-            try:
-                datetime.strptime(cert[date_field], '%Y-%m-%d')
-            except ValueError:
-                errors.append(f"Invalid date format for {date_field}. Use YYYY-MM-DD")
-
     # Validate verification URL
-    if not cert.get('verification_url') or 'YOUR-' in cert.get('verification_url', ''):
-        warnings.append(f"Verification URL not configured for: {cert.get('title')}")
+    if not cert.verification_url or 'YOUR-' in cert.verification_url:
+        warnings.append(f"Verification URL not configured for: {cert.title}")
 
-    return errors, warnings
+    return (None if errors else cert), errors, warnings
 
 def generate_fallback_svg(provider, title):
     """Generate a fallback SVG placeholder based on provider"""
@@ -99,26 +89,41 @@ def generate_badge_certifications_json(config, badges_dir, project_root):
     total_errors = 0
     total_warnings = 0
 
+    # Responsive variants built by optimize_images.py (if any)
+    image_manifest = load_manifest()
+
+    # Intrinsic size and placeholder color, cached by image hash
+    image_metadata = ImageMetadataCache()
+
+    # Issue and expiry dates take effect at 00:00 UTC; plan.py schedules a run for each
+    today = datetime.now(timezone.utc).date()
+    scheduled = 0
+
     # Process each certification
-    for idx, cert in enumerate(certifications, 1):
+    for idx, data in enumerate(certifications, 1):
         # Validate certification
-        errors, warnings = validate_certification(cert, badges_dir, category_metadata)
+        cert, errors, warnings = validate_certification(data, badges_dir, category_metadata)
 
         if errors:
-            print(f"\n❌ Certification #{idx} ({cert.get('title', 'Unknown')}) has errors:")
+            print(f"\n❌ Certification #{idx} ({data.get('title', 'Unknown')}) has errors:")
             for error in errors:
                 print(f"   - {error}")
             total_errors += len(errors)
             continue  # Skip invalid entries
 
         if warnings:
-            print(f"\n⚠️  Certification #{idx} ({cert.get('title', 'Unknown')}) warnings:")
+            print(f"\n⚠️  Certification #{idx} ({cert.title}) warnings:")
             for warning in warnings:
                 print(f"   - {warning}")
             total_warnings += len(warnings)
 
+        if cert.issue_date and cert.issue_date > today:
+            print(f"\n⏰ Certification #{idx} ({cert.title}) is scheduled for {cert.issue_date.isoformat()}")
+            scheduled += 1
+            continue
+
         # Extract certification data
-        category = cert['category']
+        category = cert.category
 
         # Initialize category if not exists
         if category not in output['categories']:
@@ -135,30 +140,45 @@ def generate_badge_certifications_json(config, badges_dir, project_root):
 
         # Build certification entry
         cert_entry = {
-            'title': cert['title'],
-            'provider': cert['provider'],
-            'badge_image': cert['badge_image'],
-            'badge_path': f'assets/badges/{cert["badge_image"]}',
-            'verification_url': cert.get('verification_url', ''),
-            'fallback_svg': generate_fallback_svg(cert['provider'], cert['title']),
+            'title': cert.title,
+            'provider': cert.provider,
+            'badge_image': cert.badge_image,
+            'badge_path': f'assets/badges/{cert.badge_image}',
+            'verification_url': cert.verification_url,
+            'fallback_svg': generate_fallback_svg(cert.provider, cert.title),
             'category': category,
-            'cert_type': cert.get('cert_type', 'Certified Badges')
+            'cert_type': cert.cert_type
         }
 
+        badge_sources = picture_sources(cert_entry['badge_path'], image_manifest)
+        if badge_sources:
+            cert_entry['badge_sources'] = badge_sources
+
+        # Let the page reserve space and paint a placeholder before the image loads
+        meta = image_metadata.get(badges_dir / cert.badge_image)
+        if meta:
+            cert_entry['width'] = meta['width']
+            cert_entry['height'] = meta['height']
+            if meta['placeholder']:
+                cert_entry['placeholder'] = meta['placeholder']
+
         # Add optional fields if present and not empty
-        if cert.get('issue_date'):
-            cert_entry['issue_date'] = cert['issue_date']
-        if cert.get('expiry_date'):
-            cert_entry['expiry_date'] = cert['expiry_date']
-        if cert.get('credential_id'):
-            cert_entry['credential_id'] = cert['credential_id']
-        if cert.get('description'):
-            cert_entry['description'] = cert['description']
+        if cert.issue_date:
+            cert_entry['issue_date'] = cert.issue_date.isoformat()
+        if cert.expiry_date:
+            cert_entry['expiry_date'] = cert.expiry_date.isoformat()
+            cert_entry['expired'] = cert.expiry_date <= today
+        if cert.credential_id:
+            cert_entry['credential_id'] = cert.credential_id
+        if cert.description:
+            cert_entry['description'] = cert.description
 
         output['categories'][category]['certifications'].append(cert_entry)
         output['categories'][category]['count'] += 1
         output['total_count'] += 1
 
+    image_metadata.save()
+
     # Sort categories by sort_order
     sorted_categories = dict(sorted(
         output['categories'].items(),
@@ -180,6 +200,8 @@ def generate_badge_certifications_json(config, badges_dir, project_root):
     print(f"✅ Total Certifications: {output['total_count']}")
     print(f"📁 Categories: {len(output['categories'])}")
 
+    if scheduled:
+        print(f"⏰ Scheduled: {scheduled}")
     if total_errors > 0:
         print(f"❌ Errors: {total_errors}")
     if total_warnings > 0:
@@ -219,7 +241,8 @@ def main():
         print("⚠️  Fix the errors above and run again")
         return 1
 
-    # Write JSON output
+    # Write JSON output, recording a delta from the previous build
+    publish_version(output_file, output, project_root)
     with open(output_file, 'w', encoding='utf-8') as f:
         json.dump(output, f, indent=2, ensure_ascii=False)
 
@@ -5,10 +5,15 @@ Scans the assets/certificates directory and creates a structured JSON file.
 """
 
 import os
-import json
 from pathlib import Path
 from datetime import datetime
 
+from certificate_classifier import classify_filename
+from certificate_stream import CertificateSink, temporary_output
+from data_versions import publish_file
+from optimize_pdfs import certificate_fields, load_manifest as load_pdf_manifest
+from render_thumbnails import load_manifest as load_thumbnail_manifest, thumbnail_fields
+
 # Certificate metadata mapping
 CERTIFICATE_METADATA = {
     'Cloud': {
@@ -79,89 +84,64 @@ CERTIFICATE_METADATA = {
     }
 }
 
-def clean_filename(filename):
-    """Extract clean title from filename"""
-    # Remove file extension
-    name = filename.replace('.pdf', '')
-
-    # Remove common prefixes
-    prefixes = ['AWSSkillBuilder-', 'KodeKloud-', 'KodeKloud-Course-Certificate_',
-                'ACloudGuru ', 'Udacity-']
-    for prefix in prefixes:
-        name = name.replace(prefix, '')
-
-    # Remove trailing _AWS Course Completion Certificate, etc.
-    suffixes = ['_AWS Course Completion Certificate', '_AWS Course Completion',
-                ' - AWS Course Completion Certificate', ' - AWS Course Completion',
-                ' - Course Completion Certificate', '_VIJAY-MOURYA.pdf',
-                'Course Completion Certificate']
-    for suffix in suffixes:
-        name = name.replace(suffix, '')
-
-    # Clean up underscores and extra spaces
-    name = name.replace('_', ' ').replace('-', ' ')
-    name = ' '.join(name.split())
-
-    return name
-
-def extract_provider(filename):
-    """Extract the course provider from filename"""
-    if 'AWSSkillBuilder' in filename:
-        return 'AWS Skill Builder'
-    elif 'KodeKloud' in filename:
-        return 'KodeKloud'
-    elif 'ACloudGuru' in filename or 'A Cloud Guru' in filename:
-        return 'A Cloud Guru'
-    elif 'Udacity' in filename:
-        return 'Udacity'
-    elif 'Udemy' in filename:
-        return 'Udemy'
-    elif 'Coursera' in filename:
-        return 'Coursera'
-    elif 'Introduction to' in filename:
-        return 'Coursera'  # Most "Introduction to" courses are from Coursera
-    else:
-        return 'Professional Certification'
-
-def scan_certificates(base_path):
-    """Scan certificates directory and generate metadata"""
-    certificates_data = {
-        'last_updated': datetime.now().isoformat(),
-        'total_count': 0,
-        'categories': {}
-    }
+def certificate_entries(base_path, project_root):
+    """(category, entry) for every PDF under the known categories, read one at a time"""
+    pdf_manifest = load_pdf_manifest(project_root / 'assets' / 'optimized' / 'pdf' / 'manifest.json')
+    thumbnail_manifest = load_thumbnail_manifest(project_root / 'assets' / 'optimized' / 'thumbnails' / 'manifest.json')
 
-    for category, meta in CERTIFICATE_METADATA.items():
+    for category in CERTIFICATE_METADATA:
         category_path = base_path / category
         if not category_path.exists():
             continue
 
-        pdf_files = list(category_path.glob('*.pdf'))
-
-        if not pdf_files:
-            continue
-
-        certificates_data['categories'][category] = {
+        with os.scandir(category_path) as entries:
+            for pdf_file in entries:
+                # Same files as Path.glob('*.pdf'), which skips hidden ones
+                if not pdf_file.name.endswith('.pdf') or pdf_file.name.startswith('.'):
+                    continue
+                title, provider = classify_filename(pdf_file.name)
+                yield category, {
+                    'title': title,
+                    'provider': provider,
+                    'filename': pdf_file.name,
+                    **certificate_fields(f'assets/certificates/{category}/{pdf_file.name}', project_root, pdf_manifest),
+                    **thumbnail_fields(f'assets/certificates/{category}/{pdf_file.name}', project_root, thumbnail_manifest),
+                    'category': category
+                }
+
+def scan_certificates(base_path, output_file):
+    """Scan the certificates directory and stream the metadata into output_file
+
+    Each category's entries are sorted by filename through the sink, which
+    spills to disk for very large directories; see certificate_stream.py.
+    Returns the summary ({'total_count', 'categories'}).
+    """
+    last_updated = datetime.now().isoformat()
+    project_root = base_path.parent.parent
+
+    def header(category):
+        meta = CERTIFICATE_METADATA[category]
+        return {
             'display_name': meta['display_name'],
             'icon': meta['icon'],
             'color': meta['color'],
             'description': meta['description'],
-            'count': len(pdf_files),
-            'certificates': []
         }
 
-        for pdf_file in sorted(pdf_files):
-            cert_info = {
-                'title': clean_filename(pdf_file.name),
-                'provider': extract_provider(pdf_file.name),
-                'filename': pdf_file.name,
-                'path': f'assets/certificates/{category}/{pdf_file.name}',
-                'category': category
-            }
-            certificates_data['categories'][category]['certificates'].append(cert_info)
-            certificates_data['total_count'] += 1
-
-    return certificates_data
+    with CertificateSink(lambda entry: entry['filename']) as sink:
+        for seq, (category, cert_info) in enumerate(certificate_entries(base_path, project_root)):
+            sink.add(category, cert_info, seq)
+
+        tmp_path = temporary_output(output_file)
+        try:
+            sink.write(tmp_path, last_updated, header)
+            # Record a delta from the previous build before replacing it
+            publish_file(output_file, tmp_path, project_root)
+            os.replace(tmp_path, output_file)
+        finally:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+        return sink.summary(header)
 
 def main():
     # Get the project root directory
@@ -175,16 +155,12 @@ def main():
         return
 
     print(f"Scanning certificates in: {certificates_dir}")
-    certificates_data = scan_certificates(certificates_dir)
-
-    # Write JSON output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(certificates_data, f, indent=2, ensure_ascii=False)
+    summary = scan_certificates(certificates_dir, output_file)
 
     print(f"✓ Generated certificates metadata: {output_file}")
-    print(f"✓ Total certificates: {certificates_data['total_count']}")
+    print(f"✓ Total certificates: {summary['total_count']}")
     print(f"\nCertificates by category:")
-    for category, data in certificates_data['categories'].items():
+    for category, data in summary['categories'].items():
         print(f"  • {data['icon']} {data['display_name']}: {data['count']} certificates")
 
 if __name__ == '__main__':
@@ -2,162 +2,158 @@
 """
 Generate certificates metadata JSON from YAML configuration.
 This script reads certificates.yaml and generates certificates.json for the website.
+Entries are streamed from the YAML to the JSON, so memory stays flat however
+many certificates there are.
 """
 
 import os
-import json
 import yaml
 from pathlib import Path
 from datetime import datetime
 
-def load_yaml_config(yaml_path):
-    """Load the YAML configuration file"""
-    try:
-        with open(yaml_path, 'r', encoding='utf-8') as f:
-            return yaml.safe_load(f)
-    except FileNotFoundError:
-        print(f"❌ Error: YAML config file not found: {yaml_path}")
-        print("Please create tools/certificates.yaml with your certificate data")
-        return None
-    except yaml.YAMLError as e:
-        print(f"❌ Error parsing YAML file: {e}")
-        return None
+from models import Certificate
+from certificate_stream import CertificateSink, iter_yaml_entries, temporary_output
+from data_versions import publish_file
+from optimize_pdfs import certificate_fields, load_manifest as load_pdf_manifest
+from render_thumbnails import load_manifest as load_thumbnail_manifest, thumbnail_fields
 
-def validate_certificate(cert, certificates_dir, category_metadata):
-    """Validate a certificate entry"""
-    errors = []
+def validate_certificate(data, certificates_dir, category_metadata):
+    """Parse and validate a certificate entry; returns (Certificate or None, errors, warnings)"""
     warnings = []
 
-    # Required fields
-    required_fields = ['title', 'provider', 'category', 'filename']
-    for field in required_fields:
-        if not cert.get(field):
-            errors.append(f"Missing required field: {field}")
-
+    # Required fields and the completion_date format come from the model
+    cert, errors = Certificate.parse(data)
     if errors:
-        return errors, warnings
+        return None, errors, warnings
 
-    # Validate category exists
-    category = cert['category']
-    if category not in category_metadata:
-        errors.append(f"Invalid category: {category}")
+    # Validate category exists (None when the categories are checked later)
+    if category_metadata is not None and cert.category not in category_metadata:
+        errors.append(f"Invalid category: {cert.category}")
 
     # Check if PDF file exists
-    filename = cert['filename']
-    pdf_path = certificates_dir / category / filename
+    pdf_path = certificates_dir / cert.category / cert.filename
     if not pdf_path.exists():
         warnings.append(f"PDF file not found: {pdf_path}")
 
-    # Validate completion_date format if provided
-    if 'completion_date' in cert and cert['completion_date']:
-        try:
-            datetime.strptime(cert['completion_date'], '%Y-%m-%d')
-        except ValueError:
-            errors.append(f"Invalid date format for completion_date. Use YYYY-MM-DD")
-
-    return errors, warnings
-
-def generate_certificates_json(config, certificates_dir, project_root):
-    """Generate certificates.json from YAML config"""
+    return (None if errors else cert), errors, warnings
 
-    certificates = config.get('certificates', [])
-    category_metadata = config.get('categories', {})
+def certificate_entries(yaml_path, config, certificates_dir, project_root, stats):
+    """Validated certificates.json entries from the YAML, one at a time
 
-    if not certificates:
-        print("⚠️  Warning: No certificates found in YAML config")
+    Yields (index, entry); errors and warnings are printed as entries are read
+    and counted in stats. `config` receives the other top-level keys.
+    """
+    pdf_manifest = load_pdf_manifest(project_root / 'assets' / 'optimized' / 'pdf' / 'manifest.json')
+    thumbnail_manifest = load_thumbnail_manifest(project_root / 'assets' / 'optimized' / 'thumbnails' / 'manifest.json')
 
-    # Initialize output structure
-    output = {
-        'last_updated': datetime.now().isoformat(),
-        'total_count': 0,
-        'categories': {}
-    }
-
-    # Validation tracking
-    total_errors = 0
-    total_warnings = 0
-
-    # Process each certificate
-    for idx, cert in enumerate(certificates, 1):
-        # Validate certificate
-        errors, warnings = validate_certificate(cert, certificates_dir, category_metadata)
+    for idx, data in enumerate(iter_yaml_entries(yaml_path, 'certificates', config), 1):
+        # Validate certificate; the category is checked once all categories are known
+        cert, errors, warnings = validate_certificate(data or {}, certificates_dir, None)
 
         if errors:
             print(f"\n❌ Certificate #{idx} has errors:")
             for error in errors:
                 print(f"   - {error}")
-            total_errors += len(errors)
+            stats['errors'] += len(errors)
             continue  # Skip invalid entries
 
         if warnings:
             print(f"\n⚠️  Certificate #{idx} warnings:")
             for warning in warnings:
                 print(f"   - {warning}")
-            total_warnings += len(warnings)
+            stats['warnings'] += len(warnings)
 
         # Extract certificate data
-        category = cert['category']
-        title = cert['title']
-        provider = cert['provider']
-        filename = cert['filename']
-        completion_date = cert.get('completion_date', '')
-        verification_url = cert.get('verification_url', '')
-
-        # Initialize category if not exists
-        if category not in output['categories']:
-            cat_meta = category_metadata.get(category, {})
-            output['categories'][category] = {
-                'display_name': cat_meta.get('display_name', category),
-                'icon': cat_meta.get('icon', '📄'),
-                'color': cat_meta.get('color', '#60A5FA'),
-                'description': cat_meta.get('description', ''),
-                'count': 0,
-                'certificates': []
-            }
+        category = cert.category
+        filename = cert.filename
 
         # Add certificate to category
         cert_entry = {
-            'title': title,
-            'provider': provider,
+            'title': cert.title,
+            'provider': cert.provider,
             'filename': filename,
-            'path': f'assets/certificates/{category}/{filename}',
+            # Links the linearized copy when one exists; records original/optimized sizes
+            **certificate_fields(f'assets/certificates/{category}/{filename}', project_root, pdf_manifest),
+            # First-page preview rendered by render_thumbnails.py, if any
+            **thumbnail_fields(f'assets/certificates/{category}/{filename}', project_root, thumbnail_manifest),
             'category': category
         }
 
         # Add optional fields if present
-        if completion_date:
-            cert_entry['completion_date'] = completion_date
-        if verification_url:
-            cert_entry['verification_url'] = verification_url
-
-        output['categories'][category]['certificates'].append(cert_entry)
-        output['categories'][category]['count'] += 1
-        output['total_count'] += 1
-
-    # Sort certificates within each category by completion_date (newest first)
-    for category in output['categories'].values():
-        category['certificates'].sort(
-            key=lambda x: x.get('completion_date', '1970-01-01'),
-            reverse=True
-        )
+        if cert.completion_date:
+            cert_entry['completion_date'] = cert.completion_date.isoformat()
+        if cert.verification_url:
+            cert_entry['verification_url'] = cert.verification_url
+
+        yield idx, cert_entry
+
+def generate_certificates_json(yaml_path, certificates_dir, project_root, output_file):
+    """Stream certificates.yaml into certificates.json
+
+    Entries go straight from the YAML through validation into per-category
+    sorters (newest completion_date first), and the JSON is written
+    incrementally; see certificate_stream.py. The output is only replaced when
+    there are no errors. Returns (summary, number of errors).
+    """
+    last_updated = datetime.now().isoformat()
+    config = {}
+    stats = {'errors': 0, 'warnings': 0}
+
+    with CertificateSink(lambda entry: entry.get('completion_date', '1970-01-01'), reverse=True) as sink:
+        for idx, cert_entry in certificate_entries(yaml_path, config, certificates_dir, project_root, stats):
+            sink.add(cert_entry['category'], cert_entry, idx)
+
+        if not sink.categories and stats['errors'] == 0:
+            print("⚠️  Warning: No certificates found in YAML config")
+
+        # Validate categories exist
+        category_metadata = config.get('categories') or {}
+        for category in [c for c in sink.categories if c not in category_metadata]:
+            for idx in sink.drop(category):
+                print(f"\n❌ Certificate #{idx} has errors:")
+                print(f"   - Invalid category: {category}")
+                stats['errors'] += 1
+
+        def header(category):
+            cat_meta = category_metadata.get(category, {})
+            return {
+                'display_name': cat_meta.get('display_name', category),
+                'icon': cat_meta.get('icon', '📄'),
+                'color': cat_meta.get('color', '#60A5FA'),
+                'description': cat_meta.get('description', ''),
+            }
+
+        summary = sink.summary(header)
+        if stats['errors'] == 0:
+            tmp_path = temporary_output(output_file)
+            try:
+                sink.write(tmp_path, last_updated, header)
+                # Record a delta from the previous build before replacing it
+                publish_file(output_file, tmp_path, project_root)
+                os.replace(tmp_path, output_file)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+        if sink.spilled_runs:
+            print(f"💾 Sorted with {sink.spilled_runs} spilled run(s)")
 
     # Print summary
     print("\n" + "="*60)
     print("📊 Certificate Generation Summary")
     print("="*60)
-    print(f"✅ Total Certificates: {output['total_count']}")
-    print(f"📁 Categories: {len(output['categories'])}")
+    print(f"✅ Total Certificates: {summary['total_count']}")
+    print(f"📁 Categories: {len(summary['categories'])}")
 
-    if total_errors > 0:
-        print(f"❌ Errors: {total_errors}")
-    if total_warnings > 0:
-        print(f"⚠️  Warnings: {total_warnings}")
+    if stats['errors'] > 0:
+        print(f"❌ Errors: {stats['errors']}")
+    if stats['warnings'] > 0:
+        print(f"⚠️  Warnings: {stats['warnings']}")
 
     print("\nCertificates by Category:")
-    for category, data in output['categories'].items():
+    for category, data in summary['categories'].items():
         print(f"  {data['icon']} {data['display_name']}: {data['count']} certificates")
 
-    return output, total_errors
+    return summary, stats['errors']
 
 def main():
     # Get paths
@@ -170,23 +166,23 @@ def main():
     print("🔄 Generating certificates metadata from YAML...")
     print(f"📄 Reading config: {yaml_path}")
 
-    # Load YAML configuration
-    config = load_yaml_config(yaml_path)
-    if not config:
+    if not yaml_path.exists():
+        print(f"❌ Error: YAML config file not found: {yaml_path}")
+        print("Please create tools/certificates.yaml with your certificate data")
         return 1
 
-    # Generate certificates.json
-    output, error_count = generate_certificates_json(config, certificates_dir, project_root)
+    # Generate certificates.json (written only when there are no errors)
+    try:
+        _, error_count = generate_certificates_json(yaml_path, certificates_dir, project_root, output_file)
+    except yaml.YAMLError as e:
+        print(f"❌ Error parsing YAML file: {e}")
+        return 1
 
     if error_count > 0:
         print(f"\n❌ Generation completed with {error_count} errors")
         print("⚠️  Fix the errors above and run again")
         return 1
 
-    # Write JSON output
-    with open(output_file, 'w', encoding='utf-8') as f:
-        json.dump(output, f, indent=2, ensure_ascii=False)
-
     print(f"\n✅ Successfully generated: {output_file}")
     print("="*60)
 
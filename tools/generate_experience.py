@@ -1,12 +1,41 @@
 #!/usr/bin/env python3
 """
 Generate experience.html from YAML configuration
-Reads experience.yaml and generates a complete HTML page
+Reads experience.yaml and renders the page content through the shared
+layout in tools/templates (see build_pages.py)
+
+With metadata.progressive set, experience.html keeps the usual section order
+but only renders what falls above metadata.fold_height (estimated), and at
+most metadata.inline_cards company cards. Every other section is written
+to assets/fragments/experience/ (named by content hash) and fetched by
+scripts.js as it nears the viewport. The deferred cards go into batches of
+metadata.card_batch, each ending with the placeholder for the next batch,
+so the shell holds one placeholder however long the history is. Each
+placeholder links its fragment for visitors without JavaScript.
 """
 
+import hashlib
 import yaml
 from pathlib import Path
-from datetime import datetime
+
+import build_pages
+from models import Experience, parse_all
+
+PROJECT_ROOT = Path(__file__).parent.parent
+FRAGMENTS_DIR = 'assets/fragments/experience'
+DEFAULT_INLINE_CARDS = 2
+# Deferred company cards per fragment
+DEFAULT_CARD_BATCH = 5
+# Estimated px of page above the fold, and of the hero and timeline heading
+DEFAULT_FOLD_HEIGHT = 1100
+HERO_HEIGHT = 140
+TIMELINE_HEADING_HEIGHT = 100
+SECTION_TITLES = {
+    'achievements': 'Key Achievements',
+    'conferences': 'Conference Attendance',
+    'skills': 'Complete Technical Skillset',
+    'stats': 'Career Highlights',
+}
 
 
 def load_experience_config():
@@ -19,6 +48,14 @@ def load_experience_config():
     return config
 
 
+def load_experiences(config):
+    """Experience models sorted by order; raises ValueError listing invalid entries"""
+    experiences, errors = parse_all(Experience, config['experiences'], 'Experience')
+    if errors:
+        raise ValueError('Invalid experience.yaml:\n  ' + '\n  '.join(errors))
+    return sorted(experiences, key=lambda x: x.order)
+
+
 def generate_achievements_html(achievements):
     """Generate achievements section HTML"""
     html_parts = []
@@ -55,11 +92,11 @@ def generate_conferences_html(conferences):
 
 def generate_project_html(project):
     """Generate a single project HTML"""
-    highlights_html = '\n'.join([f'                        <li>{highlight}</li>' for highlight in project['highlights']])
+    highlights_html = '\n'.join([f'                        <li>{highlight}</li>' for highlight in project.highlights])
 
     return f'''
                 <div style="margin-bottom:16px;">
-                    <strong class="small" style="color:#4fd1c5; font-size:0.95rem;">{project['title']}</strong>
+                    <strong class="small" style="color:#4fd1c5; font-size:0.95rem;">{project.title}</strong>
                     <ul class="small" style="margin:8px 0 0 20px; line-height:1.7;">
 {highlights_html}
                     </ul>
@@ -69,35 +106,34 @@ def generate_project_html(project):
 
 def generate_experience_card_html(experience):
     """Generate a single experience card HTML"""
-    projects_html = ''.join([generate_project_html(project) for project in experience['projects']])
+    projects_html = ''.join([generate_project_html(project) for project in experience.projects])
 
-    # Format date range
-    end_date_display = experience['end_date'] if experience['end_date'] != 'present' else 'Present'
-    start_month_year = datetime.strptime(experience['start_date'], '%Y-%m').strftime('%b %Y')
-    end_month_year = end_date_display if end_date_display == 'Present' else datetime.strptime(experience['end_date'], '%Y-%m').strftime('%b %Y')
+    # Format date range (an end_date of None is the current role)
+    start_month_year = experience.start_date.strftime('%b %Y')
+    end_month_year = experience.end_date.strftime('%b %Y') if experience.end_date else 'Present'
     date_range = f"{start_month_year} – {end_month_year}"
 
     return f'''
-            <!-- {experience['company']} -->
+            <!-- {experience.company} -->
             <div class="card company-card" style="padding:24px; margin-bottom:20px;">
                 <div style="display:flex; justify-content:space-between; align-items:start; flex-wrap:wrap; gap:12px; margin-bottom:16px;">
                     <div>
-                        <h3 style="margin:0; color:{experience['color']}; font-size:1.3rem;">{experience['company']}</h3>
-                        <div class="small" style="margin-top:4px; color:var(--muted);">{experience['location']}</div>
+                        <h3 style="margin:0; color:{experience.color}; font-size:1.3rem;">{experience.company}</h3>
+                        <div class="small" style="margin-top:4px; color:var(--muted);">{experience.location}</div>
                     </div>
                     <div style="text-align:right;">
                         <div class="label" style="display:inline-block; padding:4px 12px; background:rgba(96,165,250,0.15); border-radius:20px;">{date_range}</div>
-                        <div class="small" style="margin-top:4px; color:var(--muted);">{experience['duration']}</div>
+                        <div class="small" style="margin-top:4px; color:var(--muted);">{experience.duration}</div>
                     </div>
                 </div>
 
-                <strong style="display:block; margin-bottom:16px; color:#e6eef8; font-size:1.05rem;">{experience['role']}</strong>
+                <strong style="display:block; margin-bottom:16px; color:#e6eef8; font-size:1.05rem;">{experience.role}</strong>
 
 {projects_html}
                 <div style="padding-top:12px; border-top:1px solid rgba(255,255,255,0.1);">
                     <strong class="small">Tech Stack:</strong>
                     <div class="small" style="margin-top:6px; color:#94a3b8;">
-                        {experience['tech_stack']}
+                        {experience.tech_stack}
                     </div>
                 </div>
             </div>
@@ -138,71 +174,15 @@ def generate_career_stats_html(stats):
     return ''.join(html_parts)
 
 
-def generate_experience_html(config):
-    """Generate complete experience.html from config"""
-
-    # Sort experiences by order
-    experiences = sorted(config['experiences'], key=lambda x: x['order'])
-
-    # Generate sections
+def generate_sections(config, cards_html):
+    """{name: section HTML} in page order; the timeline holds the given cards"""
     achievements_html = generate_achievements_html(config['achievements'])
     conferences_html = generate_conferences_html(config['conferences'])
-    experience_cards_html = ''.join([generate_experience_card_html(exp) for exp in experiences])
     skills_html = generate_skills_html(config['skills'])
     stats_html = generate_career_stats_html(config['career_stats'])
 
-    # Generate complete HTML
-    html = f'''<!doctype html>
-<html lang="en">
-<head>
-    <meta charset="utf-8"/>
-    <meta name="viewport" content="width=device-width,initial-scale=1"/>
-    <title>{config['metadata']['page_title']}</title>
-    <meta name="description" content="Detailed professional experience and career history of Vijay Mourya - Senior DevOps & Infrastructure Reliability Engineer">
-    <link rel="icon" type="image/svg+xml" href="assets/favicon.svg">
-    <link rel="stylesheet" href="styles.css">
-</head>
-<body>
-<div class="container">
-    <header class="header">
-        <div class="brand">
-            <img src="assets/DP/ProfilePicture.png" alt="VM" class="logo" style="width:56px;height:56px;border-radius:12px;">
-            <div>
-                <div class="title">Vijay Mourya</div>
-                <div class="small">Senior DevOps & Infrastructure Reliability Engineer</div>
-            </div>
-        </div>
-
-        <nav class="nav" aria-label="Main navigation">
-            <a href="index.html">Home</a>
-            <a href="services.html">Services</a>
-            <a href="experience.html" class="active">Experience</a>
-            <a href="projects.html">Projects</a>
-            <a href="certifications.html">Certifications</a>
-            <a href="study.html">Social</a>
-            <a href="contact.html">Contact</a>
-        </nav>
-
-        <div class="mobile-menu">
-            <select id="mobile-nav">
-                <option value="index.html">Home</option>
-                <option value="services.html">Services</option>
-                <option selected value="experience.html">Experience</option>
-                <option value="projects.html">Projects</option>
-                <option value="certifications.html">Certifications</option>
-                <option value="study.html">Social</option>
-                <option value="contact.html">Contact</option>
-            </select>
-        </div>
-    </header>
-
-    <main>
-        <section class="card" style="padding:20px; margin-bottom:24px;">
-            <h1 style="margin:0 0 8px 0; font-size:1.8rem;">{config['metadata']['hero_title']}</h1>
-            <p class="small" style="margin:0;">{config['metadata']['hero_subtitle']}</p>
-        </section>
-
-        <!-- ============================================ -->
+    return {
+        'achievements': f'''        <!-- ============================================ -->
         <!-- ACHIEVEMENTS & RECOGNITION -->
         <!-- ============================================ -->
         <section class="section">
@@ -212,8 +192,8 @@ def generate_experience_html(config):
 {achievements_html}
             </div>
         </section>
-
-        <!-- ============================================ -->
+''',
+        'conferences': f'''        <!-- ============================================ -->
         <!-- CONFERENCE ATTENDANCE & LEARNING -->
         <!-- ============================================ -->
         <section class="section">
@@ -223,18 +203,18 @@ def generate_experience_html(config):
 {conferences_html}
             </div>
         </section>
-
-        <!-- ============================================ -->
+''',
+        'timeline': f'''        <!-- ============================================ -->
         <!-- DETAILED WORK EXPERIENCE - VERTICAL TIMELINE -->
         <!-- ============================================ -->
         <section class="section" style="margin-top:32px;">
             <h2>Career Timeline</h2>
             <p class="small" style="margin-bottom:24px; color:var(--muted);">Detailed work experience in chronological order (most recent first)</p>
 
-{experience_cards_html}
+{cards_html}
         </section>
-
-        <!-- ============================================ -->
+''',
+        'skills': f'''        <!-- ============================================ -->
         <!-- SKILLS BREAKDOWN -->
         <!-- ============================================ -->
         <section class="section" style="margin-top:40px;">
@@ -244,8 +224,8 @@ def generate_experience_html(config):
 {skills_html}
             </div>
         </section>
-
-        <!-- ============================================ -->
+''',
+        'stats': f'''        <!-- ============================================ -->
         <!-- CAREER SUMMARY STATS -->
         <!-- ============================================ -->
         <section class="section" style="margin-top:40px;">
@@ -254,34 +234,143 @@ def generate_experience_html(config):
 {stats_html}
             </div>
         </section>
+''',
+    }
+
 
-        <footer class="footer">
-            <div class="small">© Vijay Mourya — Built with GitHub Pages</div>
-        </footer>
-    </main>
-</div>
-<script src="scripts.js"></script>
-</body>
-</html>
+def generate_hero_html(config):
+    return f'''        <section class="card" style="padding:20px; margin-bottom:24px;">
+            <h1 style="margin:0 0 8px 0; font-size:1.8rem;">{config['metadata']['hero_title']}</h1>
+            <p class="small" style="margin:0;">{config['metadata']['hero_subtitle']}</p>
+        </section>
 '''
 
-    return html
+
+def generate_experience_content(config):
+    """Generate the <main> content of experience.html from config"""
+
+    experiences = load_experiences(config)
+    experience_cards_html = ''.join([generate_experience_card_html(exp) for exp in experiences])
+    sections = generate_sections(config, experience_cards_html)
+
+    return generate_hero_html(config) + '\n' + '\n'.join(sections.values())
+
+
+def estimate_card_height(experience):
+    """Rough rendered height (px) of a company card, reserved by its placeholder"""
+    highlights = sum(len(project.highlights) for project in experience.projects)
+    return 220 + 48 * len(experience.projects) + 30 * highlights
+
+
+def estimate_section_height(items, per_row=3, row_height=120):
+    return 100 + -(-items // per_row) * row_height
+
+
+def fragment_placeholder(rel, min_height, label, indent=8):
+    """Placeholder scripts.js swaps for the fragment; without JS it links to it"""
+    return (' ' * indent + f'<div class="fragment" data-fragment="{rel}" style="min-height:{min_height}px;">'
+            f'<noscript><a href="{rel}">{label}</a></noscript></div>\n')
+
+
+def write_fragments(fragments, project_root=PROJECT_ROOT):
+    """Write new fragment files and delete ones no longer referenced"""
+    fragments_dir = Path(project_root) / FRAGMENTS_DIR
+    if fragments:
+        fragments_dir.mkdir(parents=True, exist_ok=True)
+    for rel, html in fragments.items():
+        path = Path(project_root) / rel
+        if not path.exists():
+            path.write_text(html, encoding='utf-8')
+    if fragments_dir.exists():
+        for path in fragments_dir.glob('*.html'):
+            if f'{FRAGMENTS_DIR}/{path.name}' not in fragments:
+                path.unlink()
+
+
+def generate_progressive_content(config, project_root=PROJECT_ROOT):
+    """Sections in their usual order, with whatever falls below the fold as fragments"""
+    experiences = load_experiences(config)
+    inline_cards = config['metadata'].get('inline_cards', DEFAULT_INLINE_CARDS)
+    card_batch = max(1, config['metadata'].get('card_batch', DEFAULT_CARD_BATCH))
+    fold = config['metadata'].get('fold_height', DEFAULT_FOLD_HEIGHT)
+    fragments = {}
+
+    def fragment(name, html, min_height, label, indent=8):
+        # Content-hashed names let browsers and the service worker cache them forever
+        rel = f"{FRAGMENTS_DIR}/{name}-{hashlib.sha256(html.encode('utf-8')).hexdigest()[:10]}.html"
+        fragments[rel] = html
+        return fragment_placeholder(rel, min_height, label, indent)
+
+    heights = {
+        'achievements': estimate_section_height(len(config['achievements'])),
+        'conferences': estimate_section_height(len(config['conferences']), per_row=4),
+        'skills': estimate_section_height(len(config['skills']), row_height=260),
+        'stats': estimate_section_height(len(config['career_stats']), per_row=4),
+    }
+    # Where each section would start, to decide what is above the fold
+    offset = HERO_HEIGHT
+    offsets = {}
+    for name in ('achievements', 'conferences', 'timeline', 'skills', 'stats'):
+        offsets[name] = offset
+        offset += heights.get(name) or TIMELINE_HEADING_HEIGHT + sum(map(estimate_card_height, experiences))
+
+    # Cards below the fold (or past inline_cards) are deferred in batches. Each
+    # batch ends with the placeholder for the next, so the shell holds only the
+    # first placeholder and its size doesn't grow with the history
+    cards_html = ''
+    deferred = []
+    card_top = offsets['timeline'] + TIMELINE_HEADING_HEIGHT
+    for index, experience in enumerate(experiences):
+        if not deferred and index < inline_cards and card_top < fold:
+            cards_html += generate_experience_card_html(experience)
+        else:
+            deferred.append(experience)
+        card_top += estimate_card_height(experience)
+
+    batches = [deferred[start:start + card_batch] for start in range(0, len(deferred), card_batch)]
+    next_placeholder = ''
+    # Built last batch first: each batch's content (and so its name) includes the next placeholder
+    for number in range(len(batches), 0, -1):
+        batch = batches[number - 1]
+        html = ''.join(generate_experience_card_html(experience) for experience in batch) + next_placeholder
+        next_placeholder = fragment(f'cards-{number}', html, sum(map(estimate_card_height, batch)),
+                                    ', '.join(experience.company for experience in batch), indent=12)
+    cards_html += next_placeholder
+
+    parts = []
+    for name, html in generate_sections(config, cards_html).items():
+        if name == 'timeline' or offsets[name] < fold:
+            parts.append(html)
+        else:
+            parts.append(fragment(name, html, heights[name], SECTION_TITLES[name]))
+
+    write_fragments(fragments, project_root)
+    return generate_hero_html(config) + '\n' + '\n'.join(parts)
+
+
+def page_content(project_root=PROJECT_ROOT):
+    """Front matter and content for build_pages.py"""
+    config = load_experience_config()
+    meta = {
+        'title': config['metadata']['page_title'],
+        'description': 'Detailed professional experience and career history of Vijay Mourya - '
+                       'Senior DevOps & Infrastructure Reliability Engineer',
+    }
+    if config['metadata'].get('progressive'):
+        return meta, generate_progressive_content(config, project_root)
+    write_fragments({}, project_root)
+    return meta, generate_experience_content(config)
 
 
 def main():
     """Main function"""
-    # Load config
     config = load_experience_config()
     print(f"Loaded configuration with {len(config['experiences'])} experiences")
 
-    # Generate HTML
-    html = generate_experience_html(config)
-
-    # Write to file
-    output_path = Path(__file__).parent.parent / 'experience.html'
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html)
+    # Render through the shared layout; this also adds resource hints and critical CSS
+    rebuilt = build_pages.build(pages=['experience.html'])
 
+    output_path = Path(__file__).parent.parent / rebuilt[0]
     print(f"Generated experience.html successfully!")
     print(f"Output: {output_path}")
     print("\nExperience page updated! Refresh your browser to see changes.")
@@ -289,4 +378,3 @@ def main():
 
 if __name__ == '__main__':
     main()
-
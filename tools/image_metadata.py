@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Intrinsic dimensions and placeholder colors for badge images.
+Dimensions come straight from the PNG or JPEG header (no decode). The
+placeholder is the image's average color over white, which needs Pillow;
+results are cached by file hash in .cache/image_metadata.json.
+"""
+
+import hashlib
+import json
+import struct
+from pathlib import Path
+
+try:
+    from PIL import Image
+except ImportError:  # Without Pillow only width/height are produced
+    Image = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CACHE_PATH = PROJECT_ROOT / '.cache' / 'image_metadata.json'
+
+PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+
+
+def png_dimensions(path):
+    """Return (width, height) from a PNG's IHDR chunk, or None if not a PNG"""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if len(header) < 24 or header[:8] != PNG_SIGNATURE or header[12:16] != b'IHDR':
+        return None
+    return struct.unpack('>II', header[16:24])
+
+
+def jpeg_dimensions(path):
+    """Return (width, height) from a JPEG's first SOF marker, or None"""
+    with open(path, 'rb') as f:
+        if f.read(2) != b'\xff\xd8':
+            return None
+        while True:
+            marker = f.read(2)
+            if len(marker) < 2 or marker[0] != 0xFF:
+                return None
+            length = struct.unpack('>H', f.read(2))[0]
+            # SOF0-SOF15, excluding DHT (C4), JPG (C8) and DAC (CC)
+            if 0xC0 <= marker[1] <= 0xCF and marker[1] not in (0xC4, 0xC8, 0xCC):
+                height, width = struct.unpack('>xHH', f.read(5))
+                return width, height
+            f.seek(length - 2, 1)
+
+
+def image_dimensions(path):
+    """Return (width, height) from the file header, or None if unsupported"""
+    return png_dimensions(path) or jpeg_dimensions(path)
+
+
+def placeholder_color(path):
+    """Average color of the image composited over white, as #rrggbb"""
+    if Image is None:
+        return None
+    with Image.open(path) as img:
+        # draft() lets JPEG decoders skip work; PNGs decode once at full size
+        img.draft('RGB', (32, 32))
+        tiny = img.convert('RGBA').resize((1, 1), Image.BOX)
+    r, g, b, a = tiny.getpixel((0, 0))
+    blend = lambda c: round(c * a / 255 + 255 * (1 - a / 255))
+    return '#{:02x}{:02x}{:02x}'.format(blend(r), blend(g), blend(b))
+
+
+class ImageMetadataCache:
+    """File-hash keyed cache of {width, height, placeholder}"""
+
+    def __init__(self, cache_path=CACHE_PATH):
+        self.cache_path = Path(cache_path)
+        try:
+            with open(self.cache_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+        self.dirty = False
+
+    def get(self, path):
+        """Metadata for an image file, or None if it is missing or unsupported"""
+        try:
+            data = Path(path).read_bytes()
+        except FileNotFoundError:
+            return None
+        digest = hashlib.sha256(data).hexdigest()
+        entry = self.entries.get(digest)
+        # Re-check entries cached before Pillow was available
+        if entry is None or (entry.get('placeholder') is None and Image is not None):
+            dimensions = image_dimensions(path)
+            if dimensions is None:
+                return None
+            entry = {
+                'width': dimensions[0],
+                'height': dimensions[1],
+                'placeholder': placeholder_color(path)
+            }
+            self.entries[digest] = entry
+            self.dirty = True
+        return entry
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.cache_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2)
+        self.dirty = False
@@ -0,0 +1,343 @@
+#!/usr/bin/env python3
+"""
+Load-test the built site the way it is served: a static server in front of
+the generated tree, and concurrent simulated visitors each loading a page
+plus every stylesheet, script, image and JSON file it references (from
+page_graph.py). Each scenario runs a cold load (empty cache) and a warm load
+(repeat visit) per visitor:
+  - raw / precompressed: files as they are, or .gz/.br siblings served for
+    the Accept-Encoding (like nginx gzip_static/brotli_static)
+  - unfingerprinted / fingerprinted: assets revalidated with If-None-Match on
+    a repeat visit (304s), or immutable under a content-hashed URL and served
+    from the browser cache. Pages and JSON are always revalidated.
+Reports throughput and p50/p95/p99 page-load latency for every scenario and
+appends the results to .cache/benchmark_history.json as 'load_test'.
+
+The built-in server is stdlib and single-process, so compare scenarios with
+each other rather than reading the numbers as nginx capacity; --base-url
+runs the same visitors against a real server (e.g. a local nginx on the tree).
+
+Usage:
+    python3 tools/load_test.py
+    python3 tools/load_test.py --visitors 200 --concurrency 16
+    python3 tools/load_test.py --base-url http://127.0.0.1:8080 --no-record
+"""
+
+import argparse
+import gzip
+import hashlib
+import http.client
+import mimetypes
+import statistics
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from multiprocessing import Process
+from pathlib import Path
+from urllib.parse import quote, unquote, urlsplit
+
+try:
+    import brotli
+except ImportError:  # gzip only
+    brotli = None
+
+from benchmarks import HISTORY_PATH, record_results
+from page_graph import PageGraph
+
+PROJECT_ROOT = Path(__file__).parent.parent
+PRECOMPRESSED_DIR = PROJECT_ROOT / '.cache' / 'load_test'
+
+COMPRESSIBLE = {'.html', '.css', '.js', '.json', '.svg', '.xml', '.txt'}
+# Assets that a fingerprinting build would rename by content hash
+FINGERPRINTED_KINDS = {'css', 'js', 'image', 'icon', 'font'}
+
+SCENARIOS = {
+    'raw': {'precompressed': False, 'fingerprinted': False},
+    'precompressed': {'precompressed': True, 'fingerprinted': False},
+    'fingerprinted': {'precompressed': False, 'fingerprinted': True},
+    'precompressed_fingerprinted': {'precompressed': True, 'fingerprinted': True},
+}
+
+
+def precompress(project_root, paths, output_dir=PRECOMPRESSED_DIR):
+    """Write .gz (and .br with brotli) copies of the compressible files; skips up-to-date ones"""
+    for rel in paths:
+        source = Path(project_root) / rel
+        if source.suffix not in COMPRESSIBLE:
+            continue
+        data = None
+        encoders = [('.gz', lambda d: gzip.compress(d, 9, mtime=0))]
+        if brotli:
+            encoders.append(('.br', lambda d: brotli.compress(d, quality=11)))
+        for suffix, encode in encoders:
+            target = Path(output_dir) / (rel + suffix)
+            if target.exists() and target.stat().st_mtime >= source.stat().st_mtime:
+                continue
+            data = data if data is not None else source.read_bytes()
+            target.parent.mkdir(parents=True, exist_ok=True)
+            target.write_bytes(encode(data))
+
+
+class SiteHandler(BaseHTTPRequestHandler):
+    """Static file handler with ETags, 304s and optional precompressed variants"""
+
+    protocol_version = 'HTTP/1.1'
+    # Headers and body are written separately; don't let Nagle delay the body
+    disable_nagle_algorithm = True
+    root = PROJECT_ROOT
+    precompressed_dir = None
+    etags = {}
+
+    def log_message(self, format, *args):
+        pass
+
+    def etag(self, path):
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        if key not in self.etags:
+            self.etags[key] = '"' + hashlib.sha256(path.read_bytes()).hexdigest()[:16] + '"'
+        return self.etags[key]
+
+    def do_GET(self):
+        rel = unquote(urlsplit(self.path).path).lstrip('/') or 'index.html'
+        path = (self.root / rel).resolve()
+        if self.root.resolve() not in path.parents or not path.is_file():
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+
+        etag = self.etag(path)
+        fingerprinted = '?v=' in self.path
+        headers = {
+            'Content-Type': mimetypes.guess_type(path.name)[0] or 'application/octet-stream',
+            'ETag': etag,
+            'Last-Modified': formatdate(path.stat().st_mtime, usegmt=True),
+            'Cache-Control': 'public, max-age=31536000, immutable' if fingerprinted else 'no-cache',
+        }
+        if self.headers.get('If-None-Match') == etag:
+            self.send_response(304)
+            for name, value in headers.items():
+                if name != 'Content-Type':
+                    self.send_header(name, value)
+            self.end_headers()
+            return
+
+        body_path = path
+        if self.precompressed_dir and path.suffix in COMPRESSIBLE:
+            headers['Vary'] = 'Accept-Encoding'
+            accepted = self.headers.get('Accept-Encoding', '')
+            for encoding, suffix in (('br', '.br'), ('gzip', '.gz')):
+                variant = Path(self.precompressed_dir) / (rel + suffix)
+                if encoding in accepted and variant.exists():
+                    headers['Content-Encoding'] = encoding
+                    body_path = variant
+                    break
+
+        body = body_path.read_bytes()
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class SiteServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops connections under load (1 s SYN retries)
+    request_queue_size = 128
+
+
+def serve(port, root, precompressed_dir):
+    """Run the static server (in its own process, so it doesn't share the GIL with the visitors)"""
+    handler = type('Handler', (SiteHandler,), {'root': Path(root), 'precompressed_dir': precompressed_dir})
+    with SiteServer(('127.0.0.1', port), handler) as server:
+        server.serve_forever()
+
+
+def start_server(root, precompressed_dir, port=0):
+    """Start serve() in a child process; returns (process, base URL)"""
+    if not port:
+        import socket
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            port = sock.getsockname()[1]
+    process = Process(target=serve, args=(port, str(root), precompressed_dir), daemon=True)
+    process.start()
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            connection = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection.request('GET', '/')
+            connection.getresponse().read()
+            connection.close()
+            return process, f'http://127.0.0.1:{port}'
+        except OSError:
+            time.sleep(0.05)
+    process.terminate()
+    raise RuntimeError('load test server did not start')
+
+
+def page_loads(project_root=PROJECT_ROOT):
+    """{page: [(path, kind)]} with the page first, for every page and its existing dependencies"""
+    graph = PageGraph(project_root)
+    loads = {}
+    for page in graph.pages():
+        deps = [(dep.path, dep.kind) for dep in graph.dependencies(page)
+                if (Path(project_root) / dep.path).is_file()]
+        if deps:
+            loads[page] = deps
+    return loads
+
+
+class Visitor:
+    """One simulated browser: a keep-alive connection per visit and its own cache of ETags"""
+
+    def __init__(self, base_url, precompressed, fingerprinted, revisions):
+        parts = urlsplit(base_url)
+        self.connection = http.client.HTTPConnection(parts.hostname, parts.port or 80, timeout=30)
+        self.prefix = parts.path.rstrip('/')
+        self.encoding = ('br, gzip' if brotli else 'gzip') if precompressed else 'identity'
+        self.fingerprinted = fingerprinted
+        self.revisions = revisions
+        self.etags = {}
+
+    def url(self, path, kind):
+        url = f'{self.prefix}/{quote(path)}'
+        if self.fingerprinted and kind in FINGERPRINTED_KINDS:
+            url += f'?v={self.revisions[path]}'
+        return url
+
+    def get(self, url):
+        headers = {'Accept-Encoding': self.encoding}
+        if url in self.etags:
+            headers['If-None-Match'] = self.etags[url]
+        for attempt in range(2):
+            try:
+                self.connection.request('GET', url, headers=headers)
+                response = self.connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                # The server may close an idle keep-alive connection; retry once
+                self.connection.close()
+                if attempt:
+                    raise
+        if response.getheader('ETag'):
+            self.etags[url] = response.getheader('ETag')
+        return response.status, len(body)
+
+    def load(self, deps, warm):
+        """Fetch a page and its dependencies; returns (seconds, requests, bytes, errors)"""
+        start = time.perf_counter()
+        requests = transferred = errors = 0
+        for path, kind in deps:
+            url = self.url(path, kind)
+            if warm and self.fingerprinted and kind in FINGERPRINTED_KINDS:
+                continue  # Immutable and already in the browser cache
+            status, size = self.get(url)
+            requests += 1
+            transferred += size
+            errors += status >= 400
+        # A repeat visit comes later, on a new connection
+        self.connection.close()
+        return time.perf_counter() - start, requests, transferred, errors
+
+
+def percentiles(samples):
+    if len(samples) < 2:
+        value = samples[0] if samples else 0
+        return value, value, value
+    cuts = statistics.quantiles(samples, n=100, method='inclusive')
+    return cuts[49], cuts[94], cuts[98]
+
+
+def run_scenario(base_url, loads, scenario, visitors, concurrency, revisions):
+    """Cold then warm loads for each visitor; returns {'cold': stats, 'warm': stats}"""
+    pages = list(loads)
+    browsers = [Visitor(base_url, scenario['precompressed'], scenario['fingerprinted'], revisions)
+                for _ in range(visitors)]
+
+    results = {}
+    for phase in ('cold', 'warm'):
+        def visit(index):
+            return browsers[index].load(loads[pages[index % len(pages)]], phase == 'warm')
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            samples = list(pool.map(visit, range(visitors)))
+        elapsed = time.perf_counter() - start
+        latencies = [seconds * 1000 for seconds, _, _, _ in samples]
+        p50, p95, p99 = percentiles(latencies)
+        results[phase] = {
+            'loads_per_second': round(visitors / elapsed, 1),
+            'requests_per_second': round(sum(s[1] for s in samples) / elapsed, 1),
+            'kb_per_load': round(sum(s[2] for s in samples) / visitors / 1024, 1),
+            'p50_ms': round(p50, 2),
+            'p95_ms': round(p95, 2),
+            'p99_ms': round(p99, 2),
+            'errors': sum(s[3] for s in samples),
+        }
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load-test the static site with simulated page loads')
+    parser.add_argument('--visitors', type=int, default=100, help='Page loads per phase and scenario (default: 100)')
+    parser.add_argument('--concurrency', type=int, default=8, help='Concurrent visitors (default: 8)')
+    parser.add_argument('--scenarios', nargs='*', choices=list(SCENARIOS), default=list(SCENARIOS),
+                        help='Scenarios to run (default: all)')
+    parser.add_argument('--base-url', help='Test an already running server instead of the built-in one')
+    parser.add_argument('--no-record', action='store_true', help='Do not append results to history')
+    args = parser.parse_args()
+
+    loads = page_loads(PROJECT_ROOT)
+    if not loads:
+        print("❌ No pages found to load")
+        return 1
+    paths = sorted({path for deps in loads.values() for path, _ in deps})
+    revisions = {path: hashlib.sha256((PROJECT_ROOT / path).read_bytes()).hexdigest()[:12] for path in paths}
+    print(f"🚦 {len(loads)} pages, {len(paths)} distinct files, "
+          f"{args.visitors} visitors x {args.concurrency} concurrent per phase")
+
+    if any(SCENARIOS[name]['precompressed'] for name in args.scenarios) and not args.base_url:
+        precompress(PROJECT_ROOT, paths)
+
+    metrics = {'pages': len(loads), 'visitors': args.visitors, 'concurrency': args.concurrency,
+               'server': args.base_url or 'builtin', 'compression': 'brotli' if brotli else 'gzip'}
+    for name in args.scenarios:
+        scenario = SCENARIOS[name]
+        process = None
+        base_url = args.base_url
+        if not base_url:
+            precompressed_dir = str(PRECOMPRESSED_DIR) if scenario['precompressed'] else None
+            process, base_url = start_server(PROJECT_ROOT, precompressed_dir)
+        try:
+            results = run_scenario(base_url, loads, scenario, args.visitors, args.concurrency, revisions)
+        finally:
+            if process:
+                process.terminate()
+                process.join()
+
+        print(f"\n  {name}")
+        for phase, stats in results.items():
+            print(f"    {phase:<5} {stats['loads_per_second']:>8} loads/s  {stats['kb_per_load']:>7} KB/load  "
+                  f"p50 {stats['p50_ms']} ms  p95 {stats['p95_ms']} ms  p99 {stats['p99_ms']} ms"
+                  + (f"  ❌ {stats['errors']} errors" if stats['errors'] else ''))
+            for key, value in stats.items():
+                metrics[f'{name}_{phase}_{key}'] = value
+
+    print("\n" + "="*60)
+    errors = sum(value for key, value in metrics.items() if key.endswith('_errors'))
+    print(f"✅ {len(args.scenarios)} scenario(s) run" + (f", ❌ {errors} failed requests" if errors else ''))
+    if not args.no_record:
+        record_results('load_test', metrics)
+        print(f"📄 Results appended to: {HISTORY_PATH}")
+    return 1 if errors else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,270 @@
+#!/usr/bin/env python3
+"""
+Typed records for the portfolio data: Certificate, BadgeCertification,
+Experience (with its Projects) and Post.
+
+Each model is a slotted dataclass whose fields declare their own rules with
+spec() (required, date format, type, nested items). The rules are compiled
+into a generated parse function the first time a model parses or checks
+anything, so importing this module stays cheap. Model.parse() runs it over a
+raw YAML/feed dict and converts dates as it goes, so every date string is
+parsed exactly once, when the data is loaded. to_dict() writes the record
+back in the YAML/JSON shape, dates in their original format.
+"""
+
+from dataclasses import MISSING, dataclass, field, fields
+from datetime import date, datetime
+
+DATE = '%Y-%m-%d'
+MONTH = '%Y-%m'
+ISO = 'iso'
+
+FORMAT_LABELS = {DATE: 'YYYY-MM-DD', MONTH: 'YYYY-MM', ISO: 'an ISO 8601 timestamp'}
+
+
+def spec(default='', *, required=False, date_format=None, open_value=None, kind=None,
+         items=None, keep_empty=False):
+    """Declare a model field and its validation rules
+
+    date_format -- DATE, MONTH or ISO; the value is stored as a date/datetime
+    open_value  -- a literal accepted instead of a date (e.g. 'present'), stored as None
+    kind        -- required Python type of the value (int, list, dict)
+    items       -- model class for each element of a list
+    keep_empty  -- write the key to to_dict() even when the value is empty
+    """
+    metadata = {'required': required, 'date_format': date_format, 'open_value': open_value,
+                'kind': list if items else kind, 'items': items, 'keep_empty': keep_empty}
+    if isinstance(default, (list, dict)):
+        return field(default_factory=type(default), metadata=metadata)
+    return field(default=None if date_format else default, metadata=metadata)
+
+
+def parse_day(value):
+    """date from 'YYYY-MM-DD'; YAML already loads unquoted dates as date objects"""
+    if isinstance(value, date):
+        return value
+    # date.fromisoformat() is much faster than strptime but also takes '20250101'
+    if len(value) != 10 or value[4] != '-' or value[7] != '-':
+        raise ValueError(value)
+    return date.fromisoformat(value)
+
+
+def parse_month(value):
+    """First day of the month from 'YYYY-MM'"""
+    if isinstance(value, date):
+        return value
+    if len(value) != 7 or value[4] != '-':
+        raise ValueError(value)
+    return date.fromisoformat(value + '-01')
+
+
+def parse_timestamp(value):
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+PARSERS = {DATE: parse_day, MONTH: parse_month, ISO: parse_timestamp}
+
+
+def format_date(value, date_format):
+    return value.isoformat() if date_format == ISO else value.strftime(date_format)
+
+
+def is_empty(value):
+    return value is None or value == '' or value == [] or value == {}
+
+
+def field_source(f, index):
+    """Source lines that read field f into local v<index>, appending to errors"""
+    name, meta, var = f.name, f.metadata, f'v{index}'
+    lines = [
+        f"{var} = get({name!r})",
+        f"if {var} is None or {var} == '' or {var} == [] or {var} == {{}}:",
+    ]
+    if meta['required']:
+        lines.append(f"    errors.append({f'Missing required field: {name}'!r})")
+    else:
+        lines.append(f"    {var} = defaults[{index}]()")
+    if meta['date_format']:
+        if meta['open_value'] is not None:
+            lines += [f"elif {var} == {meta['open_value']!r}:", f"    {var} = None"]
+        message = f"Invalid date format for {name}. Use {FORMAT_LABELS[meta['date_format']]}"
+        lines += [
+            "else:",
+            "    try:",
+            f"        {var} = parsers[{meta['date_format']!r}]({var})",
+            "    except (TypeError, ValueError):",
+            f"        errors.append({message!r})",
+        ]
+    elif meta['kind']:
+        message = f"Invalid {name}: expected {meta['kind'].__name__}, got "
+        lines += [
+            f"elif not isinstance({var}, kinds[{index}]):",
+            f"    errors.append({message!r} + type({var}).__name__)",
+        ]
+        if meta['items']:
+            lines += [
+                "else:",
+                f"    {var} = [parse_item(items[{index}], item, {name!r}, position, errors)"
+                f" for position, item in enumerate({var})]",
+            ]
+    return lines
+
+
+def parse_item(cls, data, name, position, errors):
+    record, item_errors = cls.parse(data if isinstance(data, dict) else {})
+    errors.extend(f"{name}[{position}]: {error}" for error in item_errors)
+    return record
+
+
+def compile_validator(cls):
+    """Generate and compile a parse function for a model from its field specs
+
+    Each field becomes a few straight-line statements with its name, messages
+    and parser inlined, so parsing a record is one call with no per-field
+    dispatch. Single-field checks (for the interactive add tools) are
+    compiled from the same statements.
+    """
+    model_fields = fields(cls)
+    namespace = {
+        'cls': cls,
+        'parsers': PARSERS,
+        'parse_item': parse_item,
+        'defaults': [(f.default_factory if f.default_factory is not MISSING else (lambda value=f.default: value))
+                     for f in model_fields],
+        'kinds': [f.metadata['kind'] for f in model_fields],
+        'items': [f.metadata['items'] for f in model_fields],
+    }
+    body = []
+    for index, f in enumerate(model_fields):
+        body += field_source(f, index)
+    arguments = ', '.join(f'v{index}' for index in range(len(model_fields)))
+    source = '\n'.join(
+        ['def parse(data):', '    get = data.get', '    errors = []']
+        + ['    ' + line for line in body]
+        + ['    if errors:', '        return None, errors', f'    return cls({arguments}), errors']
+    )
+    for index, f in enumerate(model_fields):
+        source += '\n\n' + '\n'.join(
+            [f'def check_{f.name}(data):', '    get = data.get', '    errors = []']
+            + ['    ' + line for line in field_source(f, index)]
+            + ['    return errors']
+        )
+    exec(compile(source, f'<model {cls.__name__}>', 'exec'), namespace)
+    return namespace['parse'], {f.name: namespace[f'check_{f.name}'] for f in model_fields}
+
+
+def model(cls):
+    """Class decorator: slotted dataclass whose validator is compiled on first use"""
+    cls = dataclass(slots=True)(cls)
+    cls._parse = cls._field_checks = None
+    cls._serializers = tuple((f.name, f.metadata['date_format'], f.metadata['open_value'], f.metadata['items'],
+                              f.metadata['required'] or f.metadata['keep_empty']) for f in fields(cls))
+    return cls
+
+
+class Model:
+    __slots__ = ()
+
+    @classmethod
+    def parse(cls, data):
+        """(instance or None, [errors]) for a raw dict; unknown keys are ignored"""
+        if cls._parse is None:
+            cls._parse, cls._field_checks = compile_validator(cls)
+        return cls._parse(data)
+
+    @classmethod
+    def check(cls, name, value):
+        """Validate a single field value; returns an error message or None"""
+        if cls._field_checks is None:
+            cls._parse, cls._field_checks = compile_validator(cls)
+        errors = cls._field_checks[name]({name: value})
+        return errors[0] if errors else None
+
+    def to_dict(self):
+        """Field values in declaration order, dates formatted, empty optional fields left out"""
+        data = {}
+        for name, date_format, open_value, items, keep in self._serializers:
+            value = getattr(self, name)
+            if value is None and open_value:
+                value = open_value
+            elif is_empty(value):
+                if keep:
+                    data[name] = value
+                continue
+            elif date_format:
+                value = format_date(value, date_format)
+            elif items:
+                value = [item.to_dict() for item in value]
+            data[name] = value
+        return data
+
+
+@model
+class Certificate(Model):
+    title: str = spec(required=True)
+    provider: str = spec(required=True)
+    category: str = spec(required=True)
+    filename: str = spec(required=True)
+    number: str = spec()
+    completion_date: date = spec(date_format=DATE)
+    verification_url: str = spec()
+
+
+@model
+class BadgeCertification(Model):
+    title: str = spec(required=True)
+    provider: str = spec(required=True)
+    category: str = spec(required=True)
+    badge_image: str = spec(required=True)
+    verification_url: str = spec()
+    issue_date: date = spec(date_format=DATE)
+    expiry_date: date = spec(date_format=DATE)
+    credential_id: str = spec()
+    description: str = spec()
+    cert_type: str = spec('Certified Badges')
+
+
+@model
+class Project(Model):
+    title: str = spec(required=True)
+    highlights: list = spec([], required=True, kind=list)
+
+
+@model
+class Experience(Model):
+    id: str = spec()
+    company: str = spec(required=True)
+    location: str = spec(required=True)
+    role: str = spec(required=True)
+    start_date: date = spec(required=True, date_format=MONTH)
+    # None while the role is current ('present' in the YAML)
+    end_date: date = spec(required=True, date_format=MONTH, open_value='present')
+    duration: str = spec(required=True)
+    color: str = spec('#60a5fa')
+    order: int = spec(0, required=True, kind=int)
+    projects: list = spec([], required=True, items=Project)
+    tech_stack: str = spec()
+
+
+@model
+class Post(Model):
+    title: str = spec('Untitled', keep_empty=True)
+    link: str = spec(None, keep_empty=True)
+    date: datetime = spec(date_format=ISO, keep_empty=True)
+    excerpt: str = spec(keep_empty=True)
+    cover: dict = spec(None, kind=dict)
+
+
+def parse_all(cls, records, label=None):
+    """Parse a list of raw dicts; returns ([instances], [errors]) with errors prefixed by position"""
+    label = label or cls.__name__
+    parsed, errors = [], []
+    for index, data in enumerate(records or [], 1):
+        record, record_errors = cls.parse(data)
+        if record_errors:
+            errors.extend(f"{label} #{index}: {error}" for error in record_errors)
+        else:
+            parsed.append(record)
+    return parsed, errors
@@ -0,0 +1,247 @@
+#!/usr/bin/env python3
+"""
+Generate responsive WebP/AVIF variants for the raster images the site uses.
+Each source is rendered at 1x, 2x and 3x of its display width. Outputs are
+named by source hash and recorded in assets/optimized/manifest.json, so
+unchanged images are never reprocessed. Rendered variants are also kept in
+the build cache (build_cache.py), so a fresh checkout restores them.
+
+Usage:
+    python3 tools/optimize_images.py
+    python3 tools/optimize_images.py --workers 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+
+from build_cache import BuildCache, library_version
+
+# Pillow and the process pool are imported by the functions that render:
+# build_pages.py and the generators import this module only to read the manifest
+
+PROJECT_ROOT = Path(__file__).parent.parent
+OUTPUT_DIR = 'assets/optimized'
+MANIFEST_PATH = PROJECT_ROOT / OUTPUT_DIR / 'manifest.json'
+
+# Referenced rasters and the CSS width (px) they are displayed at
+IMAGE_TARGETS = [
+    ('assets/DP/ProfilePicture.png', 56),
+    ('assets/badges/*.png', 140),
+]
+DENSITIES = (1, 2, 3)
+# Bump when the rendering settings change so cached variants are not reused
+VARIANT_VERSION = 1
+
+# Preferred order for <picture> sources; formats Pillow can't write are skipped
+FORMATS = [
+    ('avif', 'AVIF', 'image/avif', {'quality': 60}),
+    ('webp', 'WEBP', 'image/webp', {'quality': 82, 'method': 6}),
+]
+
+
+def file_hash(path):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """Load the variant manifest (empty if images were never optimized)"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'images': {}}
+
+
+def supported_formats():
+    """Formats from FORMATS that this Pillow build can encode; none without Pillow"""
+    try:
+        from PIL import Image
+    except ImportError:
+        return []
+    Image.init()
+    return [fmt for fmt in FORMATS if fmt[1] in Image.SAVE]
+
+
+def render_variants(project_root, src, digest, display_width, formats):
+    """Write every format/density variant of one image (runs in a worker process)"""
+    from PIL import Image
+
+    output_dir = Path(project_root) / OUTPUT_DIR
+    output_dir.mkdir(parents=True, exist_ok=True)
+    stem = Path(src).stem
+
+    with Image.open(Path(project_root) / src) as img:
+        img.load()
+        if img.mode not in ('RGB', 'RGBA'):
+            img = img.convert('RGBA')
+        source_width, source_height = img.size
+        base_width = min(display_width, source_width)
+        base_height = max(1, round(source_height * base_width / source_width))
+
+        sources = {}
+        for ext, pil_format, mime, options in formats:
+            variants = []
+            for density in DENSITIES:
+                width = base_width * density
+                # Never upscale; 1x is always produced
+                if width > source_width and density > 1:
+                    break
+                height = max(1, round(source_height * width / source_width))
+                rel = f'{OUTPUT_DIR}/{stem}-{digest[:10]}@{density}x.{ext}'
+                img.resize((width, height), Image.LANCZOS).save(Path(project_root) / rel, pil_format, **options)
+                variants.append({
+                    'density': density,
+                    'path': rel,
+                    'bytes': os.path.getsize(Path(project_root) / rel)
+                })
+            sources[mime] = variants
+
+    return src, {
+        'hash': digest,
+        'display_width': display_width,
+        'width': base_width,
+        'height': base_height,
+        'original_bytes': os.path.getsize(Path(project_root) / src),
+        'sources': sources
+    }
+
+
+def collect_sources(project_root=PROJECT_ROOT):
+    """Return {relative source path: display width} for every target raster"""
+    sources = {}
+    for pattern, width in IMAGE_TARGETS:
+        for path in sorted(Path(project_root).glob(pattern)):
+            sources[path.relative_to(project_root).as_posix()] = width
+    return sources
+
+
+def build(project_root=PROJECT_ROOT, workers=None, cache=None):
+    """Regenerate variants for new or changed images; returns the manifest"""
+    manifest_path = Path(project_root) / OUTPUT_DIR / 'manifest.json'
+    manifest = load_manifest(manifest_path)
+    formats = supported_formats()
+    mimes = [fmt[2] for fmt in formats]
+    sources = collect_sources(project_root)
+    cache = cache or BuildCache()
+    version = [VARIANT_VERSION, library_version('pillow')]
+
+    def replace(src, entry):
+        old = manifest['images'].get(src)
+        if old:
+            keep = {v['path'] for variants in entry['sources'].values() for v in variants}
+            for variants in old['sources'].values():
+                for v in variants:
+                    if v['path'] not in keep:
+                        (Path(project_root) / v['path']).unlink(missing_ok=True)
+        manifest['images'][src] = entry
+
+    jobs = []
+    for src, width in sources.items():
+        digest = file_hash(Path(project_root) / src)
+        entry = manifest['images'].get(src)
+        up_to_date = (
+            entry and entry['hash'] == digest and entry['display_width'] == width
+            and list(entry['sources']) == mimes
+            and all((Path(project_root) / v['path']).exists()
+                    for variants in entry['sources'].values() for v in variants)
+        )
+        if up_to_date:
+            continue
+        # Output names include the source's stem, so the path is an input too
+        key = cache.key('images', {'source': src, 'hash': digest, 'width': width, 'formats': formats}, version)
+        cached = cache.fetch(key, project_root)
+        if cached:
+            replace(src, cached)
+        else:
+            jobs.append((src, digest, width, key))
+
+    print(f"🖼️  {len(sources)} images, {len(jobs)} to (re)build, formats: {', '.join(mimes)}")
+
+    if jobs:
+        from concurrent.futures import ProcessPoolExecutor
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(key, pool.submit(render_variants, str(project_root), src, digest, width, formats))
+                       for src, digest, width, key in jobs]
+            for key, future in futures:
+                src, entry = future.result()
+                replace(src, entry)
+                cache.publish(key, 'images', [v['path'] for variants in entry['sources'].values() for v in variants],
+                              entry, project_root)
+    if cache.hits or cache.stored:
+        print(f"🗃️  {cache.summary()}")
+
+    # Drop entries for sources that no longer exist
+    for src in [s for s in manifest['images'] if s not in sources]:
+        for variants in manifest['images'][src]['sources'].values():
+            for v in variants:
+                (Path(project_root) / v['path']).unlink(missing_ok=True)
+        del manifest['images'][src]
+
+    manifest['images'] = dict(sorted(manifest['images'].items()))
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2)
+
+    return manifest
+
+
+def picture_sources(src, manifest):
+    """[{'type', 'srcset'}] for an image in the manifest, best format first"""
+    entry = manifest.get('images', {}).get(src)
+    if not entry:
+        return []
+    return [
+        {'type': mime, 'srcset': ', '.join(f"{v['path']} {v['density']}x" for v in variants)}
+        for mime, variants in entry['sources'].items()
+    ]
+
+
+def picture_html(src, manifest, img_attrs):
+    """<picture> markup for src, or a plain <img> if it was never optimized"""
+    entry = manifest.get('images', {}).get(src)
+    if not entry:
+        return f'<img src="{src}" {img_attrs}>'
+    sources = ''.join(
+        f'<source type="{s["type"]}" srcset="{s["srcset"]}">' for s in picture_sources(src, manifest)
+    )
+    return f'<picture>{sources}<img src="{src}" width="{entry["width"]}" height="{entry["height"]}" {img_attrs}></picture>'
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Build responsive image variants')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    args = parser.parse_args()
+
+    if not supported_formats():
+        print("❌ Pillow with WebP or AVIF support is required: pip3 install pillow")
+        return 1
+
+    manifest = build(PROJECT_ROOT, args.workers)
+
+    original = optimized = 0
+    for src, entry in manifest['images'].items():
+        best = next(iter(entry['sources'].values()), [])
+        one_x = best[0]['bytes'] if best else entry['original_bytes']
+        original += entry['original_bytes']
+        optimized += one_x
+        print(f"  • {src}: {entry['original_bytes'] / 1024:.1f} KB → {one_x / 1024:.1f} KB at 1x")
+
+    print("\n" + "="*60)
+    print(f"✅ {len(manifest['images'])} images: {original / 1024:.0f} KB → {optimized / 1024:.0f} KB at 1x")
+    print(f"📄 Manifest: {MANIFEST_PATH}")
+    print("="*60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
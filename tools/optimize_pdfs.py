@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Rewrite the certificate PDFs for fast web view: linearized so the first page
+shows before the whole file has downloaded, object streams generated and
+compressed, and embedded images downsampled when they exceed MAX_DPI at the
+page size. Outputs go to assets/optimized/pdf/<source hash>/<filename> and
+are recorded in assets/optimized/pdf/manifest.json, so unchanged PDFs are
+never reprocessed, and in the build cache (build_cache.py), so a fresh
+checkout restores them. generate_certificates_from_yaml.py links the
+optimized copy and records both sizes in certificates.json.
+
+Usage:
+    python3 tools/optimize_pdfs.py
+    python3 tools/optimize_pdfs.py --dpi 120 --workers 4
+"""
+
+import argparse
+import hashlib
+import io
+import json
+import os
+import sys
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+from build_cache import BuildCache, library_version
+
+try:
+    import pikepdf
+    from pikepdf import Name, PdfImage
+except ImportError:  # Only needed to optimize, not to read the manifest
+    pikepdf = None
+
+try:
+    from PIL import Image
+except ImportError:  # Without Pillow images are left at their original resolution
+    Image = None
+
+PROJECT_ROOT = Path(__file__).parent.parent
+SOURCE_DIR = 'assets/certificates'
+OUTPUT_DIR = 'assets/optimized/pdf'
+MANIFEST_PATH = PROJECT_ROOT / OUTPUT_DIR / 'manifest.json'
+
+MAX_DPI = 150
+JPEG_QUALITY = 80
+# Bump when the rewrite settings change so every PDF is reprocessed
+OPTIMIZER_VERSION = 1
+
+
+def file_hash(path):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 16), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """Load the PDF manifest (empty if PDFs were never optimized)"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'pdfs': {}}
+
+
+def page_width_inches(page):
+    box = [float(v) for v in page.mediabox]
+    return abs(box[2] - box[0]) / 72
+
+
+def downsample_image(image_obj, max_width):
+    """Replace an 8-bit RGB/gray image with a smaller copy; True if it was rewritten"""
+    if Image is None or '/SMask' in image_obj or '/Mask' in image_obj:
+        return False
+    if int(image_obj.get('/BitsPerComponent', 8)) != 8:
+        return False
+    try:
+        pil = PdfImage(image_obj).as_pil_image()
+    except (NotImplementedError, pikepdf.PdfError, ValueError, OSError):
+        return False
+    if pil.mode not in ('RGB', 'L') or pil.width <= max_width:
+        return False
+
+    height = max(1, round(pil.height * max_width / pil.width))
+    small = pil.resize((max_width, height), Image.LANCZOS)
+    before = len(image_obj.read_raw_bytes())
+    if '/DCTDecode' in str(image_obj.get('/Filter', '')):
+        buffer = io.BytesIO()
+        small.save(buffer, 'JPEG', quality=JPEG_QUALITY, optimize=True)
+        data, filter_name = buffer.getvalue(), Name.DCTDecode
+    else:
+        data, filter_name = zlib.compress(small.tobytes(), 9), Name.FlateDecode
+    if len(data) >= before:
+        return False
+
+    image_obj.write(data, filter=filter_name)
+    image_obj.Width = small.width
+    image_obj.Height = small.height
+    image_obj.ColorSpace = Name.DeviceRGB if small.mode == 'RGB' else Name.DeviceGray
+    for key in ('/DecodeParms', '/Decode'):
+        if key in image_obj:
+            del image_obj[key]
+    return True
+
+
+def optimize_pdf(project_root, src, digest, max_dpi):
+    """Write the optimized copy of one PDF (runs in a worker process)"""
+    rel = f'{OUTPUT_DIR}/{digest[:12]}/{Path(src).name}'
+    output = Path(project_root) / rel
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    downsampled = 0
+    with pikepdf.open(Path(project_root) / src) as pdf:
+        seen = set()
+        for page in pdf.pages:
+            max_width = max(1, round(page_width_inches(page) * max_dpi))
+            # get_images() also finds images inside form XObjects (pikepdf 10+)
+            images = page.get_images() if hasattr(page, 'get_images') else page.images
+            for image_obj in images.values():
+                key = image_obj.objgen
+                if key in seen:
+                    continue
+                seen.add(key)
+                downsampled += downsample_image(image_obj, max_width)
+        pdf.remove_unreferenced_resources()
+        pdf.save(output, linearize=True, compress_streams=True, recompress_flate=True,
+                 object_stream_mode=pikepdf.ObjectStreamMode.generate)
+
+    return src, {
+        'hash': digest,
+        'version': OPTIMIZER_VERSION,
+        'max_dpi': max_dpi,
+        'path': rel,
+        'original_bytes': os.path.getsize(Path(project_root) / src),
+        'bytes': os.path.getsize(output),
+        'images_downsampled': downsampled,
+    }
+
+
+def collect_sources(project_root=PROJECT_ROOT):
+    """Site-relative paths of every certificate PDF"""
+    return [path.relative_to(project_root).as_posix()
+            for path in sorted((Path(project_root) / SOURCE_DIR).rglob('*.pdf')) if path.is_file()]
+
+
+def remove_output(project_root, entry):
+    output = Path(project_root) / entry['path']
+    output.unlink(missing_ok=True)
+    try:
+        output.parent.rmdir()
+    except OSError:
+        pass
+
+
+def build(project_root=PROJECT_ROOT, workers=None, max_dpi=MAX_DPI, cache=None):
+    """Optimize new or changed PDFs; returns (manifest, number processed)"""
+    manifest_path = Path(project_root) / OUTPUT_DIR / 'manifest.json'
+    manifest = load_manifest(manifest_path)
+    sources = collect_sources(project_root)
+    cache = cache or BuildCache()
+    version = [OPTIMIZER_VERSION, library_version('pikepdf'), library_version('pillow')]
+
+    def replace(src, entry):
+        old = manifest['pdfs'].get(src)
+        if old and old['path'] != entry['path']:
+            remove_output(project_root, old)
+        manifest['pdfs'][src] = entry
+
+    jobs = []
+    for src in sources:
+        digest = file_hash(Path(project_root) / src)
+        entry = manifest['pdfs'].get(src)
+        up_to_date = (
+            entry and entry['hash'] == digest and entry.get('version') == OPTIMIZER_VERSION
+            and entry.get('max_dpi') == max_dpi and (Path(project_root) / entry['path']).exists()
+        )
+        if up_to_date:
+            continue
+        # The entry records the source's size and the output keeps its file name
+        key = cache.key('pdfs', {'source': src, 'hash': digest, 'max_dpi': max_dpi}, version)
+        cached = cache.fetch(key, project_root)
+        if cached:
+            replace(src, cached)
+        else:
+            jobs.append((src, digest, key))
+
+    print(f"📄 {len(sources)} PDFs, {len(jobs)} to (re)optimize, images capped at {max_dpi} DPI")
+
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [(key, pool.submit(optimize_pdf, str(project_root), src, digest, max_dpi))
+                       for src, digest, key in jobs]
+            for key, future in futures:
+                src, entry = future.result()
+                replace(src, entry)
+                cache.publish(key, 'pdfs', [entry['path']], entry, project_root)
+    if cache.hits or cache.stored:
+        print(f"🗃️  {cache.summary()}")
+
+    # Drop entries for sources that no longer exist
+    for src in [s for s in manifest['pdfs'] if s not in sources]:
+        remove_output(project_root, manifest['pdfs'].pop(src))
+
+    manifest['pdfs'] = dict(sorted(manifest['pdfs'].items()))
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    return manifest, len(jobs)
+
+
+def certificate_fields(src, project_root=PROJECT_ROOT, manifest=None):
+    """certificates.json fields for a PDF: the path to link and both sizes"""
+    manifest = manifest if manifest is not None else load_manifest(Path(project_root) / OUTPUT_DIR / 'manifest.json')
+    source = Path(project_root) / src
+    if not source.exists():
+        return {'path': src}
+    entry = manifest.get('pdfs', {}).get(src)
+    fields = {'path': src, 'original_size': source.stat().st_size}
+    # A stale entry (source edited since) is ignored until the PDF is re-optimized
+    if entry and (Path(project_root) / entry['path']).exists() and entry['hash'] == file_hash(source):
+        fields['path'] = entry['path']
+        fields['optimized_size'] = entry['bytes']
+    return fields
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Linearize and compress certificate PDFs')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--dpi', type=int, default=MAX_DPI, help=f'Downsample images above this DPI (default: {MAX_DPI})')
+    args = parser.parse_args()
+
+    if pikepdf is None:
+        print("❌ pikepdf is required: pip3 install pikepdf")
+        return 1
+
+    manifest, processed = build(PROJECT_ROOT, args.workers, args.dpi)
+
+    original = optimized = 0
+    for src, entry in manifest['pdfs'].items():
+        original += entry['original_bytes']
+        optimized += entry['bytes']
+        images = f", {entry['images_downsampled']} image(s) downsampled" if entry['images_downsampled'] else ''
+        print(f"  • {src}: {entry['original_bytes'] / 1024:.0f} KB → {entry['bytes'] / 1024:.0f} KB{images}")
+
+    print("\n" + "="*60)
+    print(f"✅ {len(manifest['pdfs'])} PDFs ({processed} processed): "
+          f"{original / 1024:.0f} KB → {optimized / 1024:.0f} KB")
+    print(f"📄 Manifest: {MANIFEST_PATH}")
+    print("="*60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
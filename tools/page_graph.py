@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""
+Resolve what each HTML page loads: stylesheets (and what they import),
+scripts, images, icons, the JSON that scripts.js fetches for the page, and
+the images rendered from that JSON. Shared by the page budget analyzer and
+the other page-level build stages.
+
+Usage:
+    python3 tools/page_graph.py                # print every page's dependencies
+    python3 tools/page_graph.py index.html
+"""
+
+import json
+import posixpath
+import re
+import sys
+from collections import namedtuple
+from html.parser import HTMLParser
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+# Directories that are never part of the published site
+SKIP_DIRS = {'.git', '.github', '.cache', 'tools', 'node_modules', '__pycache__'}
+# Prerendered HTML fragments are fetched into pages, not visited directly
+FRAGMENT_DIRS = {'fragments'}
+
+# Container ids that scripts.js fills from JSON, and the files it fetches for them.
+# {archive_last} is the newest Medium archive page, which is fetched first.
+SCRIPT = 'scripts.js'
+SCRIPT_FETCHES = {
+    'medium-posts': ['assets/medium_posts.json'],
+    'medium-archive': ['assets/medium_posts.json', 'assets/medium/page-{archive_last}.json'],
+    'certificates-list': ['assets/certificates.json'],
+    'certificates-summary-home': ['assets/certificates.json'],
+    'credentials-certificates-grid': ['assets/badge_certifications.json'],
+    'credentials-badges-grid': ['assets/badge_certifications.json'],
+    'badge-certifications-summary-home': ['assets/badge_certifications.json'],
+}
+
+CSS_URL = re.compile(r'''url\(\s*['"]?([^'")]+?)['"]?\s*\)''')
+CSS_IMPORT = re.compile(r'''@import\s+(?:url\()?\s*['"]([^'"]+)['"]''')
+
+# <link rel="preload" as=...> -> dependency kind
+PRELOAD_KINDS = {'style': 'css', 'script': 'js', 'fetch': 'json', 'image': 'image', 'font': 'font'}
+
+Dependency = namedtuple('Dependency', 'path kind critical depth parent')
+
+
+def is_local(ref):
+    parts = urlsplit(ref)
+    return not (parts.scheme or parts.netloc or ref.startswith(('#', '//')))
+
+
+def resolve(ref, base):
+    """Site-relative path for a ref found in the file `base`"""
+    path = unquote(urlsplit(ref).path)
+    if path.startswith('/'):
+        return path.lstrip('/')
+    return posixpath.normpath(posixpath.join(posixpath.dirname(base), path))
+
+
+def first_candidate(srcset):
+    """The 1x (first) URL of a srcset"""
+    return srcset.split(',')[0].strip().split(' ')[0]
+
+
+class PageAssetParser(HTMLParser):
+    """Collect the resources a page requests, in document order"""
+
+    def __init__(self):
+        super().__init__()
+        self.refs = []          # (ref, kind, critical)
+        self.ids = set()
+        self.inline_css = []
+        self.in_head = False
+        self.in_style = False
+        self.in_noscript = False
+        self.in_nav = False
+        self.in_header = False
+        self.picture_source = None
+        self.hero_candidates = [] # eager content images (not the header logo), as their 1x URL
+        self.nav_links = []     # hrefs in <nav> and the mobile nav <select>
+        self.content_links = [] # other <a> hrefs
+        self.sources = {}       # picture source 1x URL -> (srcset, type)
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        if tag == 'noscript':
+            self.in_noscript = True
+        if self.in_noscript:
+            # Fallbacks for script-less browsers are not loaded otherwise
+            return
+        if attrs.get('id'):
+            self.ids.add(attrs['id'])
+        if attrs.get('style'):
+            self.inline_css.append(attrs['style'])
+
+        if tag == 'head':
+            self.in_head = True
+        elif tag == 'header':
+            self.in_header = True
+        elif tag == 'nav' or (tag == 'select' and attrs.get('id') == 'mobile-nav'):
+            self.in_nav = True
+        elif tag == 'a' and attrs.get('href'):
+            (self.nav_links if self.in_nav else self.content_links).append(attrs['href'])
+        elif tag == 'option' and self.in_nav and attrs.get('value'):
+            self.nav_links.append(attrs['value'])
+        elif tag == 'style':
+            self.in_style = True
+        elif tag == 'link' and attrs.get('href'):
+            rel = (attrs.get('rel') or '').lower().split()
+            if 'stylesheet' in rel:
+                # media="print" (optionally swapped in onload) never blocks rendering
+                blocking = attrs.get('media', 'all') in ('all', 'screen') and 'disabled' not in attrs
+                self.refs.append((attrs['href'], 'css', blocking))
+            elif 'icon' in rel:
+                self.refs.append((attrs['href'], 'icon', False))
+            elif 'preload' in rel or 'modulepreload' in rel:
+                kind = PRELOAD_KINDS.get(attrs.get('as'), attrs.get('as') or 'js')
+                self.refs.append((attrs['href'], kind, False))
+        elif tag == 'script' and attrs.get('src'):
+            blocking = 'async' not in attrs and 'defer' not in attrs and attrs.get('type') != 'module'
+            self.refs.append((attrs['src'], 'js', blocking))
+        elif tag == 'picture':
+            self.picture_source = None
+        elif tag == 'source' and attrs.get('srcset') and self.picture_source is None:
+            # Browsers download the first matching source; its 1x candidate is the baseline
+            self.picture_source = first_candidate(attrs['srcset'])
+            self.sources[self.picture_source] = (attrs['srcset'], attrs.get('type'))
+            self.refs.append((self.picture_source, 'image', False))
+        elif tag == 'img' and attrs.get('src'):
+            if self.picture_source is None:
+                self.refs.append((attrs['src'], 'image', False))
+            classes = (attrs.get('class') or '').split()
+            if not self.in_header and 'logo' not in classes and attrs.get('loading') != 'lazy':
+                self.hero_candidates.append(self.picture_source or attrs['src'])
+        elif tag == 'use' and (attrs.get('href') or attrs.get('xlink:href')):
+            self.refs.append((attrs.get('href') or attrs['xlink:href'], 'image', False))
+
+    def handle_endtag(self, tag):
+        if tag == 'noscript':
+            self.in_noscript = False
+        elif tag == 'head':
+            self.in_head = False
+        elif tag == 'header':
+            self.in_header = False
+        elif tag in ('nav', 'select'):
+            self.in_nav = False
+        elif tag == 'style':
+            self.in_style = False
+        elif tag == 'picture':
+            self.picture_source = None
+
+    def handle_data(self, data):
+        if self.in_style:
+            self.inline_css.append(data)
+
+
+class PageGraph:
+    """Dependency graph of every page in the site"""
+
+    def __init__(self, project_root=PROJECT_ROOT):
+        self.root = Path(project_root)
+        self.json_cache = {}
+        self.parsed = {}
+
+    def pages(self):
+        """Site-relative paths of every published HTML page"""
+        found = []
+        for path in sorted(self.root.rglob('*.html')):
+            rel = path.relative_to(self.root)
+            if not (SKIP_DIRS | FRAGMENT_DIRS).intersection(rel.parts[:-1]):
+                found.append(rel.as_posix())
+        return found
+
+    def load_json(self, rel):
+        if rel not in self.json_cache:
+            try:
+                with open(self.root / rel, 'r', encoding='utf-8') as f:
+                    self.json_cache[rel] = json.load(f)
+            except (FileNotFoundError, json.JSONDecodeError):
+                self.json_cache[rel] = {}
+        return self.json_cache[rel]
+
+    def parse(self, page, html=None):
+        """Parsed page (cached), or None if the file is missing
+
+        Pass html to use generated markup instead of the file on disk.
+        """
+        if page not in self.parsed or html is not None:
+            if html is None:
+                try:
+                    html = (self.root / page).read_text(encoding='utf-8')
+                except FileNotFoundError:
+                    return None
+            parser = PageAssetParser()
+            parser.feed(html)
+            self.parsed[page] = parser
+        return self.parsed[page]
+
+    def css_refs(self, css_text, base):
+        """(path, kind) for imports and url() references in a stylesheet"""
+        refs = [(resolve(ref, base), 'css') for ref in CSS_IMPORT.findall(css_text) if is_local(ref)]
+        refs += [(resolve(ref, base), 'image') for ref in CSS_URL.findall(css_text)
+                 if is_local(ref) and not ref.startswith('data:') and not ref.endswith('.css')]
+        return refs
+
+    def data_files(self, page):
+        """JSON files scripts.js fetches for a page, in request order"""
+        files = []
+        medium = self.load_json('assets/medium_posts.json')
+        archive_last = f"{(medium.get('archive') or {}).get('pages', 0):04d}"
+        for container, templates in SCRIPT_FETCHES.items():
+            if container in page.ids:
+                for template in templates:
+                    rel = template.format(archive_last=archive_last)
+                    if rel not in files and not rel.endswith('page-0000.json'):
+                        files.append(rel)
+        return files
+
+    def data_images(self, data_file):
+        """Images scripts.js renders from a JSON file"""
+        data = self.load_json(data_file)
+        images = []
+        for post in data.get('posts', []):
+            cover = post.get('cover') or {}
+            if cover.get('src'):
+                images.append(cover['src'])
+        for category in data.get('categories', {}).values():
+            images += [entry['thumbnail'] for entry in category.get('certificates', []) if entry.get('thumbnail')]
+            for entry in category.get('certifications', []):
+                sources = entry.get('badge_sources') or []
+                if sources:
+                    images.append(first_candidate(sources[0]['srcset']))
+                elif entry.get('badge_path'):
+                    images.append(entry['badge_path'])
+        return images
+
+    def dependencies(self, page):
+        """Every Dependency of a page, each path once, the page itself first"""
+        parser = self.parse(page)
+        if parser is None:
+            return []
+        deps = {page: Dependency(page, 'html', True, 0, None)}
+
+        def add(path, kind, critical, parent):
+            parent_dep = deps[parent]
+            critical = critical and parent_dep.critical
+            existing = deps.get(path)
+            if existing and (existing.critical or not critical):
+                return False
+            deps[path] = Dependency(path, kind, critical, parent_dep.depth + 1, parent)
+            return True
+
+        for css in parser.inline_css:
+            for path, kind in self.css_refs(css, page):
+                add(path, kind, kind == 'css', page)
+
+        stylesheets = []
+        for ref, kind, critical in parser.refs:
+            if not is_local(ref) or ref.startswith('data:'):
+                continue
+            path = resolve(ref, page)
+            if add(path, kind, critical, page) and kind == 'css':
+                stylesheets.append(path)
+
+        # Follow @import and url() through stylesheets
+        while stylesheets:
+            sheet = stylesheets.pop(0)
+            try:
+                text = (self.root / sheet).read_text(encoding='utf-8')
+            except FileNotFoundError:
+                continue
+            for path, kind in self.css_refs(text, sheet):
+                if add(path, kind, kind == 'css', sheet) and kind == 'css':
+                    stylesheets.append(path)
+
+        # JSON requested by scripts.js once it has run (or straight away if preloaded),
+        # then the images rendered from it
+        script = next((p for p, d in deps.items() if d.kind == 'js' and posixpath.basename(p) == SCRIPT), None)
+        if script:
+            preloaded = {resolve(ref, page) for ref, kind, _ in parser.refs if kind == 'json'}
+            for data_file in self.data_files(parser):
+                add(data_file, 'json', deps[script].critical, page if data_file in preloaded else script)
+                for image in self.data_images(data_file):
+                    add(resolve(image, ''), 'image', False, data_file)
+
+        return list(deps.values())
+
+    def external_origins(self, page):
+        """Origins a page loads subresources from, in first-use order"""
+        parser = self.parse(page)
+        origins = []
+        for ref, _, _ in (parser.refs if parser else []):
+            parts = urlsplit(ref if not ref.startswith('//') else 'https:' + ref)
+            if parts.scheme in ('http', 'https') and parts.netloc:
+                origin = f'{parts.scheme}://{parts.netloc}'
+                if origin not in origins:
+                    origins.append(origin)
+        return origins
+
+    def nav_graph(self):
+        """{page: nav targets} for every page, as site-relative paths"""
+        graph = {}
+        for page in self.pages():
+            parser = self.parse(page)
+            targets = []
+            for ref in parser.nav_links:
+                if is_local(ref):
+                    target = resolve(ref, page)
+                    if target != page and target not in targets:
+                        targets.append(target)
+            graph[page] = targets
+        return graph
+
+
+def main():
+    graph = PageGraph(PROJECT_ROOT)
+    pages = sys.argv[1:] or graph.pages()
+    for page in pages:
+        deps = graph.dependencies(page)
+        if not deps:
+            print(f"❌ {page}: not found")
+            continue
+        print(f"\n📄 {page} ({len(deps)} requests)")
+        for dep in deps[1:]:
+            marker = '⚡' if dep.critical else '  '
+            print(f"  {marker} {'  ' * (dep.depth - 1)}{dep.path} [{dep.kind}] ← {dep.parent}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+Decide which update stages have work to do, so scheduled runs can stop
+before installing anything when nothing changed:
+  - medium: the feed changed since the last fetch (conditional GET with the
+    stored ETag/Last-Modified, then a hash of the feed items), or the last
+    fetch is older than FEED_TTL_HOURS
+  - badges: a badge's issue_date or expiry_date has passed since the last
+    generation, so it must appear or be marked expired exactly on time
+  - every stage: its input files changed since it last ran
+State lives in .cache/plan_state.json (restored from the Actions cache in
+CI); stages record themselves with --record after they run.
+
+Usage:
+    python3 tools/plan.py                          # every stage, with reasons
+    python3 tools/plan.py medium --github-output   # set due/stages/next_due step outputs
+    python3 tools/plan.py --offline                # skip the feed request
+    python3 tools/plan.py --record badges          # mark a stage as just run
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+STATE_PATH = PROJECT_ROOT / '.cache' / 'plan_state.json'
+
+FEED_URL = 'https://medium.com/feed/@{username}'
+FEED_TTL_HOURS = 24 * 7
+FEED_TIMEOUT = 10
+USER_AGENT = 'portfolio-plan'
+# The channel's lastBuildDate changes on every request; only the items matter
+FEED_ITEM = re.compile(rb'<item>.*?</item>', re.S)
+# `issue_date: '2026-05-05'` lines in badge_certifications.yaml, quoted or not
+BADGE_DATE = re.compile(r'''^[ \t-]*(?:issue_date|expiry_date):[ \t]*['"]?(\d{4}-\d{2}-\d{2})['"]?[ \t]*(?:#.*)?$''', re.M)
+
+# Stage -> input files/directories, plus the stage-specific checks it needs
+STAGES = {
+    'medium': {
+        'inputs': ['tools/fetch_medium.py', 'tools/models.py'],
+        'feed': True,
+        'ttl_hours': FEED_TTL_HOURS,
+    },
+    'badges': {
+        'inputs': ['tools/badge_certifications.yaml', 'tools/generate_badge_certifications.py',
+                   'tools/optimize_images.py', 'tools/models.py', 'assets/badges'],
+        'dates': 'tools/badge_certifications.yaml',
+        'output': 'assets/badge_certifications.json',
+    },
+    'certificates': {
+        'inputs': ['tools/certificates.yaml', 'tools/generate_certificates_from_yaml.py',
+                   'tools/certificate_stream.py', 'tools/optimize_pdfs.py', 'tools/render_thumbnails.py',
+                   'tools/models.py', 'assets/certificates'],
+    },
+    'experience': {
+        'inputs': ['tools/experience.yaml', 'tools/generate_experience.py', 'tools/models.py',
+                   'tools/build_pages.py', 'tools/site.yaml', 'tools/pages', 'tools/templates',
+                   'styles.css'],
+    },
+}
+
+
+def utc_now():
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def parse_time(value):
+    """Aware datetime from an ISO string; naive times are taken as UTC (as on CI runners)"""
+    parsed = datetime.fromisoformat(value)
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def feed_url():
+    return FEED_URL.format(username=os.getenv('MEDIUM_USERNAME', 'vjmourya').strip())
+
+
+def inputs_hash(paths, project_root=PROJECT_ROOT):
+    """Hash of every input file's path and contents (directories recursively)"""
+    root = Path(project_root)
+    digest = hashlib.sha256()
+    for rel in sorted(paths):
+        path = root / rel
+        files = sorted(p for p in path.rglob('*') if p.is_file()) if path.is_dir() else [path]
+        for file in files:
+            if not file.is_file():
+                continue
+            digest.update(file.relative_to(root).as_posix().encode('utf-8') + b'\0')
+            digest.update(hashlib.sha256(file.read_bytes()).digest())
+    return digest.hexdigest()[:16]
+
+
+def feed_fingerprint(body):
+    """Hash of the feed's items, ignoring channel fields that change on every request"""
+    digest = hashlib.sha256()
+    for item in FEED_ITEM.findall(body):
+        digest.update(item)
+    return digest.hexdigest()[:16]
+
+
+def fetch_feed(url, entry=None, timeout=FEED_TIMEOUT):
+    """Conditional GET: {'status', 'body', 'etag', 'modified'}, or None if the request failed"""
+    # Imported here: http.client and its email parsing dominate the planner's startup
+    import urllib.error
+    import urllib.request
+
+    headers = {'User-Agent': USER_AGENT}
+    if entry and entry.get('etag'):
+        headers['If-None-Match'] = entry['etag']
+    if entry and entry.get('modified'):
+        headers['If-Modified-Since'] = entry['modified']
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            return {'status': response.status, 'body': response.read(),
+                    'etag': response.headers.get('ETag'), 'modified': response.headers.get('Last-Modified')}
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            return {'status': 304, 'body': b'', 'etag': entry.get('etag'), 'modified': entry.get('modified')}
+        print(f"⚠️  Feed request failed: HTTP {e.code}")
+    except (OSError, ValueError) as e:
+        print(f"⚠️  Feed request failed: {e}")
+    return None
+
+
+class PlanState:
+    """{stage: {ran_at, inputs, etag, modified, fingerprint}} from the last run of each stage"""
+
+    def __init__(self, state_path=STATE_PATH):
+        self.state_path = Path(state_path)
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                self.entries = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.entries = {}
+        self.dirty = False
+
+    def get(self, stage):
+        return self.entries.get(stage)
+
+    def record(self, stage, project_root=PROJECT_ROOT, now=None, **fields):
+        """Mark a stage as run now with its current inputs; extra fields (feed validators) are kept"""
+        entry = dict(self.entries.get(stage) or {})
+        entry.update({'ran_at': (now or utc_now()).isoformat(),
+                      'inputs': inputs_hash(STAGES[stage]['inputs'], project_root)})
+        entry.update({key: value for key, value in fields.items() if value is not None})
+        self.entries[stage] = entry
+        self.dirty = True
+        return entry
+
+    def save(self):
+        if not self.dirty:
+            return
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.state_path, 'w', encoding='utf-8') as f:
+            json.dump(self.entries, f, indent=2, sort_keys=True)
+        self.dirty = False
+
+
+def badge_dates(yaml_path):
+    """Every issue_date and expiry_date in the badge YAML, as midnight-UTC datetimes
+
+    Read with a regex rather than PyYAML so the plan step runs before any
+    dependency is installed. Only YYYY-MM-DD values count, as in the model.
+    """
+    with open(yaml_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    dates = set()
+    for value in BADGE_DATE.findall(text):
+        try:
+            day = datetime.strptime(value, '%Y-%m-%d')
+        except ValueError:
+            continue
+        dates.add(day.replace(tzinfo=timezone.utc))
+    return sorted(dates)
+
+
+def last_run(config, entry, project_root):
+    """When the stage last ran: the recorded time, else the output's last_updated"""
+    if entry and entry.get('ran_at'):
+        return parse_time(entry['ran_at'])
+    if config.get('output'):
+        try:
+            with open(Path(project_root) / config['output'], 'r', encoding='utf-8') as f:
+                return parse_time(json.load(f)['last_updated'])
+        except (FileNotFoundError, KeyError, ValueError):
+            pass
+    return None
+
+
+def evaluate(stage, state, project_root=PROJECT_ROOT, now=None, offline=False):
+    """{'stage', 'due', 'reasons', 'next_due'} for one stage"""
+    config = STAGES[stage]
+    now = now or utc_now()
+    entry = state.get(stage)
+    ran_at = last_run(config, entry, project_root)
+    reasons, next_due = [], None
+
+    if not entry:
+        reasons.append('no record of a previous run')
+    elif entry.get('inputs') != inputs_hash(config['inputs'], project_root):
+        reasons.append('inputs changed')
+
+    if config.get('ttl_hours') and ran_at:
+        expires = ran_at + timedelta(hours=config['ttl_hours'])
+        if expires <= now:
+            reasons.append(f"last run over {config['ttl_hours']}h ago")
+        else:
+            next_due = expires
+
+    if config.get('dates'):
+        dates = badge_dates(Path(project_root) / config['dates'])
+        passed = [moment for moment in dates if ran_at and ran_at < moment <= now]
+        if passed:
+            reasons.append(f"badge issue/expiry date {passed[-1].date().isoformat()} passed")
+        upcoming = [moment for moment in dates if moment > now]
+        if upcoming:
+            next_due = min(next_due, upcoming[0]) if next_due else upcoming[0]
+
+    # Only ask the feed when nothing else already makes the stage due; a failed
+    # request leaves it idle, since the fetch itself would fail too
+    if config.get('feed') and entry and not reasons and not offline:
+        feed = fetch_feed(feed_url(), entry)
+        if feed and feed['status'] != 304 and feed_fingerprint(feed['body']) != entry.get('fingerprint'):
+            reasons.append('feed changed')
+
+    return {'stage': stage, 'due': bool(reasons), 'reasons': reasons,
+            'next_due': next_due.isoformat() if next_due else None}
+
+
+def write_github_output(results):
+    due = [r['stage'] for r in results if r['due']]
+    upcoming = sorted(r['next_due'] for r in results if r['next_due'])
+    with open(os.environ['GITHUB_OUTPUT'], 'a', encoding='utf-8') as f:
+        f.write(f"due={'true' if due else 'false'}\n")
+        f.write(f"stages={','.join(due)}\n")
+        f.write(f"next_due={upcoming[0] if upcoming else ''}\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Report which update stages are due')
+    parser.add_argument('stages', nargs='*', help=f"Stages to plan ({', '.join(STAGES)})")
+    parser.add_argument('--record', metavar='STAGE', choices=list(STAGES), help='Mark a stage as just run')
+    parser.add_argument('--offline', action='store_true', help='Skip the conditional feed request')
+    parser.add_argument('--json', action='store_true', help='Print the plan as JSON')
+    parser.add_argument('--github-output', action='store_true', help='Write due/stages/next_due to $GITHUB_OUTPUT')
+    args = parser.parse_args()
+
+    state = PlanState()
+    if args.record:
+        entry = state.record(args.record)
+        state.save()
+        print(f"✅ Recorded {args.record} at {entry['ran_at']} (inputs {entry['inputs']})")
+        return 0
+
+    unknown = [stage for stage in args.stages if stage not in STAGES]
+    if unknown:
+        print(f"❌ Unknown stage(s): {', '.join(unknown)}")
+        return 1
+
+    results = [evaluate(stage, state, offline=args.offline) for stage in args.stages or STAGES]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        for result in results:
+            status = '🟢 due' if result['due'] else '⚪ idle'
+            detail = '; '.join(result['reasons']) or (f"next due {result['next_due']}" if result['next_due'] else 'nothing to do')
+            print(f"  {status}  {result['stage']:<13} {detail}")
+        upcoming = sorted((r['next_due'], r['stage']) for r in results if r['next_due'])
+        print("\n" + "="*60)
+        due = [r['stage'] for r in results if r['due']]
+        print(f"✅ Due now: {', '.join(due) or 'nothing'}")
+        if upcoming:
+            print(f"⏰ Next due: {upcoming[0][1]} at {upcoming[0][0]}")
+
+    if args.github_output:
+        write_github_output(results)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
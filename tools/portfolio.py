@@ -0,0 +1,257 @@
+#!/usr/bin/env python3
+"""
+One entry point for the portfolio tools. Each subcommand maps to the script
+that does the work, and that module (with yaml, feedparser, Pillow, ...) is
+only imported when the subcommand runs, so `portfolio.py plan` doesn't pay
+for the page builder. Arguments after the subcommand are passed on to the
+script unchanged.
+
+Startup is checked against STARTUP_BUDGET_MS: `startup` imports each
+command's modules under `python -X importtime` and sums the import time from
+`import portfolio` on, taking the median of several runs.
+
+Usage:
+    python3 tools/portfolio.py add certificate|badge|experience
+    python3 tools/portfolio.py generate [certificates|badges|experience ...]
+    python3 tools/portfolio.py fetch [output.json] [--force]
+    python3 tools/portfolio.py validate [certificates|badges|experience ...]
+    python3 tools/portfolio.py build [pages ...] [--force]
+    python3 tools/portfolio.py serve [--port 8000] [--precompressed]
+    python3 tools/portfolio.py plan [stages ...] [--record STAGE]
+    python3 tools/portfolio.py startup              # import time per command vs budget
+"""
+
+import importlib
+import os
+import sys
+
+# os.path rather than pathlib: the dispatcher shouldn't add to every command's startup
+TOOLS_DIR = os.path.dirname(os.path.abspath(__file__))
+PROJECT_ROOT = os.path.dirname(TOOLS_DIR)
+
+ADD_TARGETS = {
+    'certificate': 'add_certificate',
+    'badge': 'add_badge_certification',
+    'experience': 'add_experience',
+}
+# In the order a full regeneration runs them
+GENERATE_TARGETS = {
+    'certificates': 'generate_certificates_from_yaml',
+    'badges': 'generate_badge_certifications',
+    'experience': 'generate_experience',
+}
+
+# Command -> (help, modules it imports when run)
+COMMANDS = {
+    'add': ('Add an entry interactively (certificate, badge, experience)', list(ADD_TARGETS.values())),
+    'generate': ('Regenerate the data files and pages from the YAML', list(GENERATE_TARGETS.values())),
+    'fetch': ('Fetch Medium posts into assets/medium_posts.json', ['fetch_medium']),
+    'validate': ('Check the YAML sources without generating anything', ['validate_data']),
+    'build': ('Render the pages and refresh the service worker', ['build_pages', 'build_service_worker']),
+    'serve': ('Serve the site locally', ['load_test']),
+    'plan': ('Report which update stages are due', ['plan']),
+}
+
+# Milliseconds of imports (not counting interpreter and site startup) each
+# command may take before its first line of work, as the median of 5 runs.
+# Quick commands stay in the tens of ms; the generators and builder are
+# allowed their template and image libraries.
+STARTUP_BUDGET_MS = {
+    'validate': 80,
+    'plan': 50,
+    'fetch': 150,
+    'add': 100,
+    'generate': 250,
+    'build': 200,
+    'serve': 120,
+}
+
+
+def load(command):
+    """Import a command's modules, as running it would"""
+    return [importlib.import_module(name) for name in COMMANDS[command][1]]
+
+
+def run_script(module_name, argv):
+    """Run a tool's main() as if it was invoked as `python3 tools/<module>.py argv...`"""
+    module = importlib.import_module(module_name)
+    saved = sys.argv
+    sys.argv = [os.path.join(TOOLS_DIR, f'{module_name}.py'), *argv]
+    try:
+        return module.main() or 0
+    finally:
+        sys.argv = saved
+
+
+def cmd_add(argv):
+    if not argv or argv[0] not in ADD_TARGETS:
+        print(f"❌ Choose what to add: {', '.join(ADD_TARGETS)}")
+        return 1
+    try:
+        return run_script(ADD_TARGETS[argv[0]], argv[1:])
+    except KeyboardInterrupt:
+        print("\n\n❌ Cancelled by user")
+        return 1
+
+
+def cmd_generate(argv):
+    targets = argv or list(GENERATE_TARGETS)
+    unknown = [target for target in targets if target not in GENERATE_TARGETS]
+    if unknown:
+        print(f"❌ Unknown target(s): {', '.join(unknown)} (choose from {', '.join(GENERATE_TARGETS)})")
+        return 1
+    for target in targets:
+        result = run_script(GENERATE_TARGETS[target], [])
+        if result:
+            return result
+    return 0
+
+
+def cmd_fetch(argv):
+    # fetch_medium.py takes the output path and --force (skip the conditional GET)
+    paths = [arg for arg in argv if arg != '--force']
+    output = paths[0] if paths else os.path.join(PROJECT_ROOT, 'assets', 'medium_posts.json')
+    importlib.import_module('fetch_medium').main(output, force='--force' in argv)
+    return 0
+
+
+def cmd_validate(argv):
+    return run_script('validate_data', argv)
+
+
+def cmd_build(argv):
+    result = run_script('build_pages', argv)
+    if result:
+        return result
+    # Page changes alter the precache list
+    return run_script('build_service_worker', [])
+
+
+def cmd_serve(argv):
+    import argparse
+
+    parser = argparse.ArgumentParser(prog='portfolio.py serve', description=COMMANDS['serve'][0])
+    parser.add_argument('--port', type=int, default=8000, help='Port on 127.0.0.1 (default: 8000)')
+    parser.add_argument('--precompressed', action='store_true',
+                        help='Serve .gz/.br copies for the Accept-Encoding, as in production')
+    args = parser.parse_args(argv)
+
+    load_test = importlib.import_module('load_test')
+    precompressed_dir = None
+    if args.precompressed:
+        paths = sorted({path for deps in load_test.page_loads(PROJECT_ROOT).values() for path, _ in deps})
+        load_test.precompress(PROJECT_ROOT, paths)
+        precompressed_dir = str(load_test.PRECOMPRESSED_DIR)
+
+    print(f"🌐 Serving {PROJECT_ROOT} at http://127.0.0.1:{args.port}/ (Ctrl+C to stop)")
+    try:
+        load_test.serve(args.port, PROJECT_ROOT, precompressed_dir)
+    except KeyboardInterrupt:
+        print("\n👋 Stopped")
+    return 0
+
+
+def cmd_plan(argv):
+    return run_script('plan', argv)
+
+
+def import_time_ms(command, python=sys.executable):
+    """(total ms, [(ms, module)] heaviest top-level imports) for importing a command's modules
+
+    Only imports from `import portfolio` on are counted: what the interpreter
+    and `site` load before running any code is the same for every command.
+    """
+    import subprocess
+
+    code = f"import sys; sys.path.insert(0, {TOOLS_DIR!r}); import portfolio; portfolio.load({command!r})"
+    result = subprocess.run([python, '-X', 'importtime', '-c', code], capture_output=True, text=True)
+    if result.returncode:
+        raise ImportError(result.stderr.strip().splitlines()[-1])
+    top_level = []
+    for line in result.stderr.splitlines():
+        if not line.startswith('import time:') or 'cumulative' in line:
+            continue
+        _, cumulative, name = line.split('|')
+        # Nested imports are indented two spaces per level under their importer
+        if not name[1:].startswith(' '):
+            top_level.append((int(cumulative) / 1000, name.strip()))
+    names = [name for _, name in top_level]
+    if 'portfolio' in names:
+        top_level = top_level[names.index('portfolio'):]
+    return round(sum(ms for ms, _ in top_level), 1), sorted(top_level, reverse=True)[:3]
+
+
+def startup_times(repeat=5):
+    """{command: (total ms, heaviest imports)}, or the ImportError for commands missing a dependency
+
+    Each command takes the median of `repeat` runs, after one run to warm the
+    bytecode cache, so one slow run on a busy machine doesn't fail the check.
+    """
+    times = {}
+    for command in COMMANDS:
+        try:
+            import_time_ms(command)
+            runs = sorted((import_time_ms(command) for _ in range(repeat)), key=lambda run: run[0])
+            times[command] = runs[len(runs) // 2]
+        except ImportError as e:
+            times[command] = e
+    return times
+
+
+def cmd_startup(argv):
+    over = []
+    print("⏱️  Import time per command (python -X importtime)")
+    for command, measured in startup_times().items():
+        budget = STARTUP_BUDGET_MS[command]
+        if isinstance(measured, ImportError):
+            print(f"  ⚠️  {command:<9} skipped: {measured}")
+            continue
+        total, heaviest = measured
+        if total > budget:
+            over.append(command)
+        top = ', '.join(f"{name} {ms:.0f}" for ms, name in heaviest)
+        print(f"  {'✅' if total <= budget else '❌'} {command:<9} {total:>6.1f} ms / {budget} ms  ({top})")
+
+    print("\n" + "="*60)
+    if over:
+        print(f"❌ Over budget: {', '.join(over)}")
+        return 1
+    print("✅ Every command starts within budget")
+    return 0
+
+
+HANDLERS = {
+    'add': cmd_add,
+    'generate': cmd_generate,
+    'fetch': cmd_fetch,
+    'validate': cmd_validate,
+    'build': cmd_build,
+    'serve': cmd_serve,
+    'plan': cmd_plan,
+    'startup': cmd_startup,
+}
+
+
+def usage():
+    print("Usage: python3 tools/portfolio.py <command> [args...]\n\nCommands:")
+    for command, (help_text, _) in COMMANDS.items():
+        print(f"  {command:<10} {help_text}")
+    print(f"  {'startup':<10} Check each command's import time against its budget")
+    print("\nRun `portfolio.py <command> --help` for a command's own options.")
+
+
+def main():
+    # No argparse here: dispatching should cost nothing, and the scripts parse their own arguments
+    if len(sys.argv) < 2 or sys.argv[1] in ('-h', '--help'):
+        usage()
+        return 0
+    command, argv = sys.argv[1], sys.argv[2:]
+    if command not in HANDLERS:
+        print(f"❌ Unknown command: {command}\n")
+        usage()
+        return 1
+    return HANDLERS[command](argv)
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+Reconcile the certificate PDFs on disk with certificates.yaml.
+generate_certificates.py lists what is on disk, generate_certificates_from_yaml.py
+trusts the YAML; this reports where the two disagree:
+  - PDFs with no YAML entry (a draft entry is generated for each)
+  - YAML entries whose PDF is missing
+  - moved or renamed files: an entry whose file now lives in another category
+    or differs only in punctuation (e.g. ':' saved as '_')
+  - entries that only match a file by case or spacing (broken on GitHub Pages)
+Both sides are indexed once by normalized path, so a run is linear in the
+number of files and entries.
+
+Usage:
+    python3 tools/reconcile_certificates.py            # report + draft entries
+    python3 tools/reconcile_certificates.py --write    # add drafts, repoint moved entries
+    python3 tools/reconcile_certificates.py --check    # exit 1 if anything drifted
+"""
+
+import argparse
+import json
+import re
+import sys
+import unicodedata
+from pathlib import Path
+
+import yaml
+
+from certificate_classifier import clean_filename, extract_provider
+
+PROJECT_ROOT = Path(__file__).parent.parent
+CERTIFICATES_DIR = PROJECT_ROOT / 'assets' / 'certificates'
+CERTIFICATES_YAML = Path(__file__).parent / 'certificates.yaml'
+
+CATEGORY_LINE = re.compile(r'^(\s+category:\s*).*$', re.M)
+FILENAME_LINE = re.compile(r'^(\s+filename:\s*).*$', re.M)
+TOP_LEVEL_KEY = re.compile(r'^[A-Za-z_][\w-]*:')
+LOOSE_KEY = re.compile(r'[^0-9a-z]+')
+
+
+def normalize(text):
+    """Comparison key: NFC, case-folded, whitespace collapsed"""
+    return ' '.join(unicodedata.normalize('NFC', text).casefold().split())
+
+
+def loose_key(filename):
+    """Filename key that ignores punctuation, for matching moved or renamed files"""
+    return LOOSE_KEY.sub(' ', normalize(filename)).strip()
+
+
+def path_key(category, filename):
+    return f'{normalize(category)}/{normalize(filename)}'
+
+
+def index_disk(certificates_dir=CERTIFICATES_DIR):
+    """{normalized path: (category, filename)} for every PDF one level below the root"""
+    files = {}
+    for path in sorted(Path(certificates_dir).glob('*/*.pdf')):
+        if path.is_file():
+            files[path_key(path.parent.name, path.name)] = (path.parent.name, path.name)
+    return files
+
+
+def index_yaml(config):
+    """{normalized path: [entry index]} for every YAML entry with a category and filename"""
+    entries = {}
+    for index, cert in enumerate(config.get('certificates') or []):
+        if cert.get('category') and cert.get('filename'):
+            entries.setdefault(path_key(cert['category'], cert['filename']), []).append(index)
+    return entries
+
+
+def reconcile(config, disk):
+    """Set differences between the YAML entries and the files on disk"""
+    certificates = config.get('certificates') or []
+    listed = index_yaml(config)
+
+    unlisted = {key: disk[key] for key in disk.keys() - listed.keys()}
+    missing = {key: indexes for key, indexes in listed.items() if key not in disk}
+
+    # Case/spacing-only differences resolve by key but break on a case-sensitive server
+    mismatched = []
+    for key in listed.keys() & disk.keys():
+        category, filename = disk[key]
+        for index in listed[key]:
+            cert = certificates[index]
+            if (cert['category'], cert['filename']) != (category, filename):
+                mismatched.append({'index': index, 'title': cert.get('title'),
+                                   'yaml': f"{cert['category']}/{cert['filename']}",
+                                   'disk': f'{category}/{filename}',
+                                   'category': category, 'filename': filename})
+
+    # A missing entry matching exactly one unlisted file by loose name was moved or renamed
+    unlisted_by_name = {}
+    for key, (category, filename) in unlisted.items():
+        unlisted_by_name.setdefault(loose_key(filename), []).append(key)
+    moved = []
+    for key, indexes in list(missing.items()):
+        candidates = unlisted_by_name.get(loose_key(key.split('/', 1)[1]), [])
+        if len(candidates) != 1 or candidates[0] not in unlisted:
+            continue
+        category, filename = unlisted.pop(candidates[0])
+        for index in indexes:
+            cert = certificates[index]
+            moved.append({'index': index, 'title': cert.get('title'),
+                          'yaml': f"{cert['category']}/{cert['filename']}",
+                          'disk': f'{category}/{filename}', 'category': category, 'filename': filename})
+        del missing[key]
+
+    return {
+        'unlisted': sorted(unlisted.values()),
+        'missing': sorted((index for indexes in missing.values() for index in indexes)),
+        'moved': sorted(moved, key=lambda m: m['index']),
+        'mismatched': sorted(mismatched, key=lambda m: m['index']),
+    }
+
+
+def draft_entries(unlisted, config):
+    """YAML entries for unlisted files, numbered after the highest existing number"""
+    numbers = [int(cert['number']) for cert in config.get('certificates') or []
+               if str(cert.get('number', '')).isdigit()]
+    next_number = max(numbers, default=0) + 1
+    drafts = []
+    for offset, (category, filename) in enumerate(unlisted):
+        drafts.append({
+            'title': clean_filename(filename),
+            'number': str(next_number + offset),
+            'provider': extract_provider(filename),
+            'category': category,
+            'filename': filename,
+            'completion_date': '',
+            'verification_url': '',
+        })
+    return drafts
+
+
+def yaml_scalar(value):
+    """Plain scalar when YAML reads it back unchanged, otherwise double-quoted"""
+    try:
+        if value and yaml.safe_load(value) == value and value.strip() == value:
+            return value
+    except yaml.YAMLError:
+        pass
+    return json.dumps(value, ensure_ascii=False)
+
+
+def format_entry(entry):
+    quoted = {'title', 'number', 'filename'}
+    lines = []
+    for field, value in entry.items():
+        text = ("''" if value == '' else json.dumps(value, ensure_ascii=False) if field in quoted
+                else yaml_scalar(value))
+        lines.append(f"{'- ' if not lines else '  '}{field}: {text}")
+    return '\n'.join(lines) + '\n'
+
+
+def apply_changes(yaml_path, text, drafts, fixes):
+    """Rewrite certificates.yaml in place, keeping its comments and formatting
+
+    fixes are {'index', 'category', 'filename'} for entries to repoint; drafts
+    are inserted at the top of the list, where the newest entries go.
+    """
+    lines = text.splitlines(keepends=True)
+    start = next((i for i, line in enumerate(lines) if line.rstrip() == 'certificates:'), None)
+    if start is None:
+        raise ValueError('certificates.yaml has no top-level certificates: list; no changes written')
+    blocks, end = [], len(lines)
+    for i in range(start + 1, len(lines)):
+        if lines[i].startswith('- '):
+            blocks.append(i)
+        elif TOP_LEVEL_KEY.match(lines[i]):
+            end = i
+            break
+
+    bounds = list(zip(blocks, blocks[1:] + [end]))
+    for fix in fixes:
+        first, last = bounds[fix['index']]
+        block = ''.join(lines[first:last])
+        block = CATEGORY_LINE.sub(lambda m: m.group(1) + yaml_scalar(fix['category']), block, count=1)
+        block = FILENAME_LINE.sub(lambda m: m.group(1) + json.dumps(fix['filename'], ensure_ascii=False),
+                                  block, count=1)
+        lines[first:last] = [block] + [''] * (last - first - 1)
+
+    insert_at = blocks[0] if blocks else start + 1
+    lines[insert_at:insert_at] = [format_entry(entry) for entry in drafts]
+    updated = ''.join(lines)
+
+    parsed = yaml.safe_load(updated) or {}
+    previous = yaml.safe_load(text) or {}
+    if len(parsed.get('certificates') or []) != len(previous.get('certificates') or []) + len(drafts):
+        raise ValueError('certificates.yaml layout not recognized; no changes written')
+    Path(yaml_path).write_text(updated, encoding='utf-8')
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Reconcile certificate PDFs with certificates.yaml')
+    parser.add_argument('--write', action='store_true', help='Add draft entries and repoint moved or renamed entries')
+    parser.add_argument('--check', action='store_true', help='Exit 1 if the PDFs and YAML disagree')
+    args = parser.parse_args()
+
+    text = CERTIFICATES_YAML.read_text(encoding='utf-8')
+    config = yaml.safe_load(text) or {}
+    certificates = config.get('certificates') or []
+    disk = index_disk(CERTIFICATES_DIR)
+    result = reconcile(config, disk)
+    drafts = draft_entries(result['unlisted'], config)
+    known_categories = set(config.get('categories') or {})
+
+    print(f"🔄 {len(disk)} PDFs on disk, {len(certificates)} entries in certificates.yaml")
+
+    if result['moved']:
+        print(f"\n🚚 Moved or renamed ({len(result['moved'])}):")
+        for move in result['moved']:
+            print(f"  • {move['title']}: {move['yaml']} → {move['disk']}")
+    if result['mismatched']:
+        print(f"\n🔠 Case/spacing differs from the file ({len(result['mismatched'])}):")
+        for item in result['mismatched']:
+            print(f"  • {item['yaml']} → {item['disk']}")
+    if result['missing']:
+        print(f"\n❌ Entries without a PDF ({len(result['missing'])}):")
+        for index in result['missing']:
+            cert = certificates[index]
+            print(f"  • {cert['category']}/{cert['filename']}")
+    if drafts:
+        print(f"\n📝 PDFs missing from certificates.yaml ({len(drafts)}), draft entries:\n")
+        print(''.join(format_entry(entry) for entry in drafts))
+        for category in sorted({d['category'] for d in drafts} - known_categories):
+            print(f"⚠️  Category '{category}' has no entry under categories:")
+
+    drifted = any(result[key] for key in ('unlisted', 'missing', 'moved', 'mismatched'))
+    if args.write and (drafts or result['moved'] or result['mismatched']):
+        try:
+            apply_changes(CERTIFICATES_YAML, text, drafts, result['moved'] + result['mismatched'])
+        except ValueError as e:
+            print(f"❌ {e}")
+            return 1
+        print(f"\n✅ Updated: {CERTIFICATES_YAML}")
+        print("   Fill in completion_date/verification_url for the new entries, then run:")
+        print("   python3 tools/generate_certificates_from_yaml.py")
+
+    print("\n" + "="*60)
+    if not drifted:
+        print("✅ certificates.yaml matches assets/certificates/")
+    else:
+        print(f"⚠️  {len(result['unlisted'])} unlisted, {len(result['missing'])} missing, "
+              f"{len(result['moved'])} moved, {len(result['mismatched'])} case/spacing")
+    return 1 if args.check and drifted else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
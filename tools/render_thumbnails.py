@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+Render the first page of each certificate PDF to a small WebP thumbnail, so
+the certifications page can show previews and only fetch a PDF on click.
+Pages are rasterized on the CPU with PDFium (pypdfium2) in a process pool.
+Thumbnails are named by the PDF's content hash under
+assets/optimized/thumbnails/, so an unchanged PDF is never re-rendered and
+a renamed or moved one reuses its thumbnail; they are also kept in the build
+cache (build_cache.py) for fresh checkouts. The generators add `thumbnail`,
+`thumbnail_size` (bytes), `thumbnail_width` and `thumbnail_height` to each
+entry in certificates.json.
+
+Usage:
+    python3 tools/render_thumbnails.py
+    python3 tools/render_thumbnails.py --width 240 --workers 4
+"""
+
+import argparse
+import io
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import pypdfium2 as pdfium
+except ImportError:  # Only needed to render, not to read the manifest
+    pdfium = None
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+from build_cache import BuildCache, library_version
+from optimize_pdfs import collect_sources, file_hash
+
+PROJECT_ROOT = Path(__file__).parent.parent
+OUTPUT_DIR = 'assets/optimized/thumbnails'
+MANIFEST_PATH = PROJECT_ROOT / OUTPUT_DIR / 'manifest.json'
+
+THUMBNAIL_WIDTH = 320
+WEBP_QUALITY = 75
+# Bump when the rendering settings change so every thumbnail is redrawn
+RENDERER_VERSION = 1
+
+
+def load_manifest(manifest_path=MANIFEST_PATH):
+    """Load the thumbnail manifest (empty if nothing was rendered yet)"""
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {'thumbnails': {}}
+
+
+def thumbnail_path(digest, width):
+    return f'{OUTPUT_DIR}/{digest[:16]}-{width}.webp'
+
+
+def render_thumbnail(project_root, src, digest, width):
+    """Rasterize page 1 of a PDF to WebP (runs in a worker process)"""
+    rel = thumbnail_path(digest, width)
+    output = Path(project_root) / rel
+    output.parent.mkdir(parents=True, exist_ok=True)
+
+    pdf = pdfium.PdfDocument(str(Path(project_root) / src))
+    try:
+        page = pdf[0]
+        # Render at 2x and downsample for smoother text than a direct small render
+        bitmap = page.render(scale=2 * width / page.get_width())
+        image = bitmap.to_pil().convert('RGB')
+        page.close()
+    finally:
+        pdf.close()
+
+    height = max(1, round(image.height * width / image.width))
+    image = image.resize((width, height), Image.LANCZOS)
+    buffer = io.BytesIO()
+    image.save(buffer, 'WEBP', quality=WEBP_QUALITY, method=6)
+    output.write_bytes(buffer.getvalue())
+
+    return src, {
+        'hash': digest,
+        'version': RENDERER_VERSION,
+        'path': rel,
+        'width': width,
+        'height': height,
+        'bytes': len(buffer.getvalue()),
+    }
+
+
+def build(project_root=PROJECT_ROOT, workers=None, width=THUMBNAIL_WIDTH, cache=None):
+    """Render thumbnails for new or changed PDFs; returns (manifest, number rendered, [(src, error)])"""
+    manifest_path = Path(project_root) / OUTPUT_DIR / 'manifest.json'
+    manifest = load_manifest(manifest_path)
+    sources = collect_sources(project_root)
+    cache = cache or BuildCache()
+    version = [RENDERER_VERSION, library_version('pypdfium2'), library_version('pillow')]
+
+    # Existing thumbnails by content, so moved or duplicate PDFs reuse them
+    by_hash = {entry['hash']: entry for entry in manifest['thumbnails'].values()
+               if entry.get('version') == RENDERER_VERSION and entry.get('width') == width
+               and (Path(project_root) / entry['path']).exists()}
+
+    jobs = {}
+    for src in sources:
+        digest = file_hash(Path(project_root) / src)
+        if digest not in by_hash and digest not in jobs:
+            # Thumbnails depend only on the PDF's content, not its name
+            cached = cache.fetch(cache.key('thumbnails', {'hash': digest, 'width': width}, version), project_root)
+            if cached:
+                by_hash[digest] = cached
+        if digest in by_hash:
+            manifest['thumbnails'][src] = by_hash[digest]
+        else:
+            jobs.setdefault(digest, []).append(src)
+
+    print(f"🖼️  {len(sources)} PDFs, {len(jobs)} thumbnail(s) to render at {width}px")
+
+    failed = []
+    if jobs:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {digest: pool.submit(render_thumbnail, str(project_root), srcs[0], digest, width)
+                       for digest, srcs in jobs.items()}
+            for digest, future in futures.items():
+                try:
+                    _, entry = future.result()
+                except Exception as e:  # A broken PDF shouldn't stop the others
+                    failed.append((jobs[digest][0], e))
+                    for src in jobs[digest]:
+                        manifest['thumbnails'].pop(src, None)
+                    continue
+                for src in jobs[digest]:
+                    manifest['thumbnails'][src] = entry
+                cache.publish(cache.key('thumbnails', {'hash': digest, 'width': width}, version),
+                              'thumbnails', [entry['path']], entry, project_root)
+    if cache.hits or cache.stored:
+        print(f"🗃️  {cache.summary()}")
+
+    # Drop entries for sources that no longer exist, then unreferenced files
+    for src in [s for s in manifest['thumbnails'] if s not in sources]:
+        del manifest['thumbnails'][src]
+    referenced = {entry['path'] for entry in manifest['thumbnails'].values()}
+    output_dir = Path(project_root) / OUTPUT_DIR
+    for path in output_dir.glob('*.webp') if output_dir.exists() else []:
+        if f'{OUTPUT_DIR}/{path.name}' not in referenced:
+            path.unlink()
+
+    manifest['thumbnails'] = dict(sorted(manifest['thumbnails'].items()))
+    manifest_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, ensure_ascii=False)
+
+    return manifest, len(jobs) - len(failed), failed
+
+
+def thumbnail_fields(src, project_root=PROJECT_ROOT, manifest=None, digest=None):
+    """certificates.json fields for a PDF's thumbnail ({} if there is none yet)"""
+    manifest = manifest if manifest is not None else load_manifest(Path(project_root) / OUTPUT_DIR / 'manifest.json')
+    entry = manifest.get('thumbnails', {}).get(src)
+    source = Path(project_root) / src
+    if not entry or not source.exists() or not (Path(project_root) / entry['path']).exists():
+        return {}
+    # A thumbnail of an older version of the PDF is left out until it is re-rendered
+    if entry['hash'] != (digest or file_hash(source)):
+        return {}
+    return {
+        'thumbnail': entry['path'],
+        'thumbnail_size': entry['bytes'],
+        'thumbnail_width': entry['width'],
+        'thumbnail_height': entry['height'],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Render first-page WebP thumbnails of certificate PDFs')
+    parser.add_argument('--workers', type=int, default=None, help='Worker processes (default: CPU count)')
+    parser.add_argument('--width', type=int, default=THUMBNAIL_WIDTH,
+                        help=f'Thumbnail width in pixels (default: {THUMBNAIL_WIDTH})')
+    args = parser.parse_args()
+
+    if pdfium is None or Image is None:
+        print("❌ pypdfium2 and Pillow are required: pip3 install pypdfium2 pillow")
+        return 1
+
+    manifest, rendered, failed = build(PROJECT_ROOT, args.workers, args.width)
+
+    for src, error in failed:
+        print(f"  ✗ {src}: {error}")
+    total = sum(entry['bytes'] for entry in {e['path']: e for e in manifest['thumbnails'].values()}.values())
+
+    print("\n" + "="*60)
+    print(f"✅ {len(manifest['thumbnails'])} thumbnails ({rendered} rendered, {len(failed)} failed), "
+          f"{total / 1024:.0f} KB")
+    print(f"📄 Manifest: {MANIFEST_PATH}")
+    print("="*60)
+    return 1 if failed else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
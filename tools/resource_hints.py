@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""
+Inject resource hints into each page's <head>:
+  - preload for the JSON scripts.js fetches for the page (SCRIPT_FETCHES in
+    page_graph.py) and for the page's hero image
+  - preconnect for other origins the page loads subresources from
+  - prefetch for the most likely next pages from the nav graph
+The hints live between <!-- resource-hints --> markers and are regenerated
+on every run.
+
+Usage:
+    python3 tools/resource_hints.py                # every page
+    python3 tools/resource_hints.py index.html
+"""
+
+import argparse
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+
+from page_graph import PageGraph, is_local, resolve
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+PREFETCH_PAGES = 2
+# Larger heroes should be served through an optimized <picture> variant instead
+HERO_MAX_BYTES = 150 * 1024
+
+HINTS_START = '<!-- resource-hints -->'
+HINTS_END = '<!-- /resource-hints -->'
+HINTS_BLOCK = re.compile(re.escape(HINTS_START) + r'.*?' + re.escape(HINTS_END), re.S)
+# Hints go before the first stylesheet so they are discovered before CSS is parsed
+INSERT_BEFORE = re.compile(r'<style id="critical-css">|<link rel="stylesheet"|</head>')
+
+
+def strip_resource_hints(html):
+    return HINTS_BLOCK.sub('', html)
+
+
+def link_popularity(graph):
+    """How many pages link to each page from their content (not the nav)"""
+    counts = Counter()
+    for page in graph.pages():
+        parser = graph.parse(page)
+        targets = {resolve(ref, page) for ref in parser.content_links if is_local(ref)}
+        counts.update(target for target in targets if target != page)
+    return counts
+
+
+def likely_next_pages(graph, page, popularity, count=PREFETCH_PAGES):
+    """Nav targets ranked by links from this page's content, then site-wide links, then nav order"""
+    parser = graph.parse(page)
+    targets = graph.nav_graph().get(page, [])
+    if not targets:
+        return []
+    own = Counter(resolve(ref, page) for ref in parser.content_links if is_local(ref))
+    ranked = sorted(targets, key=lambda t: (-own[t], -popularity[t], targets.index(t)))
+    return ranked[:count]
+
+
+def hero_image(graph, page):
+    """The page's above-the-fold hero image as (path, srcset, type), or None
+
+    Only the first eager content image counts: the header logo and lazy images
+    are skipped, and a hero whose 1x file is over HERO_MAX_BYTES isn't worth
+    delaying the CSS and JSON preloads for.
+    """
+    parser = graph.parse(page)
+    if not parser.hero_candidates:
+        return None
+    url = parser.hero_candidates[0]
+    if not is_local(url) or url.startswith('data:'):
+        return None
+    path = resolve(url, page)
+    try:
+        if (graph.root / path).stat().st_size > HERO_MAX_BYTES:
+            return None
+    except FileNotFoundError:
+        return None
+    srcset, mime = parser.sources.get(url, (None, None))
+    return path, srcset, mime
+
+
+def page_hints(graph, page, popularity):
+    """<link> tags for one page"""
+    parser = graph.parse(page)
+    hints = []
+    for origin in graph.external_origins(page):
+        hints.append(f'<link rel="preconnect" href="{origin}" crossorigin>')
+
+    hero = hero_image(graph, page)
+    if hero:
+        path, srcset, mime = hero
+        extra = f' imagesrcset="{srcset}"' if srcset else ''
+        extra += f' type="{mime}"' if mime else ''
+        hints.append(f'<link rel="preload" href="{path}" as="image"{extra}>')
+
+    loads_script = any(dep.kind == 'js' and dep.path.endswith('scripts.js') for dep in graph.dependencies(page))
+    if loads_script:
+        for data_file in graph.data_files(parser):
+            hints.append(f'<link rel="preload" href="{data_file}" as="fetch" crossorigin>')
+
+    for target in likely_next_pages(graph, page, popularity):
+        hints.append(f'<link rel="prefetch" href="{target}">')
+    return hints
+
+
+def inject_resource_hints(html, page, graph=None, popularity=None):
+    """Return (html with hints, hint tags); pages that need no hints are returned unchanged"""
+    graph = graph or PageGraph(PROJECT_ROOT)
+    html = strip_resource_hints(html)
+    graph.parse(page, html)
+    if popularity is None:
+        popularity = link_popularity(graph)
+
+    hints = page_hints(graph, page, popularity)
+    anchor = INSERT_BEFORE.search(html)
+    if not hints or not anchor:
+        return html, []
+    block = HINTS_START + ''.join(hints) + HINTS_END
+    return html[:anchor.start()] + block + html[anchor.start():], hints
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Inject preload/prefetch/preconnect hints')
+    parser.add_argument('pages', nargs='*', help='Pages to process (default: all)')
+    args = parser.parse_args()
+
+    graph = PageGraph(PROJECT_ROOT)
+    popularity = link_popularity(graph)
+    updated = 0
+
+    print("🔮 Resource hints")
+    for page in args.pages or graph.pages():
+        path = PROJECT_ROOT / page
+        if not path.exists():
+            print(f"  ❌ {page}: not found")
+            continue
+        original = path.read_text(encoding='utf-8')
+        html, hints = inject_resource_hints(original, page, graph, popularity)
+        if html != original:
+            path.write_text(html, encoding='utf-8')
+            updated += 1
+        if not hints:
+            print(f"  ⏭️  {page}: no hints")
+            continue
+        kinds = Counter(re.search(r'rel="(\w+)"', hint).group(1) for hint in hints)
+        print(f"  • {page}: " + ', '.join(f"{n} {rel}" for rel, n in kinds.items()))
+
+    print("\n" + "="*60)
+    print(f"✅ {updated} page(s) updated")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,106 @@
+// Generated by tools/build_service_worker.py - do not edit sw.js by hand
+const VERSION = '{{ version }}';
+
+// [url, content hash] of every precached build output
+const PRECACHE = {{ precache }};
+const DATA = new RegExp({{ data_pattern }});
+const HASHED = new RegExp({{ hashed_pattern }});
+const HASHED_MAX_ENTRIES = {{ hashed_max_entries }};
+
+const PRECACHE_CACHE = 'precache';
+const DATA_CACHE = 'data';
+const HASHED_CACHE = 'hashed-assets';
+
+// Each entry is stored under its URL plus a revision parameter, so a new build
+// only downloads entries whose content hash changed
+const precacheKeys = new Map(PRECACHE.map(([url, revision]) => {
+  const absolute = new URL(url, self.registration.scope).href;
+  return [absolute, `${absolute}?__rev=${revision}`];
+}));
+const scopeIndex = new URL('index.html', self.registration.scope).href;
+precacheKeys.set(self.registration.scope, precacheKeys.get(scopeIndex));
+
+self.addEventListener('install', event => {
+  event.waitUntil(caches.open(PRECACHE_CACHE).then(async cache => {
+    const cached = new Set((await cache.keys()).map(request => request.url));
+    const missing = [...new Set(precacheKeys.values())].filter(key => key && !cached.has(key));
+    await Promise.all(missing.map(async key => {
+      const response = await fetch(key.split('?__rev=')[0], {cache: 'reload'});
+      if (!response.ok) throw new Error(`precache failed: ${key}`);
+      await cache.put(key, response);
+    }));
+    await self.skipWaiting();
+  }));
+});
+
+self.addEventListener('activate', event => {
+  event.waitUntil((async () => {
+    const current = new Set(precacheKeys.values());
+    const cache = await caches.open(PRECACHE_CACHE);
+    for (const request of await cache.keys()) {
+      if (!current.has(request.url)) await cache.delete(request);
+    }
+    const known = [PRECACHE_CACHE, DATA_CACHE, HASHED_CACHE];
+    for (const name of await caches.keys()) {
+      if (!known.includes(name)) await caches.delete(name);
+    }
+    await self.clients.claim();
+  })());
+});
+
+async function precached(request) {
+  const url = new URL(request.url);
+  url.search = '';
+  url.hash = '';
+  const key = precacheKeys.get(url.href);
+  if (!key) return null;
+  const cache = await caches.open(PRECACHE_CACHE);
+  return (await cache.match(key)) || fetch(request);
+}
+
+async function staleWhileRevalidate(event) {
+  const cache = await caches.open(DATA_CACHE);
+  const cached = await cache.match(event.request);
+  const network = fetch(event.request).then(response => {
+    if (response.ok) return cache.put(event.request, response.clone()).then(() => response);
+    return response;
+  });
+  if (cached) {
+    event.waitUntil(network.catch(() => null));
+    return cached;
+  }
+  return network;
+}
+
+async function cacheFirst(request) {
+  const cache = await caches.open(HASHED_CACHE);
+  const cached = await cache.match(request);
+  if (cached) return cached;
+  const response = await fetch(request);
+  if (response.ok) {
+    await cache.put(request, response.clone());
+    const keys = await cache.keys();
+    // Content-hashed names never change, so old variants are only evicted by count
+    for (const stale of keys.slice(0, Math.max(0, keys.length - HASHED_MAX_ENTRIES))) {
+      await cache.delete(stale);
+    }
+  }
+  return response;
+}
+
+self.addEventListener('fetch', event => {
+  const request = event.request;
+  const url = new URL(request.url);
+  if (request.method !== 'GET' || url.origin !== self.location.origin) return;
+  const path = url.pathname;
+
+  if (DATA.test(path)) {
+    // loadData()'s version-keyed requests (?v=N) go to the network: the client stores the response as version N
+    if (url.searchParams.has('v')) return;
+    event.respondWith(staleWhileRevalidate(event));
+  } else if (HASHED.test(path)) {
+    event.respondWith(cacheFirst(request));
+  } else {
+    event.respondWith(precached(request).then(response => response || fetch(request)));
+  }
+});
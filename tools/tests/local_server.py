@@ -0,0 +1,88 @@
+"""
+A stand-in HTTP server on 127.0.0.1 for the network tests. Routes map a path
+to a Response; the server records every request and how many were in flight
+at once per path prefix, so tests can check fetch behaviour without the
+internet.
+"""
+
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+# The tools are flat scripts that import each other by name
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+@dataclass
+class Response:
+    status: int = 200
+    body: bytes = b''
+    content_type: str = 'text/html'
+    headers: dict = field(default_factory=dict)
+    delay: float = 0.0
+    # Methods answered with 405 (e.g. servers that reject HEAD)
+    reject: tuple = ()
+
+
+class LocalServer:
+    """Context manager serving `routes` ({path: Response}) on an ephemeral port"""
+
+    def __init__(self, routes):
+        self.routes = routes
+        self.requests = []
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def url(self, path):
+        return f'http://127.0.0.1:{self.server.server_address[1]}{path}'
+
+    def __enter__(self):
+        owner = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def respond(self, send_body):
+                with owner.lock:
+                    owner.requests.append((self.command, self.path))
+                    owner.active += 1
+                    owner.max_active = max(owner.max_active, owner.active)
+                try:
+                    response = owner.routes.get(self.path.split('?', 1)[0], Response(404, b'not found'))
+                    if response.delay:
+                        time.sleep(response.delay)
+                    status = 405 if self.command in response.reject else response.status
+                    self.send_response(status)
+                    self.send_header('Content-Type', response.content_type)
+                    self.send_header('Content-Length', str(len(response.body)))
+                    for name, value in response.headers.items():
+                        self.send_header(name, value)
+                    self.end_headers()
+                    if send_body:
+                        self.wfile.write(response.body)
+                except (BrokenPipeError, ConnectionResetError):
+                    pass
+                finally:
+                    with owner.lock:
+                        owner.active -= 1
+
+            def do_GET(self):
+                self.respond(True)
+
+            def do_HEAD(self):
+                self.respond(False)
+
+        self.server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.server.daemon_threads = True
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
@@ -0,0 +1,38 @@
+"""Coordinate rounding in the SVG sprite builder (build_svg_sprite.py)"""
+
+import re
+import unittest
+
+import local_server  # noqa: F401  (puts tools/ on sys.path)
+
+from build_svg_sprite import round_numbers
+
+NUMBER = re.compile(r'-?(?:\d+(?:\.\d*)?|\.\d+)')
+
+
+def numbers(value):
+    return [float(n) for n in NUMBER.findall(value)]
+
+
+class RoundNumbersTest(unittest.TestCase):
+    def test_shortens_leading_zeros(self):
+        self.assertEqual(round_numbers('M0.5 -0.25', 2), 'M.5 -.25')
+        self.assertEqual(round_numbers('M-0.001 1', 2), 'M0 1')
+
+    def test_integer_result_keeps_next_implicit_decimal_apart(self):
+        cases = {
+            'M10.004.5': [10, .5],
+            'M1.999.5L0.9999.25': [2, .5, 1, .25],
+            'M-0.001.5': [0, .5],
+            'M0.001.5.75': [0, .5, .75],
+        }
+        for value, expected in cases.items():
+            with self.subTest(value=value):
+                self.assertEqual(numbers(round_numbers(value, 2)), expected)
+
+    def test_decimal_result_needs_no_separator(self):
+        self.assertEqual(round_numbers('M1.504.5', 2), 'M1.5.5')
+
+
+if __name__ == '__main__':
+    unittest.main()
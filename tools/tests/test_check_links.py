@@ -0,0 +1,68 @@
+"""Link checking in check_links.py against local stand-in servers"""
+
+import asyncio
+import unittest
+
+from local_server import LocalServer, Response
+
+from check_links import check_urls
+
+
+def check(urls, **limits):
+    return asyncio.run(check_urls(urls, timeout=5, **limits))
+
+
+class ConcurrencyTest(unittest.TestCase):
+    def test_requests_per_host_are_capped(self):
+        routes = {f'/page/{n}': Response(delay=0.2) for n in range(6)}
+        with LocalServer(routes) as first, LocalServer(routes) as second:
+            urls = [server.url(path) for server in (first, second) for path in routes]
+            results = check(urls, per_host=2, total=16)
+            self.assertTrue(all(result['ok'] for result in results.values()))
+            self.assertEqual((first.max_active, second.max_active), (2, 2))
+
+    def test_busy_host_does_not_hold_up_other_hosts(self):
+        slow_routes = {f'/slow/{n}': Response(delay=0.3) for n in range(4)}
+        with LocalServer(slow_routes) as slow, LocalServer({'/fast': Response()}) as fast:
+            slow_urls = [slow.url(path) for path in slow_routes]
+            results = check(slow_urls + [fast.url('/fast')], per_host=1, total=2)
+        # The fast host gets the free global slot instead of queueing behind the slow host's URLs
+        first_slow = min(results[url]['checked_at'] for url in slow_urls)
+        self.assertLess(results[fast.url('/fast')]['checked_at'], first_slow)
+
+
+class FallbackTest(unittest.TestCase):
+    def test_head_is_enough_when_accepted(self):
+        with LocalServer({'/ok': Response()}) as server:
+            result = check([server.url('/ok')])[server.url('/ok')]
+            self.assertEqual((result['ok'], result['method']), (True, 'HEAD'))
+            self.assertEqual(server.requests, [('HEAD', '/ok')])
+
+    def test_rejected_head_falls_back_to_get(self):
+        with LocalServer({'/no-head': Response(reject=('HEAD',))}) as server:
+            result = check([server.url('/no-head')])[server.url('/no-head')]
+            self.assertEqual((result['ok'], result['status'], result['method']), (True, 200, 'GET'))
+            self.assertEqual(server.requests, [('HEAD', '/no-head'), ('GET', '/no-head')])
+
+    def test_redirects_are_followed(self):
+        routes = {'/old': Response(301, headers={'Location': '/new'}),
+                  '/new': Response(),
+                  '/moved-away': Response(302, headers={'Location': '/gone'})}
+        with LocalServer(routes) as server:
+            results = check([server.url('/old'), server.url('/moved-away')])
+        self.assertEqual((results[server.url('/old')]['ok'], results[server.url('/old')]['status']), (True, 200))
+        # A redirect to a missing page is broken, after GET confirms the 404
+        gone = results[server.url('/moved-away')]
+        self.assertEqual((gone['ok'], gone['status'], gone['method']), (False, 404, 'GET'))
+
+    def test_unreachable_host_reports_the_error(self):
+        with LocalServer({}) as server:
+            url = server.url('/')
+        result = check([url])[url]
+        self.assertFalse(result['ok'])
+        self.assertIsNone(result['status'])
+        self.assertTrue(result['error'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,243 @@
+"""Cover mirroring (against a local stand-in server) and the post archive in fetch_medium.py"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from datetime import timedelta
+
+from local_server import LocalServer, Response
+
+import fetch_medium
+from plan import STAGES, inputs_hash, utc_now
+from fetch_medium import (conditional_entry, download, load_index, lookup_log, merge_into_archive,
+                          mirror_covers, page_path, store_cover)
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def png_bytes(width, height, color=(200, 40, 40)):
+    buffer = io.BytesIO()
+    Image.new('RGB', (width, height), color).save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@unittest.skipIf(Image is None, 'Pillow is not installed')
+class MirrorCoversTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.site_root = self.tmp.name
+        self.images_dir = os.path.join(self.site_root, 'assets', 'medium', 'images')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def mirror(self, server, paths):
+        return mirror_covers([server.url(path) for path in paths], self.images_dir, self.site_root, workers=4)
+
+    def test_identical_images_are_stored_once(self):
+        image = png_bytes(800, 400)
+        routes = {'/a.png': Response(body=image, content_type='image/png'),
+                  '/b.png': Response(body=image, content_type='image/png')}
+        with LocalServer(routes) as server:
+            covers = self.mirror(server, ['/a.png', '/b.png'])
+            self.assertEqual(covers[server.url('/a.png')], covers[server.url('/b.png')])
+
+        with open(os.path.join(self.images_dir, 'index.json'), encoding='utf-8') as f:
+            index = json.load(f)
+        self.assertEqual(len(index['images']), 1)
+        self.assertEqual(len(index['urls']), 2)
+        webp = [name for name in os.listdir(self.images_dir) if name.endswith('.webp')]
+        self.assertEqual(len(webp), len(fetch_medium.COVER_WIDTHS))
+
+    def test_known_urls_are_not_downloaded_again(self):
+        routes = {'/a.png': Response(body=png_bytes(400, 200), content_type='image/png')}
+        with LocalServer(routes) as server:
+            self.mirror(server, ['/a.png'])
+            self.mirror(server, ['/a.png'])
+            self.assertEqual(server.requests, [('GET', '/a.png')])
+
+    def test_covers_are_resized_to_webp_variants(self):
+        routes = {'/wide.png': Response(body=png_bytes(1000, 500), content_type='image/png')}
+        with LocalServer(routes) as server:
+            cover = self.mirror(server, ['/wide.png'])[server.url('/wide.png')]
+
+        widths = [int(part.rsplit(' ', 1)[1].rstrip('w')) for part in cover['srcset'].split(', ')]
+        self.assertEqual(widths, list(fetch_medium.COVER_WIDTHS))
+        self.assertEqual((cover['width'], cover['height']), (640, 320))
+        for part in cover['srcset'].split(', '):
+            path = os.path.join(self.site_root, part.rsplit(' ', 1)[0])
+            with Image.open(path) as img:
+                self.assertEqual(img.format, 'WEBP')
+
+    def test_small_covers_are_not_upscaled(self):
+        os.makedirs(self.images_dir)
+        cover = store_cover(png_bytes(100, 50), 'image/png', 'small', self.images_dir, self.site_root)
+        self.assertEqual((cover['width'], cover['height']), (100, 50))
+        self.assertEqual(cover['srcset'].count(','), 0)
+
+    def test_non_image_content_is_skipped(self):
+        routes = {'/page': Response(body=b'<html>not an image</html>', content_type='text/html')}
+        with LocalServer(routes) as server:
+            covers = self.mirror(server, ['/page'])
+        self.assertEqual(covers, {})
+        self.assertEqual([name for name in os.listdir(self.images_dir) if name != 'index.json'], [])
+
+    def test_missing_images_are_skipped_and_retried_later(self):
+        with LocalServer({}) as server:
+            self.assertEqual(self.mirror(server, ['/gone.png']), {})
+            self.mirror(server, ['/gone.png'])
+            # A failed URL isn't recorded, so the next run asks again
+            self.assertEqual(len(server.requests), 2)
+
+
+def feed_post(n, **fields):
+    return {'title': f'Post {n}', 'link': f'https://medium.com/@someone/post-{n}?source=rss',
+            'date': f'2025-01-{n:02d}T10:00:00', **fields}
+
+
+class ArchiveTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.archive_dir = self.tmp.name
+        self.log_path = os.path.join(self.archive_dir, 'posts.jsonl')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def log_lines(self):
+        with open(self.log_path, encoding='utf-8') as f:
+            return f.read().splitlines()
+
+    def page_titles(self, number):
+        with open(page_path(self.archive_dir, number), encoding='utf-8') as f:
+            return [post['title'] for post in json.load(f)['posts']]
+
+    def test_new_posts_fill_pages_oldest_first(self):
+        index, added, _ = merge_into_archive([feed_post(n) for n in (3, 1, 2)], self.archive_dir, 2)
+        self.assertEqual((index['total'], index['pages'], added), (3, 2, 3))
+        self.assertEqual(self.page_titles(1), ['Post 1', 'Post 2'])
+        self.assertEqual(self.page_titles(2), ['Post 3'])
+
+    def test_index_holds_only_counts(self):
+        merge_into_archive([feed_post(1)], self.archive_dir, 10)
+        with open(os.path.join(self.archive_dir, 'index.json'), encoding='utf-8') as f:
+            self.assertEqual(json.load(f), {'page_size': 10, 'total': 1, 'pages': 1,
+                                            'newest': '2025-01-01T10:00:00', 'records': 1})
+
+    def test_known_posts_write_nothing(self):
+        merge_into_archive([feed_post(1), feed_post(2)], self.archive_dir, 10)
+        before = self.log_lines()
+        _, added, updated = merge_into_archive([feed_post(1), feed_post(2)], self.archive_dir, 10)
+        self.assertEqual((added, updated), (0, 0))
+        self.assertEqual(self.log_lines(), before)
+
+    def test_new_posts_are_appended_to_the_log(self):
+        merge_into_archive([feed_post(1), feed_post(2)], self.archive_dir, 10)
+        merge_into_archive([feed_post(2), feed_post(3)], self.archive_dir, 10)
+        self.assertEqual([json.loads(line)['key'] for line in self.log_lines()],
+                         [f'https://medium.com/@someone/post-{n}' for n in (1, 2, 3)])
+
+    def test_edited_post_replaces_its_entry(self):
+        merge_into_archive([feed_post(n) for n in (1, 2, 3)], self.archive_dir, 2)
+        _, added, updated = merge_into_archive([feed_post(1, title='Post 1, edited')], self.archive_dir, 2)
+        self.assertEqual((added, updated), (0, 1))
+        self.assertEqual(self.page_titles(1), ['Post 1, edited', 'Post 2'])
+        self.assertEqual(len(self.log_lines()), 4)
+        # The later log line wins, so the edit isn't reported again
+        _, added, updated = merge_into_archive([feed_post(1, title='Post 1, edited')], self.archive_dir, 2)
+        self.assertEqual((added, updated), (0, 0))
+
+    def test_lookup_reads_the_log_backwards(self):
+        merge_into_archive([feed_post(n) for n in range(1, 21)], self.archive_dir, 5)
+        merge_into_archive([feed_post(3, title='Post 3, edited')], self.archive_dir, 5)
+        keys = [f'https://medium.com/@someone/post-{n}' for n in (3, 20, 99)]
+        # A block smaller than a line still reassembles every record
+        for block_size in (7, 64 * 1024):
+            found = lookup_log(self.log_path, keys, block_size)
+            self.assertEqual(set(found), set(keys[:2]))
+            self.assertEqual(found[keys[0]]['page'], 1)
+            self.assertEqual(found[keys[1]]['page'], 4)
+        with open(page_path(self.archive_dir, 1), encoding='utf-8') as f:
+            edited = json.load(f)['posts'][2]
+        self.assertEqual(found[keys[0]]['hash'], fetch_medium.content_hash(edited))
+
+    def test_log_is_compacted_once_superseded_records_pile_up(self):
+        merge_into_archive([feed_post(1), feed_post(2)], self.archive_dir, 10, compact_min=2)
+        for n in range(1, 4):
+            index, _, updated = merge_into_archive([feed_post(1, title=f'Post 1, edit {n}')],
+                                                   self.archive_dir, 10, compact_min=2)
+            self.assertEqual(updated, 1)
+        # Two live posts and three edits: three superseded records > max(2, 2)
+        self.assertEqual(index['records'], 2)
+        self.assertEqual(len(self.log_lines()), 2)
+        _, added, updated = merge_into_archive([feed_post(1, title='Post 1, edit 3'), feed_post(2)],
+                                               self.archive_dir, 10, compact_min=2)
+        self.assertEqual((added, updated), (0, 0))
+
+    def test_index_with_post_map_moves_into_the_log(self):
+        legacy = {'page_size': 10, 'total': 1, 'pages': 1,
+                  'posts': {'https://medium.com/@someone/post-1': {'hash': 'abc', 'page': 1}}}
+        with open(os.path.join(self.archive_dir, 'index.json'), 'w', encoding='utf-8') as f:
+            json.dump(legacy, f)
+        with open(page_path(self.archive_dir, 1), 'w', encoding='utf-8') as f:
+            json.dump({'page': 1, 'page_size': 10, 'posts': [feed_post(1)]}, f)
+        index = load_index(self.archive_dir, 10)
+        self.assertEqual(index, {'page_size': 10, 'total': 1, 'pages': 1,
+                                 'newest': '2025-01-01T10:00:00', 'records': 1})
+        self.assertEqual(lookup_log(self.log_path, ['https://medium.com/@someone/post-1']),
+                         {'https://medium.com/@someone/post-1': {'hash': 'abc', 'page': 1}})
+        self.assertEqual(load_index(self.archive_dir, 10), index)
+        self.assertEqual(len(self.log_lines()), 1)
+
+
+class ConditionalFetchTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.output = os.path.join(self.tmp.name, 'medium_posts.json')
+        with open(self.output, 'w', encoding='utf-8') as f:
+            f.write('{}')
+        self.entry = {'ran_at': utc_now().isoformat(), 'inputs': inputs_hash(STAGES['medium']['inputs']),
+                      'etag': '"abc"'}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_unchanged_recent_run_sends_validators(self):
+        self.assertEqual(conditional_entry(self.entry, self.output), self.entry)
+
+    def test_changed_inputs_fetch_in_full(self):
+        self.assertIsNone(conditional_entry(dict(self.entry, inputs='0' * 16), self.output))
+
+    def test_expired_run_fetches_in_full(self):
+        ran_at = utc_now() - timedelta(hours=STAGES['medium']['ttl_hours'] + 1)
+        self.assertIsNone(conditional_entry(dict(self.entry, ran_at=ran_at.isoformat()), self.output))
+
+    def test_forced_or_missing_output_fetches_in_full(self):
+        self.assertIsNone(conditional_entry(self.entry, self.output, force=True))
+        self.assertIsNone(conditional_entry(self.entry, os.path.join(self.tmp.name, 'missing.json')))
+        self.assertIsNone(conditional_entry(None, self.output))
+
+
+class DownloadTest(unittest.TestCase):
+    def test_returns_body_and_content_type(self):
+        routes = {'/img': Response(body=b'data', content_type='image/jpeg')}
+        with LocalServer(routes) as server:
+            self.assertEqual(download(server.url('/img')), (b'data', 'image/jpeg'))
+
+    def test_not_found_returns_none(self):
+        with LocalServer({}) as server:
+            self.assertIsNone(download(server.url('/missing.png')))
+
+    def test_timeout_returns_none(self):
+        routes = {'/slow': Response(body=b'late', content_type='image/png', delay=1.0)}
+        with LocalServer(routes) as server:
+            self.assertIsNone(download(server.url('/slow'), timeout=0.2))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+"""Card batches in the progressive experience page (generate_experience.py)"""
+
+import copy
+import re
+import tempfile
+import unittest
+from pathlib import Path
+
+import local_server  # noqa: F401  (puts tools/ on sys.path)
+
+from generate_experience import generate_progressive_content, load_experience_config
+
+PLACEHOLDER = re.compile(r'data-fragment="([^"]+)"')
+CARD = re.compile(r'<!-- (Company \d+) -->')
+
+
+class CardBatchTest(unittest.TestCase):
+    def render(self, roles, card_batch=5):
+        base = load_experience_config()
+        config = copy.deepcopy(base)
+        config['metadata'].update({'inline_cards': 2, 'card_batch': card_batch})
+        template = config['experiences'][-1]
+        config['experiences'] = [{**template, 'id': f'role{i}', 'company': f'Company {i}', 'order': i} for i in range(roles)]
+        with tempfile.TemporaryDirectory() as tmp:
+            shell = generate_progressive_content(config, tmp)
+            fragments = {f'assets/fragments/experience/{path.name}': path.read_text(encoding='utf-8')
+                         for path in (Path(tmp) / 'assets' / 'fragments' / 'experience').glob('cards-*.html')}
+        return shell, fragments
+
+    def test_shell_holds_one_card_placeholder(self):
+        for roles in (12, 120):
+            shell, _ = self.render(roles)
+            self.assertEqual(len([rel for rel in PLACEHOLDER.findall(shell) if '/cards-' in rel]), 1)
+
+    def test_batches_chain_through_every_deferred_card(self):
+        shell, fragments = self.render(13, card_batch=4)
+        inline = CARD.findall(shell)
+        rel = next(rel for rel in PLACEHOLDER.findall(shell) if '/cards-' in rel)
+        deferred, batches = [], 0
+        while rel:
+            html = fragments[rel]
+            cards = CARD.findall(html)
+            self.assertLessEqual(len(cards), 4)
+            deferred += cards
+            batches += 1
+            nested = PLACEHOLDER.findall(html)
+            rel = nested[0] if nested else None
+        self.assertEqual(batches, len(fragments))
+        self.assertEqual(inline + deferred, [f'Company {i}' for i in range(13)])
+
+
+if __name__ == '__main__':
+    unittest.main()
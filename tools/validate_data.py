@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Validate the YAML sources without generating anything: every certificate,
+badge and experience entry is parsed with its model, categories must be
+declared, and the PDFs and badge images entries point at should exist.
+Only yaml and models are imported, so this is quick enough to run before
+every commit.
+
+Usage:
+    python3 tools/validate_data.py                 # every source
+    python3 tools/validate_data.py certificates    # just one
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+import yaml
+
+from models import BadgeCertification, Certificate, Experience, parse_all
+
+PROJECT_ROOT = Path(__file__).parent.parent
+TOOLS_DIR = Path(__file__).parent
+
+
+def check_entries(cls, entries, categories, file_path, label):
+    """Parse categorized entries with their model; returns (errors, warnings)
+
+    file_path(record) gives the file the entry points at, relative to the project root.
+    """
+    errors, warnings = [], []
+    for index, data in enumerate(entries or [], 1):
+        record, record_errors = cls.parse(data or {})
+        errors.extend(f"{label} #{index}: {error}" for error in record_errors)
+        if not record:
+            continue
+        if record.category not in categories:
+            errors.append(f"{label} #{index}: Invalid category: {record.category}")
+        if not (PROJECT_ROOT / file_path(record)).exists():
+            warnings.append(f"{label} #{index}: File not found: {file_path(record)}")
+    return errors, warnings
+
+
+def validate_certificates(config):
+    return check_entries(Certificate, config.get('certificates'), config.get('categories') or {},
+                         lambda cert: f'assets/certificates/{cert.category}/{cert.filename}', 'Certificate')
+
+
+def validate_badges(config):
+    return check_entries(BadgeCertification, config.get('certifications'), config.get('categories') or {},
+                         lambda cert: f'assets/badges/{cert.badge_image}', 'Badge')
+
+
+def validate_experience(config):
+    _, errors = parse_all(Experience, config.get('experiences'), 'Experience')
+    return errors, []
+
+
+# Source -> (YAML file, validator)
+SOURCES = {
+    'certificates': ('certificates.yaml', validate_certificates),
+    'badges': ('badge_certifications.yaml', validate_badges),
+    'experience': ('experience.yaml', validate_experience),
+}
+
+
+def validate(name, tools_dir=TOOLS_DIR):
+    """(errors, warnings) for one source"""
+    filename, validator = SOURCES[name]
+    try:
+        with open(Path(tools_dir) / filename, 'r', encoding='utf-8') as f:
+            config = yaml.safe_load(f) or {}
+    except FileNotFoundError:
+        return [f"Config file not found: tools/{filename}"], []
+    except yaml.YAMLError as e:
+        return [f"Error parsing tools/{filename}: {e}"], []
+    return validator(config)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Validate the YAML data sources')
+    parser.add_argument('sources', nargs='*', help=f"Sources to check ({', '.join(SOURCES)}; default: all)")
+    parser.add_argument('--quiet', action='store_true', help='Only print errors and the summary')
+    args = parser.parse_args()
+
+    unknown = [name for name in args.sources if name not in SOURCES]
+    if unknown:
+        print(f"❌ Unknown source(s): {', '.join(unknown)}")
+        return 1
+
+    total_errors = total_warnings = 0
+    for name in args.sources or SOURCES:
+        errors, warnings = validate(name)
+        total_errors += len(errors)
+        total_warnings += len(warnings)
+        status = '❌' if errors else ('⚠️ ' if warnings else '✅')
+        print(f"{status} {SOURCES[name][0]}: {len(errors)} error(s), {len(warnings)} warning(s)")
+        for error in errors:
+            print(f"   - {error}")
+        if not args.quiet:
+            for warning in warnings:
+                print(f"   - {warning}")
+
+    print("\n" + "="*60)
+    if total_errors:
+        print(f"❌ {total_errors} error(s), {total_warnings} warning(s)")
+        return 1
+    print(f"✅ Valid ({total_warnings} warning(s))")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())